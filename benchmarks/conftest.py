@@ -0,0 +1,217 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import pytest
+
+from .generator import PexGenerator
+
+MB: int = 1024 * 1024
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    Result of a single benchmark.
+    """
+
+    name: str
+    """The name of the benchmark."""
+
+    size: int
+    """The size of the processed data in bytes."""
+
+    seconds: float
+    """The best time of all rounds in seconds."""
+
+    peak_memory: int
+    """The peak of memory allocated during a single round in bytes."""
+
+    @property
+    def seconds_per_mb(self) -> float:
+        """The best time per MB of processed data."""
+
+        return self.seconds / (self.size / MB)
+
+    @property
+    def peak_memory_per_mb(self) -> float:
+        """The peak memory in bytes per MB of processed data."""
+
+        return self.peak_memory / (self.size / MB)
+
+
+_results_key = pytest.StashKey[list[BenchmarkResult]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=5,
+        help="Number of timed rounds per benchmark, the best one is reported.",
+    )
+    group.addoption(
+        "--benchmark-scale",
+        type=int,
+        default=1,
+        help="Factor for the number of objects in the large synthetic file.",
+    )
+    group.addoption(
+        "--benchmark-save",
+        type=Path,
+        default=None,
+        help="Path to save the results to as JSON.",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        type=Path,
+        default=None,
+        help="Path to saved results to compare against. Regressions fail.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown or memory growth that counts as a regression.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_results_key] = []
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    results: list[BenchmarkResult] = config.stash.get(_results_key, [])
+    if not results:
+        return
+
+    terminalreporter.section("benchmark results")
+    terminalreporter.write_line(
+        f"{'name':<48} {'size (MB)':>10} {'ms':>10} {'ms/MB':>10} {'peak MB/MB':>11}"
+    )
+    for result in results:
+        terminalreporter.write_line(
+            f"{result.name:<48} {result.size / MB:>10.2f} "
+            f"{result.seconds * 1000:>10.2f} {result.seconds_per_mb * 1000:>10.2f} "
+            f"{result.peak_memory_per_mb / MB:>11.2f}"
+        )
+
+    save_path: Optional[Path] = config.getoption("--benchmark-save")
+    if save_path is not None:
+        save_path.write_text(
+            json.dumps(
+                {
+                    result.name: {
+                        "size": result.size,
+                        "seconds_per_mb": result.seconds_per_mb,
+                        "peak_memory_per_mb": result.peak_memory_per_mb,
+                    }
+                    for result in results
+                },
+                indent=4,
+            ),
+            encoding="utf8",
+        )
+
+
+@pytest.fixture(scope="session")
+def baseline(pytestconfig: pytest.Config) -> dict[str, dict[str, Any]]:
+    """
+    Saved results to compare against, if any.
+    """
+
+    compare_path: Optional[Path] = pytestconfig.getoption("--benchmark-compare")
+    if compare_path is None:
+        return {}
+
+    return json.loads(compare_path.read_text(encoding="utf8"))
+
+
+@pytest.fixture
+def benchmark(
+    request: pytest.FixtureRequest, baseline: dict[str, dict[str, Any]]
+) -> Callable[[Callable[[], Any], int], BenchmarkResult]:
+    """
+    Measures the best time of several rounds and the peak memory of a function,
+    relative to the size of the data it processes. Fails the benchmark if it regressed
+    compared to the baseline.
+    """
+
+    config: pytest.Config = request.config
+    rounds: int = config.getoption("--benchmark-rounds")
+    tolerance: float = config.getoption("--benchmark-tolerance")
+
+    def measure(func: Callable[[], Any], size: int) -> BenchmarkResult:
+        seconds: float = float("inf")
+        for _ in range(rounds):
+            gc.collect()
+            start: float = time.perf_counter()
+            func()
+            seconds = min(seconds, time.perf_counter() - start)
+
+        # Memory is traced in a separate round, as tracing slows down the allocations
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak_memory: int = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        result = BenchmarkResult(request.node.name, size, seconds, peak_memory)
+        config.stash[_results_key].append(result)
+
+        expected: Optional[dict[str, Any]] = baseline.get(result.name)
+        if expected is not None:
+            if result.seconds_per_mb > expected["seconds_per_mb"] * (1 + tolerance):
+                pytest.fail(
+                    f"{result.name} regressed: {result.seconds_per_mb * 1000:.2f} "
+                    f"ms/MB > {expected['seconds_per_mb'] * 1000:.2f} ms/MB"
+                )
+
+            if result.peak_memory_per_mb > expected["peak_memory_per_mb"] * (
+                1 + tolerance
+            ):
+                pytest.fail(
+                    f"{result.name} regressed: {result.peak_memory_per_mb / MB:.2f} "
+                    f"MB/MB > {expected['peak_memory_per_mb'] / MB:.2f} MB/MB peak"
+                )
+
+        return result
+
+    return measure
+
+
+@pytest.fixture(scope="session", params=["real", "synthetic"])
+def pex_data(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> bytes:
+    """
+    Data of a real PEX file from the test data and of a large synthetic PEX file.
+    """
+
+    if request.param == "real":
+        return (
+            Path(__file__).parents[1] / "tests" / "test_data" / "_wetquestscript.pex"
+        ).read_bytes()
+
+    path: Path = tmp_path_factory.mktemp("benchmarks") / "synthetic.pex"
+    PexGenerator(
+        strings=4000,
+        objects=4 * request.config.getoption("--benchmark-scale"),
+        states=4,
+        functions=40,
+        instructions=60,
+    ).write(path)
+
+    return path.read_bytes()
@@ -0,0 +1,267 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import random
+from array import array
+from pathlib import Path
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import (
+    DebugFunction,
+    DebugInfo,
+    Function,
+    Header,
+    Instruction,
+    NamedFunction,
+    Object,
+    ObjectData,
+    Property,
+    State,
+    Variable,
+    VariableData,
+    VariableType,
+)
+from sse_pex_interface.string_table import StringTable
+
+
+class PexGenerator:
+    """
+    Generator for valid synthetic PEX files of configurable size, to benchmark the
+    scaling behavior of parsing and dumping. The generated content is deterministic
+    for the same arguments.
+
+    Example:
+        >>> PexGenerator(objects=4, functions=100).write(Path("synthetic.pex"))
+    """
+
+    strings: int
+    """The number of strings in the string table."""
+
+    objects: int
+    """The number of objects."""
+
+    states: int
+    """The number of states per object."""
+
+    functions: int
+    """The number of functions per state."""
+
+    instructions: int
+    """The number of instructions per function."""
+
+    debug_info: bool
+    """Whether debug info with a line number per instruction is generated."""
+
+    def __init__(
+        self,
+        *,
+        strings: int = 1000,
+        objects: int = 1,
+        states: int = 2,
+        functions: int = 20,
+        instructions: int = 50,
+        debug_info: bool = True,
+        seed: int = 0,
+    ) -> None:
+        """
+        Args:
+            strings (int, optional): Number of strings. Defaults to 1000.
+            objects (int, optional): Number of objects. Defaults to 1.
+            states (int, optional): Number of states per object. Defaults to 2.
+            functions (int, optional): Number of functions per state. Defaults to 20.
+            instructions (int, optional):
+                Number of instructions per function. Defaults to 50.
+            debug_info (bool, optional):
+                Whether to generate debug info. Defaults to True.
+            seed (int, optional): Seed of the random content. Defaults to 0.
+        """
+
+        if not 16 <= strings <= 0xFFFF:
+            raise ValueError("'strings' must be between 16 and 65535!")
+
+        self.strings = strings
+        self.objects = objects
+        self.states = states
+        self.functions = functions
+        self.instructions = instructions
+        self.debug_info = debug_info
+
+        self.__random = random.Random(seed)
+
+    def generate(self) -> PexFile:
+        """
+        Generates a PEX file.
+
+        Returns:
+            PexFile: The generated PEX file.
+        """
+
+        debug_functions: list[DebugFunction] = []
+        objects: list[Object] = []
+        for _ in range(self.objects):
+            object_name: int = self.__string()
+            states: list[State] = []
+
+            for _ in range(self.states):
+                state_name: int = self.__string()
+                named_functions: list[NamedFunction] = []
+
+                for _ in range(self.functions):
+                    function_name: int = self.__string()
+                    named_functions.append(
+                        NamedFunction(
+                            function_name=function_name,
+                            function=self.__function(),
+                        )
+                    )
+                    debug_functions.append(
+                        DebugFunction(
+                            object_name_index=object_name,
+                            state_name_index=state_name,
+                            function_name_index=function_name,
+                            function_type=0,
+                            line_numbers=array("H", range(1, self.instructions + 1)),
+                        )
+                    )
+
+                states.append(State(name=state_name, functions=named_functions))
+
+            objects.append(
+                Object(
+                    name_index=object_name,
+                    size=0,  # Computed when the object is dumped
+                    data=ObjectData(
+                        parent_class_name=self.__string(),
+                        docstring=0,
+                        user_flags=0,
+                        auto_state_name=states[0].name if states else 0,
+                        variables=[
+                            Variable(
+                                name=self.__string(),
+                                type_name=self.__string(),
+                                user_flags=0,
+                                data=self.__argument(),
+                            )
+                            for _ in range(4)
+                        ],
+                        properties=[
+                            Property(
+                                name=self.__string(),
+                                type=self.__string(),
+                                docstring=0,
+                                user_flags=0,
+                                flags=0b111,
+                                auto_var_name=self.__string(),
+                                read_handler=None,
+                                write_handler=None,
+                            )
+                            for _ in range(4)
+                        ],
+                        states=states,
+                    ),
+                )
+            )
+
+        return PexFile(
+            header=Header(
+                magic=0xFA57C0DE,
+                major_version=3,
+                minor_version=2,
+                game_id=1,
+                compilation_time=1_700_000_000,
+                source_file_name="synthetic.psc",
+                username="benchmark",
+                machinename="benchmark",
+            ),
+            string_table=StringTable(f"string_{i:05}" for i in range(self.strings)),
+            debug_info=DebugInfo(
+                has_debug_info=1,
+                modification_time=1_700_000_000,
+                functions=debug_functions,
+            )
+            if self.debug_info
+            else DebugInfo(has_debug_info=0, modification_time=None, functions=None),
+            user_flags=[],
+            objects=objects,
+        )
+
+    def write(self, path: Path) -> int:
+        """
+        Generates a PEX file and writes it with `dump()`.
+
+        Args:
+            path (Path): Path to write to.
+
+        Returns:
+            int: The size of the written file in bytes.
+        """
+
+        with path.open("wb") as output:
+            self.generate().dump(output)
+
+        return path.stat().st_size
+
+    def __string(self) -> int:
+        return self.__random.randrange(self.strings)
+
+    def __argument(self, integer_unsigned: bool = False) -> VariableData:
+        type = VariableData.Type(self.__random.randrange(6))
+        data: int | float | None
+        match type:
+            case VariableData.Type.NULL:
+                data = None
+            case VariableData.Type.IDENTIFIER | VariableData.Type.STRING:
+                data = self.__string()
+            case VariableData.Type.INTEGER:
+                data = self.__random.randrange(0 if integer_unsigned else -1000, 1000)
+            case VariableData.Type.FLOAT:
+                # Exactly representable as float32, so that round trips are lossless
+                data = self.__random.randrange(-1000, 1000) / 4
+            case VariableData.Type.BOOL:
+                data = self.__random.randrange(2)
+
+        return VariableData(type=type, data=data, integer_unsigned=integer_unsigned)
+
+    def __function(self) -> Function:
+        instructions: list[Instruction] = []
+        for _ in range(self.instructions):
+            op = Instruction.OpCode(self.__random.randrange(len(Instruction.OpCode)))
+            signature = Instruction.OPCODE_TABLE[op]
+            assert signature is not None
+
+            arguments: list[VariableData] = [
+                self.__argument(signature.integer_unsigned)
+                for _ in range(signature.fixed_arg_count)
+            ]
+            if signature.has_varargs:
+                vararg_count: int = self.__random.randrange(4)
+                arguments.append(
+                    VariableData(
+                        type=VariableData.Type.INTEGER,
+                        data=vararg_count,
+                        integer_unsigned=False,
+                    )
+                )
+                arguments.extend(
+                    self.__argument(signature.integer_unsigned)
+                    for _ in range(vararg_count)
+                )
+
+            instructions.append(Instruction(op=op, arguments=arguments))
+
+        return Function(
+            return_type=self.__string(),
+            docstring=0,
+            user_flags=0,
+            flags=0,
+            params=[
+                VariableType(name=self.__string(), type=self.__string())
+                for _ in range(2)
+            ],
+            locals=[
+                VariableType(name=self.__string(), type=self.__string())
+                for _ in range(3)
+            ],
+            instructions=instructions,
+        )
@@ -0,0 +1,106 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.pex_reader import PexReader
+from sse_pex_interface.pex_visitor import PexVisitor
+from sse_pex_interface.sections import Function
+
+from .conftest import BenchmarkResult
+from .generator import PexGenerator
+
+type Benchmark = Callable[[Callable[[], Any], int], BenchmarkResult]
+
+
+class TestGenerator:
+    """
+    Tests that the generator creates valid PEX files.
+    """
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """
+        Tests that a generated file is parsed to the same model and dumped unchanged.
+        """
+
+        # given
+        path: Path = tmp_path / "synthetic.pex"
+        expected: PexFile = PexGenerator(
+            strings=64, objects=2, functions=4, instructions=20
+        ).generate()
+
+        # when
+        PexGenerator(strings=64, objects=2, functions=4, instructions=20).write(path)
+        pex_file: PexFile = PexFile.from_path(path)
+
+        # then
+        assert pex_file.to_bytes() == path.read_bytes()
+        assert pex_file.string_table == expected.string_table
+        assert pex_file.debug_info == expected.debug_info
+        assert [object.data for object in pex_file.objects] == [
+            object.data for object in expected.objects
+        ]
+        assert len(pex_file.objects[0].data.states[0].functions) == 4
+
+
+class TestParse:
+    """
+    Benchmarks parsing in the different modes.
+    """
+
+    def test_parse(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(lambda: PexFile.from_buffer(pex_data), len(pex_data))
+
+    def test_parse_trusted(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(lambda: PexFile.from_buffer(pex_data, validate=False), len(pex_data))
+
+    def test_parse_compact(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(
+            lambda: PexFile.from_buffer(pex_data, validate=False, compact=True),
+            len(pex_data),
+        )
+
+    def test_parse_lazy(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(
+            lambda: PexFile.from_buffer(pex_data, validate=False, lazy=True),
+            len(pex_data),
+        )
+
+    def test_lazy_access(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        def access() -> None:
+            pex_file: PexFile = PexFile.from_buffer(pex_data, lazy=True)
+            function: Function = (
+                pex_file.objects[-1].data.states[-1].functions[-1].function
+            )
+            len(function.instructions)
+
+        benchmark(access, len(pex_data))
+
+    def test_index(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(lambda: PexFile.index_buffer(pex_data), len(pex_data))
+
+    def test_stream(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(lambda: PexReader(PexVisitor()).read_buffer(pex_data), len(pex_data))
+
+
+class TestDump:
+    """
+    Benchmarks dumping and round trips.
+    """
+
+    def test_dump(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        pex_file: PexFile = PexFile.from_buffer(pex_data)
+
+        benchmark(pex_file.to_bytes, len(pex_data))
+
+    def test_round_trip(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(lambda: PexFile.from_buffer(pex_data).to_bytes(), len(pex_data))
+
+    def test_round_trip_lazy(self, benchmark: Benchmark, pex_data: bytes) -> None:
+        benchmark(
+            lambda: PexFile.from_buffer(pex_data, lazy=True).to_bytes(), len(pex_data)
+        )
@@ -0,0 +1,258 @@
+"""
+Copyright (c) Cutleast
+
+Hot decode and encode loops that only operate on buffers, integers and lists.
+
+This module is written in the subset of Python that mypyc compiles. If it is compiled
+in place (see the README), the extension module takes precedence over this file when
+it is imported, otherwise the functions below are run by the interpreter. Both produce
+identical results.
+"""
+
+from collections.abc import Sequence
+from typing import Final
+
+COMPILED: Final[bool] = not __file__.endswith(".py")
+"""Whether this module was loaded from a compiled extension module."""
+
+VALUE_SIZES: Final[tuple[int, ...]] = (0, 2, 2, 4, 4, 1)
+"""Size of the data of each `VariableData.Type` in bytes."""
+
+INTEGER_TYPE: Final[int] = 3
+"""Value of `VariableData.Type.INTEGER`."""
+
+
+def read_wstrings(
+    buffer: memoryview, offset: int, count: int, encoding: str
+) -> tuple[list[str], int]:
+    """
+    Decodes a run of strings prefixed by their size as uint16.
+
+    Args:
+        buffer (memoryview): Buffer to read from.
+        offset (int): Offset of the first string.
+        count (int): Number of strings.
+        encoding (str): Encoding of the strings.
+
+    Raises:
+        EOFError: If the buffer ends before the last string.
+
+    Returns:
+        tuple[list[str], int]: The strings and the offset behind the last string.
+    """
+
+    buffer_size: int = len(buffer)
+    strings: list[str] = []
+
+    for _ in range(count):
+        if offset + 2 > buffer_size:
+            raise EOFError(f"Expected 2 bytes at offset {offset}!")
+
+        size: int = (buffer[offset] << 8) | buffer[offset + 1]
+        offset += 2
+        end: int = offset + size
+        if end > buffer_size:
+            raise EOFError(f"Expected {size} bytes at offset {offset}!")
+
+        strings.append(str(buffer[offset:end], encoding))
+        offset = end
+
+    return strings, offset
+
+
+def _read_value(buffer: memoryview, offset: int, size: int) -> int:
+    if size == 2:
+        return (buffer[offset] << 8) | buffer[offset + 1]
+    elif size == 4:
+        return (
+            (buffer[offset] << 24)
+            | (buffer[offset + 1] << 16)
+            | (buffer[offset + 2] << 8)
+            | buffer[offset + 3]
+        )
+    elif size == 1:
+        return buffer[offset]
+
+    return 0
+
+
+def _read_arguments(
+    buffer: memoryview,
+    offset: int,
+    count: int,
+    arg_types: list[int],
+    arg_values: list[int],
+) -> int:
+    for _ in range(count):
+        type: int = buffer[offset]
+        if type >= 6:
+            raise ValueError(f"{type} is not a valid VariableData.Type")
+
+        size: int = VALUE_SIZES[type]
+        arg_types.append(type)
+        arg_values.append(_read_value(buffer, offset + 1, size))
+        offset += 1 + size
+
+    return offset
+
+
+def decode_instructions(
+    buffer: memoryview,
+    offset: int,
+    count: int,
+    fixed_arg_counts: tuple[int, ...],
+    has_varargs: tuple[bool, ...],
+) -> tuple[list[int], list[int], list[int], list[int], int]:
+    """
+    Decodes a run of instructions into their opcodes and the types and raw bits of
+    their arguments.
+
+    Args:
+        buffer (memoryview): Buffer to read from.
+        offset (int): Offset of the first instruction.
+        count (int): Number of instructions.
+        fixed_arg_counts (tuple[int, ...]):
+            Number of fixed arguments for each opcode byte, -1 for invalid opcodes.
+        has_varargs (tuple[bool, ...]): Whether each opcode byte has varargs.
+
+    Raises:
+        ValueError: If an opcode or argument type is invalid.
+
+    Returns:
+        tuple[list[int], list[int], list[int], list[int], int]:
+            The opcodes, the index of the first argument of each instruction followed
+            by the total number of arguments, the argument types, the raw bits of the
+            argument data and the offset behind the last instruction.
+    """
+
+    ops: list[int] = []
+    arg_starts: list[int] = [0]
+    arg_types: list[int] = []
+    arg_values: list[int] = []
+
+    for _ in range(count):
+        op: int = buffer[offset]
+        fixed_arg_count: int = fixed_arg_counts[op]
+        if fixed_arg_count < 0:
+            raise ValueError(f"{op} is not a valid Instruction.OpCode")
+
+        ops.append(op)
+        offset = _read_arguments(
+            buffer, offset + 1, fixed_arg_count, arg_types, arg_values
+        )
+
+        if has_varargs[op]:
+            offset = _read_arguments(buffer, offset, 1, arg_types, arg_values)
+
+            vararg_count: int = arg_values[-1]
+            if arg_types[-1] == INTEGER_TYPE and vararg_count & 0x80000000:
+                vararg_count -= 0x100000000
+
+            offset = _read_arguments(
+                buffer, offset, vararg_count, arg_types, arg_values
+            )
+
+        arg_starts.append(len(arg_types))
+
+    return ops, arg_starts, arg_types, arg_values, offset
+
+
+def skip_instructions(
+    buffer: memoryview,
+    offset: int,
+    count: int,
+    fixed_arg_counts: tuple[int, ...],
+    has_varargs: tuple[bool, ...],
+) -> int:
+    """
+    Skips over a run of instructions without decoding their arguments.
+
+    Args:
+        buffer (memoryview): Buffer to read from.
+        offset (int): Offset of the first instruction.
+        count (int): Number of instructions.
+        fixed_arg_counts (tuple[int, ...]):
+            Number of fixed arguments for each opcode byte, -1 for invalid opcodes.
+        has_varargs (tuple[bool, ...]): Whether each opcode byte has varargs.
+
+    Raises:
+        ValueError: If an opcode or argument type is invalid.
+
+    Returns:
+        int: The offset behind the last instruction.
+    """
+
+    for _ in range(count):
+        op: int = buffer[offset]
+        arg_count: int = fixed_arg_counts[op]
+        if arg_count < 0:
+            raise ValueError(f"{op} is not a valid Instruction.OpCode")
+
+        offset += 1
+        for _ in range(arg_count):
+            type: int = buffer[offset]
+            if type >= 6:
+                raise ValueError(f"{type} is not a valid VariableData.Type")
+
+            offset += 1 + VALUE_SIZES[type]
+
+        if has_varargs[op]:
+            type = buffer[offset]
+            if type >= 6:
+                raise ValueError(f"{type} is not a valid VariableData.Type")
+
+            vararg_count: int = _read_value(buffer, offset + 1, VALUE_SIZES[type])
+            if type == INTEGER_TYPE and vararg_count & 0x80000000:
+                vararg_count -= 0x100000000
+            offset += 1 + VALUE_SIZES[type]
+
+            for _ in range(vararg_count):
+                type = buffer[offset]
+                if type >= 6:
+                    raise ValueError(f"{type} is not a valid VariableData.Type")
+
+                offset += 1 + VALUE_SIZES[type]
+
+    return offset
+
+
+def encode_instructions(
+    ops: Sequence[int],
+    arg_starts: Sequence[int],
+    arg_types: Sequence[int],
+    arg_values: Sequence[int],
+    output: bytearray,
+) -> None:
+    """
+    Encodes a run of instructions from their opcodes and the types and raw bits of
+    their arguments, see `decode_instructions()`.
+
+    Args:
+        ops (Sequence[int]): The opcodes.
+        arg_starts (Sequence[int]):
+            The index of the first argument of each instruction followed by the total
+            number of arguments.
+        arg_types (Sequence[int]): The argument types.
+        arg_values (Sequence[int]): The raw bits of the argument data.
+        output (bytearray): Buffer to append to.
+    """
+
+    for index in range(len(ops)):
+        output.append(ops[index])
+
+        for arg_index in range(arg_starts[index], arg_starts[index + 1]):
+            type: int = arg_types[arg_index]
+            value: int = arg_values[arg_index]
+            output.append(type)
+
+            size: int = VALUE_SIZES[type]
+            if size == 2:
+                output.append((value >> 8) & 0xFF)
+                output.append(value & 0xFF)
+            elif size == 4:
+                output.append((value >> 24) & 0xFF)
+                output.append((value >> 16) & 0xFF)
+                output.append((value >> 8) & 0xFF)
+                output.append(value & 0xFF)
+            elif size == 1:
+                output.append(value)
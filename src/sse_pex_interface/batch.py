@@ -0,0 +1,185 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from pathlib import Path
+from typing import Literal, NamedTuple, Optional
+
+from .binary_model import PARSE_ERRORS
+from .pex_file import PexFile
+
+
+class BatchResult(NamedTuple):
+    """
+    Result of parsing a single file of a batch.
+    """
+
+    path: Path
+    """The path of the parsed file."""
+
+    pex_file: Optional[PexFile]
+    """The parsed PEX file or None if parsing failed."""
+
+    error: Optional[Exception]
+    """The error that occured while parsing the file or None if parsing succeeded."""
+
+
+class MapResult[T](NamedTuple):
+    """
+    Result of processing a single file of a batch with `map_many()`.
+    """
+
+    path: Path
+    """The path of the processed file."""
+
+    value: Optional[T]
+    """The value returned for the file or None if parsing failed."""
+
+    error: Optional[Exception]
+    """The error that occured while parsing the file or None if parsing succeeded."""
+
+
+def parse_many(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    mode: Literal["process", "thread"] = "process",
+    validate: bool = True,
+    compact: Optional[bool] = None,
+) -> Generator[BatchResult]:
+    """
+    Parses many PEX files in parallel and yields the results in the order they finish.
+    Files that cannot be read or parsed are reported per file and do not abort the
+    batch.
+
+    Each worker parses a file completely and returns the finished model, so that
+    nothing is decoded again in the calling process. In process mode, the models are
+    transferred with `pickle`, so they are parsed compactly by default, which makes
+    them less than half as large and three times faster to unpickle. To only extract
+    some data from each file, use `map_many()` instead, which runs a function in the
+    workers and transfers only its results.
+
+    Args:
+        paths (Iterable[Path]): Paths to the PEX files.
+        workers (Optional[int], optional):
+            Maximum number of workers. Defaults to the executor's default.
+        mode (Literal["process", "thread"], optional):
+            Whether to use a process pool or a thread pool. Defaults to "process".
+        validate (bool, optional): Whether to validate the files. Defaults to True.
+        compact (Optional[bool], optional):
+            Whether to decode instructions compactly. Defaults to True in process mode
+            and to False in thread mode.
+
+    Yields:
+        BatchResult: The result of each file.
+    """
+
+    for result in map_many(paths, _get_pex_file, workers, mode, validate, compact):
+        yield BatchResult(result.path, result.value, result.error)
+
+
+def map_many[T](
+    paths: Iterable[Path],
+    function: Callable[[PexFile], T],
+    workers: Optional[int] = None,
+    mode: Literal["process", "thread"] = "process",
+    validate: bool = True,
+    compact: Optional[bool] = None,
+) -> Generator[MapResult[T]]:
+    """
+    Parses many PEX files in parallel, calls a function with each parsed file in the
+    worker and yields the return values in the order they finish. Files that cannot be
+    read or parsed are reported per file and do not abort the batch.
+
+    In process mode, the function and its return values must be picklable, for
+    example a function defined at module level. The files are parsed compactly by
+    default then, so that models returned by the function are transferred compactly
+    as well.
+
+    Example:
+        >>> for result in map_many(paths, count_functions, workers=8, compact=True):
+        ...     print(result.path, result.value)
+
+    Args:
+        paths (Iterable[Path]): Paths to the PEX files.
+        function (Callable[[PexFile], T]): Function to call with each parsed file.
+        workers (Optional[int], optional):
+            Maximum number of workers. Defaults to the executor's default.
+        mode (Literal["process", "thread"], optional):
+            Whether to use a process pool or a thread pool. Defaults to "process".
+        validate (bool, optional): Whether to validate the files. Defaults to True.
+        compact (Optional[bool], optional):
+            Whether to decode instructions compactly. Defaults to True in process mode
+            and to False in thread mode.
+
+    Raises:
+        Exception:
+            Errors raised by the function itself, with a note about the file's path.
+
+    Yields:
+        MapResult[T]: The result of each file.
+    """
+
+    if compact is None:
+        compact = mode == "process"
+
+    executor: Executor
+    if mode == "process":
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    try:
+        futures: dict[Future[MapResult[T]], Path] = {
+            executor.submit(_process, path, function, validate, compact): path
+            for path in paths
+        }
+
+        for future in as_completed(futures):
+            path: Path = futures.pop(future)
+
+            try:
+                result: MapResult[T] = future.result()
+            except Exception as ex:
+                ex.add_note(f"Failed to process {str(path)!r}.")
+                raise
+
+            yield result
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _process[T](
+    path: Path, function: Callable[[PexFile], T], validate: bool, compact: bool
+) -> MapResult[T]:
+    """
+    Parses a PEX file in a worker and calls a function with it.
+
+    Args:
+        path (Path): Path to the PEX file.
+        function (Callable[[PexFile], T]): Function to call with the parsed file.
+        validate (bool): Whether to validate the file.
+        compact (bool): Whether to decode instructions compactly.
+
+    Returns:
+        MapResult[T]: The return value of the function or the error of parsing.
+    """
+
+    try:
+        pex_file: PexFile = PexFile.from_path(path, validate=validate, compact=compact)
+    except PARSE_ERRORS as ex:
+        return MapResult(path, None, ex)
+
+    return MapResult(path, function(pex_file), None)
+
+
+def _get_pex_file(pex_file: PexFile) -> PexFile:
+    return pex_file
@@ -2,10 +2,47 @@
 Copyright (c) Cutleast
 """
 
+import struct
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Self
+from collections.abc import Buffer, Generator
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, Optional, Self, override
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)
+
+from .buffer_reader import BufferReader, StreamReader
+from .buffer_writer import BufferWriter
+
+PARSE_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    EOFError,
+    struct.error,
+    ValueError,
+)
+"""
+The exceptions that are raised when reading or parsing a malformed or truncated file
+(including `ValidationError`, which is a `ValueError`).
+"""
+
+
+class LazySpan(NamedTuple):
+    """
+    Raw bytes of a model that has not been decoded yet.
+    """
+
+    data: bytes
+    """The raw bytes of the model."""
+
+    validate: bool
+    """Whether the model is validated when it is decoded."""
+
+    compact: bool
+    """Whether instructions are decoded compactly when the model is decoded."""
 
 
 class BinaryModel(BaseModel, ABC):
@@ -17,27 +54,307 @@ class BinaryModel(BaseModel, ABC):
     model_config = ConfigDict(validate_assignment=True)
 
     @classmethod
-    @abstractmethod
-    def parse(cls, stream: BinaryIO) -> Self:
+    def parse(
+        cls,
+        stream: BinaryIO,
+        *,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> Self:
         """
         Parses the model from a stream of bytes.
 
+        Only the data of the model is consumed from the stream, which is read on
+        demand through a `StreamReader`. Seekable streams are read ahead in chunks and
+        moved back to the end of the parsed data afterwards.
+
         Args:
             stream (BinaryIO): Byte stream to read from.
+            validate (bool, optional):
+                Whether to validate the parsed models. Disable this for trusted input
+                to construct the models without validation; `revalidate()` can be
+                called later on if required. Defaults to True.
+            lazy (bool, optional):
+                Whether to keep object data, function bodies and debug info as raw
+                bytes that are only decoded on first access. Raw bytes that are never
+                accessed are dumped verbatim. Defaults to False.
+            compact (bool, optional):
+                Whether to decode the instructions of functions into a `CompactCode`
+                instead of a list of `Instruction` models, which needs much less
+                memory. Defaults to False.
 
         Returns:
             Self: The parsed model.
         """
 
+        reader = StreamReader(stream, validate=validate, lazy=lazy, compact=compact)
+        model: Self = cls.from_reader(reader)
+        reader.finish()
+
+        return model
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: Buffer,
+        *,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> Self:
+        """
+        Parses the model from a buffer, for example `bytes`, `memoryview` or `mmap`.
+
+        Args:
+            buffer (Buffer): Buffer to read from, starting at offset 0.
+            validate (bool, optional):
+                Whether to validate the parsed models. Defaults to True.
+            lazy (bool, optional):
+                Whether to decode supported sections lazily. Defaults to False.
+            compact (bool, optional):
+                Whether to decode instructions compactly. Defaults to False.
+
+        Returns:
+            Self: The parsed model.
+        """
+
+        return cls.from_reader(
+            BufferReader(buffer, validate=validate, lazy=lazy, compact=compact)
+        )
+
+    @classmethod
     @abstractmethod
+    def from_reader(cls, reader: BufferReader) -> Self:
+        """
+        Parses the model from a buffer reader, starting at its current offset.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+
+        Returns:
+            Self: The parsed model.
+        """
+
+    @classmethod
+    def from_reader_lazy(cls, reader: BufferReader) -> Self:
+        """
+        Parses the model like `from_reader()` or, if `reader.lazy` is set, skips over
+        its data and returns a model that is decoded on first access.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+
+        Returns:
+            Self: The parsed or not yet decoded model.
+        """
+
+        if not reader.lazy:
+            return cls.from_reader(reader)
+
+        start: int = reader.offset
+        cls.skip(reader)
+
+        return cls.from_raw_data(
+            reader.bytes_since(start), validate=reader.validate, compact=reader.compact
+        )
+
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        """
+        Advances the reader over the model's data. Subclasses that support lazy parsing
+        override this to skip without building any models.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+        """
+
+        cls.from_reader(reader)
+
     def dump(self, output: BinaryIO) -> None:
         """
-        Writes the model's data to a stream of bytes.
+        Writes the model's data to a stream of bytes with a single `write()` call.
 
         Args:
             output (BinaryIO): Byte stream to write to.
         """
 
+        output.write(self.to_bytes())
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the model's data into a single buffer with `to_writer()`.
+
+        Returns:
+            bytes: The model's data.
+        """
+
+        writer = BufferWriter()
+        self.to_writer(writer)
+
+        return writer.getvalue()
+
+    def byte_size(self) -> int:
+        """
+        Gets the size of the model's data in bytes. For a lazily parsed model that is
+        not decoded yet, this is the size of its raw bytes and needs no serialization.
+
+        Returns:
+            int: The size of the model's data in bytes.
+        """
+
+        raw_data: Optional[bytes] = self.get_raw_data()
+        if raw_data is not None:
+            return len(raw_data)
+
+        return len(self.to_bytes())
+
+    @abstractmethod
+    def to_writer(self, writer: BufferWriter) -> None:
+        """
+        Writes the model's data to a buffer writer.
+
+        Args:
+            writer (BufferWriter): Writer to write to.
+        """
+
+    @classmethod
+    def _build(cls, validate: bool, **data: Any) -> Self:
+        """
+        Creates the model from parsed data.
+
+        Args:
+            validate (bool):
+                Whether to validate the data. If `False`, the model is constructed
+                without running any validation.
+            **data (Any): Field values.
+
+        Returns:
+            Self: The created model.
+        """
+
+        if validate:
+            return cls(**data)
+
+        # Same as `model_construct()` but without its overhead for default values,
+        # as the parsers always pass all fields
+        model: Self = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", data)
+        object.__setattr__(model, "__pydantic_fields_set__", set(data))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+
+        return model
+
+    @classmethod
+    def from_raw_data(
+        cls, data: bytes, *, validate: bool = True, compact: bool = False
+    ) -> Self:
+        """
+        Creates a model that is decoded from the specified raw bytes on first access.
+        Until then, the raw bytes are dumped verbatim.
+
+        Args:
+            data (bytes): Raw bytes of the model.
+            validate (bool, optional):
+                Whether to validate the model when it is decoded. Defaults to True.
+            compact (bool, optional):
+                Whether to decode instructions compactly when the model is decoded.
+                Defaults to False.
+
+        Returns:
+            Self: The not yet decoded model.
+        """
+
+        model: Self = cls.__new__(cls)
+        # The raw bytes are stored as private data of the model, so that they are kept
+        # when the model is copied or pickled before it is decoded
+        object.__setattr__(model, "__dict__", {})
+        # The parsers always set all fields, so this is known before decoding
+        object.__setattr__(
+            model, "__pydantic_fields_set__", set(cls.__pydantic_fields__)
+        )
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(
+            model,
+            "__pydantic_private__",
+            {"_lazy_span": LazySpan(data, validate, compact)},
+        )
+
+        return model
+
+    def get_raw_data(self) -> Optional[bytes]:
+        """
+        Returns:
+            Optional[bytes]:
+                The raw bytes of the model if it was parsed lazily and is not decoded
+                yet, otherwise None.
+        """
+
+        if self.__pydantic_private__ is None:
+            return None
+
+        lazy_span: Optional[LazySpan] = self.__pydantic_private__.get("_lazy_span")
+
+        return lazy_span.data if lazy_span is not None else None
+
+    def _load_lazy_span(self) -> None:
+        """
+        Decodes the model's raw bytes if it was parsed lazily and is not decoded yet.
+        """
+
+        if self.__pydantic_private__ is None:
+            return
+
+        lazy_span: Optional[LazySpan] = self.__pydantic_private__.get("_lazy_span")
+        if lazy_span is None:
+            return
+
+        reader = BufferReader(
+            lazy_span.data,
+            validate=lazy_span.validate,
+            lazy=True,
+            compact=lazy_span.compact,
+        )
+        loaded: BinaryModel = type(self).from_reader(reader)
+
+        object.__setattr__(self, "__dict__", loaded.__dict__)
+        object.__setattr__(
+            self, "__pydantic_fields_set__", loaded.__pydantic_fields_set__
+        )
+        object.__setattr__(self, "__pydantic_private__", None)
+
+    def load(self) -> Self:
+        """
+        Decodes all lazily parsed data of the model and its sub-models.
+
+        Returns:
+            Self: The model itself.
+        """
+
+        self._load_lazy_span()
+
+        for value in self.__dict__.values():
+            if isinstance(value, BinaryModel):
+                value.load()
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, BinaryModel):
+                        item.load()
+
+        return self
+
+    def revalidate(self) -> None:
+        """
+        Validates the model and all of its sub-models, for example after parsing it
+        with `validate=False`.
+
+        Raises:
+            ValidationError: If the model's data is invalid.
+        """
+
+        type(self).model_validate(self.model_dump(round_trip=True))
+
     def validate_model(self) -> None:
         """
         Validates the model's data after deserialization from bytes.
@@ -48,6 +365,52 @@ class BinaryModel(BaseModel, ABC):
 
     @model_validator(mode="after")
     def _validate_model(self) -> Self:
-        self.validate_model()
+        # Lazily parsed models are validated once they are decoded
+        if self.__pydantic_private__ is None:
+            self.validate_model()
 
         return self
+
+    @model_serializer(mode="wrap")
+    def _serialize_model(self, handler: SerializerFunctionWrapHandler) -> Any:
+        self._load_lazy_span()
+
+        return handler(self)
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            if (
+                name in type(self).__pydantic_fields__
+                and self.get_raw_data() is not None
+            ):
+                self._load_lazy_span()
+                return self.__dict__[name]
+
+            return super().__getattr__(name)
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._load_lazy_span()
+
+        super().__setattr__(name, value)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        self._load_lazy_span()
+        if isinstance(other, BinaryModel):
+            other._load_lazy_span()
+
+        return super().__eq__(other)
+
+    @override
+    def __iter__(self) -> Generator[tuple[str, Any]]:
+        self._load_lazy_span()
+
+        yield from super().__iter__()
+
+    @override
+    def __repr_args__(self) -> Any:
+        self._load_lazy_span()
+
+        return super().__repr_args__()
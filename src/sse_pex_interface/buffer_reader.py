@@ -0,0 +1,467 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import struct
+from array import array
+from collections.abc import Buffer, Generator
+from contextlib import contextmanager
+from typing import Any, BinaryIO, override
+
+from . import _codec
+from .datatypes import FloatCodec, IntegerCodec, StringCodec, StructLayout
+
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_INT32 = struct.Struct(">i")
+_FLOAT32 = struct.Struct(FloatCodec.FloatType.Float32.value[1])
+
+
+class BufferReader:
+    """
+    Reader that decodes values from a single buffer through a moving offset instead of
+    issuing a `read()` call for every field.
+
+    The buffer can be any object supporting the buffer protocol, for example `bytes`,
+    `bytearray`, `memoryview` or `mmap.mmap`.
+    """
+
+    __slots__ = ("buffer", "compact", "lazy", "offset", "validate")
+
+    buffer: memoryview
+    """View of the buffer to read from."""
+
+    offset: int
+    """The current read position in the buffer."""
+
+    validate: bool
+    """
+    Whether the parsed models are validated. If `False`, the data is trusted and the
+    models are constructed without validation.
+    """
+
+    lazy: bool
+    """
+    Whether object data, function bodies and debug info are kept as raw bytes and only
+    decoded on first access.
+    """
+
+    compact: bool
+    """
+    Whether the instructions of functions are decoded into a `CompactCode` instead of a
+    list of `Instruction` models.
+    """
+
+    buffered: bool = True
+    """
+    Whether all data is in the buffer from the start. Otherwise, decoders that access
+    the buffer directly must call `ensure()` first.
+    """
+
+    def __init__(
+        self,
+        buffer: Buffer,
+        offset: int = 0,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> None:
+        self.buffer = memoryview(buffer)
+        self.offset = offset
+        self.validate = validate
+        self.lazy = lazy
+        self.compact = compact
+
+    @classmethod
+    @contextmanager
+    def from_stream(
+        cls,
+        stream: BinaryIO,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> Generator["BufferReader"]:
+        """
+        Reads the remaining data of a stream into a buffer and yields a reader for it.
+        When the context is left without an error, the stream position is moved to the
+        end of the data consumed by the reader, if the stream is seekable.
+
+        Args:
+            stream (BinaryIO): Byte stream to read from.
+            validate (bool, optional):
+                Whether the parsed models are validated. Defaults to True.
+            lazy (bool, optional):
+                Whether supported sections are decoded lazily. Defaults to False.
+            compact (bool, optional):
+                Whether instructions are decoded compactly. Defaults to False.
+
+        Yields:
+            BufferReader: Reader for the remaining data of the stream.
+        """
+
+        seekable: bool = stream.seekable()
+        start: int = stream.tell() if seekable else 0
+        reader = cls(stream.read(), validate=validate, lazy=lazy, compact=compact)
+
+        yield reader
+
+        if seekable:
+            stream.seek(start + reader.offset)
+
+    def __len__(self) -> int:
+        return self.buffer.nbytes
+
+    def ensure(self, size: int) -> None:
+        """
+        Makes sure that the buffer contains the next bytes after the offset, as far as
+        there is data left. All data of a buffer reader is in its buffer already.
+
+        Args:
+            size (int): Number of bytes after the offset.
+        """
+
+    def read_bytes(self, size: int) -> bytes:
+        """
+        Reads raw bytes from the buffer.
+
+        Args:
+            size (int): Number of bytes to read.
+
+        Raises:
+            EOFError: If the buffer has less than `size` bytes left.
+
+        Returns:
+            bytes: Read bytes.
+        """
+
+        start: int = self.offset
+        end: int = start + size
+        data = bytes(self.buffer[start:end])
+
+        if len(data) != size:
+            raise EOFError(f"Expected {size} bytes at offset {start}, got {len(data)}!")
+
+        self.offset = end
+        return data
+
+    def bytes_since(self, start: int) -> bytes:
+        """
+        Returns the raw bytes between an earlier offset and the current offset, for
+        example after skipping over a section.
+
+        Args:
+            start (int): Earlier offset.
+
+        Raises:
+            EOFError: If the current offset is beyond the end of the buffer.
+
+        Returns:
+            bytes: Raw bytes.
+        """
+
+        if self.offset > self.buffer.nbytes:
+            raise EOFError(f"Offset {self.offset} is beyond the end of the buffer!")
+
+        return bytes(self.buffer[start : self.offset])
+
+    def skip(self, size: int) -> None:
+        """
+        Advances the offset without decoding anything.
+
+        Args:
+            size (int): Number of bytes to skip.
+        """
+
+        self.offset += size
+
+    def unpack(self, layout: StructLayout) -> tuple[Any, ...]:
+        """
+        Decodes a fixed-size record in a single call.
+
+        Args:
+            layout (StructLayout): Layout of the record.
+
+        Returns:
+            tuple[Any, ...]: The values of the record's fields.
+        """
+
+        values: tuple[Any, ...] = layout.compiled.unpack_from(self.buffer, self.offset)
+        self.offset += layout.size
+
+        return values
+
+    def read_array(self, type: IntegerCodec.IntType, count: int) -> array[int]:
+        """
+        Decodes a run of integers of the same type in bulk.
+
+        Args:
+            type (IntegerCodec.IntType): Integer type.
+            count (int): Number of integers.
+
+        Raises:
+            EOFError: If the buffer has less than `count` integers left.
+
+        Returns:
+            array[int]: Decoded integers.
+        """
+
+        start: int = self.offset
+        end: int = start + count * type.value[0]
+
+        if end > self.buffer.nbytes:
+            raise EOFError(f"Expected {count} integers at offset {start}!")
+
+        self.offset = end
+        return IntegerCodec.decode_array(self.buffer[start:end], type)
+
+    def read_uint8(self) -> int:
+        """
+        Returns:
+            int: Read uint8.
+        """
+
+        value: int = _UINT8.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 1
+
+        return value
+
+    def read_uint16(self) -> int:
+        """
+        Returns:
+            int: Read uint16.
+        """
+
+        value: int = _UINT16.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 2
+
+        return value
+
+    def read_uint32(self) -> int:
+        """
+        Returns:
+            int: Read uint32.
+        """
+
+        value: int = _UINT32.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 4
+
+        return value
+
+    def read_uint64(self) -> int:
+        """
+        Returns:
+            int: Read uint64.
+        """
+
+        value: int = _UINT64.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 8
+
+        return value
+
+    def read_int32(self) -> int:
+        """
+        Returns:
+            int: Read int32.
+        """
+
+        value: int = _INT32.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 4
+
+        return value
+
+    def read_float32(self) -> float:
+        """
+        Returns:
+            float: Read float32, decoded like `FloatCodec.FloatType.Float32`.
+        """
+
+        value: float = _FLOAT32.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 4
+
+        return value
+
+    def read_wstring(self) -> str:
+        """
+        Reads a string prefixed by its size as uint16 (`StringCodec.StrType.WString`).
+
+        Returns:
+            str: Read string.
+        """
+
+        size: int = self.read_uint16()
+        start: int = self.offset
+        end: int = start + size
+
+        if end > self.buffer.nbytes:
+            raise EOFError(f"Expected {size} bytes at offset {start}!")
+
+        self.offset = end
+        return str(self.buffer[start:end], StringCodec.ENCODING)
+
+    def read_wstrings(self, count: int) -> list[str]:
+        """
+        Reads a run of strings prefixed by their size as uint16, for example a string
+        table.
+
+        Args:
+            count (int): Number of strings.
+
+        Raises:
+            EOFError: If the buffer ends before the last string.
+
+        Returns:
+            list[str]: Read strings.
+        """
+
+        strings: list[str]
+        strings, self.offset = _codec.read_wstrings(
+            self.buffer, self.offset, count, StringCodec.ENCODING
+        )
+
+        return strings
+
+
+class StreamReader(BufferReader):
+    """
+    Reader that reads its buffer from a stream on demand, so that parsing a single
+    model consumes only the model's data from the stream.
+
+    Seekable streams are read ahead in chunks and moved back to the end of the
+    consumed data by `finish()`. Other streams are read exactly as far as needed.
+    """
+
+    __slots__ = ("__data", "__seekable", "__start", "stream")
+
+    CHUNK_SIZE: int = 4096
+    """The minimum number of bytes that are read ahead from seekable streams."""
+
+    buffered: bool = False
+
+    stream: BinaryIO
+    """The stream to read from."""
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> None:
+        super().__init__(b"", validate=validate, lazy=lazy, compact=compact)
+
+        self.stream = stream
+        self.__seekable: bool = stream.seekable()
+        self.__start: int = stream.tell() if self.__seekable else 0
+        self.__data = bytearray()
+
+    def finish(self) -> None:
+        """
+        Moves the stream position to the end of the data consumed by the reader, if the
+        stream is seekable.
+        """
+
+        if self.__seekable:
+            self.stream.seek(self.__start + self.offset)
+
+    @override
+    def ensure(self, size: int) -> None:
+        end: int = self.offset + size
+        if end <= len(self.__data):
+            return
+
+        # Reading ahead in growing chunks keeps the number of reads and copies
+        # logarithmic for large models
+        target: int = (
+            max(end, 2 * len(self.__data), StreamReader.CHUNK_SIZE)
+            if self.__seekable
+            else end
+        )
+        chunks: list[bytes] = []
+        read_size: int = len(self.__data)
+        while read_size < end:
+            chunk: bytes = self.stream.read(target - read_size)
+            if not chunk:
+                break
+
+            chunks.append(chunk)
+            read_size += len(chunk)
+
+        if chunks:
+            # The buffer cannot be resized while it is viewed
+            self.buffer.release()
+            self.__data += b"".join(chunks)
+            self.buffer = memoryview(self.__data)
+
+    @override
+    def read_bytes(self, size: int) -> bytes:
+        if self.offset + size > self.buffer.nbytes:
+            self.ensure(size)
+        return super().read_bytes(size)
+
+    @override
+    def skip(self, size: int) -> None:
+        if self.offset + size > self.buffer.nbytes:
+            self.ensure(size)
+        super().skip(size)
+
+    @override
+    def unpack(self, layout: StructLayout) -> tuple[Any, ...]:
+        if self.offset + layout.size > self.buffer.nbytes:
+            self.ensure(layout.size)
+        return super().unpack(layout)
+
+    @override
+    def read_array(self, type: IntegerCodec.IntType, count: int) -> array[int]:
+        if self.offset + count * type.value[0] > self.buffer.nbytes:
+            self.ensure(count * type.value[0])
+        return super().read_array(type, count)
+
+    @override
+    def read_uint8(self) -> int:
+        if self.offset + 1 > self.buffer.nbytes:
+            self.ensure(1)
+        return super().read_uint8()
+
+    @override
+    def read_uint16(self) -> int:
+        if self.offset + 2 > self.buffer.nbytes:
+            self.ensure(2)
+        return super().read_uint16()
+
+    @override
+    def read_uint32(self) -> int:
+        if self.offset + 4 > self.buffer.nbytes:
+            self.ensure(4)
+        return super().read_uint32()
+
+    @override
+    def read_uint64(self) -> int:
+        if self.offset + 8 > self.buffer.nbytes:
+            self.ensure(8)
+        return super().read_uint64()
+
+    @override
+    def read_int32(self) -> int:
+        if self.offset + 4 > self.buffer.nbytes:
+            self.ensure(4)
+        return super().read_int32()
+
+    @override
+    def read_float32(self) -> float:
+        if self.offset + 4 > self.buffer.nbytes:
+            self.ensure(4)
+        return super().read_float32()
+
+    @override
+    def read_wstring(self) -> str:
+        self.ensure(2)
+        if self.offset + 2 <= self.buffer.nbytes:
+            self.ensure(2 + _UINT16.unpack_from(self.buffer, self.offset)[0])
+
+        return super().read_wstring()
+
+    @override
+    def read_wstrings(self, count: int) -> list[str]:
+        return [self.read_wstring() for _ in range(count)]
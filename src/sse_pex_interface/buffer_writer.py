@@ -0,0 +1,148 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import struct
+from collections.abc import Buffer, Iterable
+from typing import Any
+
+from .datatypes import FloatCodec, IntegerCodec, StringCodec, StructLayout
+
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_INT32 = struct.Struct(">i")
+_FLOAT32 = struct.Struct(FloatCodec.FloatType.Float32.value[1])
+
+
+class BufferWriter:
+    """
+    Writer that encodes values into a single `bytearray` instead of issuing a `write()`
+    call for every field. This is the counterpart of `BufferReader`.
+    """
+
+    __slots__ = ("buffer",)
+
+    buffer: bytearray
+    """The buffer that is written to."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def getvalue(self) -> bytes:
+        """
+        Returns:
+            bytes: The written bytes.
+        """
+
+        return bytes(self.buffer)
+
+    def write_bytes(self, data: Buffer) -> None:
+        """
+        Writes raw bytes to the buffer.
+
+        Args:
+            data (Buffer): Bytes to write.
+        """
+
+        self.buffer += data
+
+    def pack(self, layout: StructLayout, values: tuple[Any, ...]) -> None:
+        """
+        Encodes a fixed-size record in a single call.
+
+        Args:
+            layout (StructLayout): Layout of the record.
+            values (tuple[Any, ...]): The values of the record's fields.
+        """
+
+        self.buffer += layout.compiled.pack(*values)
+
+    def pack_into(
+        self, layout: StructLayout, offset: int, values: tuple[Any, ...]
+    ) -> None:
+        """
+        Encodes a fixed-size record over already written bytes, for example to fill in
+        a size that is only known after the following data was written.
+
+        Args:
+            layout (StructLayout): Layout of the record.
+            offset (int): Offset of the record in the buffer.
+            values (tuple[Any, ...]): The values of the record's fields.
+        """
+
+        layout.compiled.pack_into(self.buffer, offset, *values)
+
+    def write_array(self, values: Iterable[int], type: IntegerCodec.IntType) -> None:
+        """
+        Encodes a run of integers of the same type in bulk.
+
+        Args:
+            values (Iterable[int]): Integers to write.
+            type (IntegerCodec.IntType): Integer type.
+        """
+
+        self.buffer += IntegerCodec.encode_array(values, type)
+
+    def write_uint8(self, value: int) -> None:
+        """
+        Args:
+            value (int): uint8 to write.
+        """
+
+        self.buffer.append(value)
+
+    def write_uint16(self, value: int) -> None:
+        """
+        Args:
+            value (int): uint16 to write.
+        """
+
+        self.buffer += _UINT16.pack(value)
+
+    def write_uint32(self, value: int) -> None:
+        """
+        Args:
+            value (int): uint32 to write.
+        """
+
+        self.buffer += _UINT32.pack(value)
+
+    def write_uint64(self, value: int) -> None:
+        """
+        Args:
+            value (int): uint64 to write.
+        """
+
+        self.buffer += _UINT64.pack(value)
+
+    def write_int32(self, value: int) -> None:
+        """
+        Args:
+            value (int): int32 to write.
+        """
+
+        self.buffer += _INT32.pack(value)
+
+    def write_float32(self, value: float) -> None:
+        """
+        Args:
+            value (float): float32 to write, encoded like `FloatCodec.FloatType.Float32`.
+        """
+
+        self.buffer += _FLOAT32.pack(value)
+
+    def write_wstring(self, value: str) -> None:
+        """
+        Writes a string prefixed by its size as uint16 (`StringCodec.StrType.WString`).
+
+        Args:
+            value (str): String to write.
+        """
+
+        text: bytes = value.encode(StringCodec.ENCODING)
+        self.buffer += _UINT16.pack(len(text))
+        self.buffer += text
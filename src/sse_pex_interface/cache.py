@@ -0,0 +1,276 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Self
+
+from .pex_file import PexFile
+
+
+class PexCache:
+    """
+    Persistent on-disk cache for parsed PEX files.
+
+    Parsed files are stored as compressed, pickled models in an SQLite database, keyed
+    by their resolved path, size and modification time and, optionally, a hash of their
+    content. Loading a file from the cache skips decoding and validating its binary
+    data entirely.
+
+    Like `PexFile.from_path()`, the cache returns models with lists of `Instruction`
+    models by default. Files parsed with `compact=True` have a `CompactCode` instead,
+    which makes their entries less than half as large and much faster to load.
+
+    **The cache directory must be trusted, as the entries are loaded with `pickle`!**
+
+    Example:
+        >>> with PexCache(Path(".pex_cache"), max_size=512 * 1024 * 1024) as cache:
+        ...     pex_file = cache.parse(Path("myscript.pex"), compact=True)
+    """
+
+    DATABASE_NAME: str = "pex_cache.sqlite"
+    """The file name of the database in the cache directory."""
+
+    FORMAT_VERSION: int = 2
+    """
+    The version of the format of the entries. Entries of other versions are not used
+    and replaced once their files are parsed again.
+    """
+
+    cache_path: Path
+    """The path to the cache directory."""
+
+    max_size: Optional[int]
+    """
+    The maximum total size of all entries in bytes. The least recently used entries
+    are evicted when this is exceeded. Files whose entries would be larger on their own
+    are not stored at all.
+    """
+
+    use_content_hash: bool
+    """
+    Whether the content of a file is hashed to verify a cache hit and to reuse an entry
+    whose file was touched but not changed.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path,
+        max_size: Optional[int] = None,
+        use_content_hash: bool = False,
+    ) -> None:
+        """
+        Args:
+            cache_path (Path):
+                Path to the cache directory. It is created if it does not exist.
+            max_size (Optional[int], optional):
+                Maximum total size of all entries in bytes. Defaults to no limit.
+            use_content_hash (bool, optional):
+                Whether to verify cache hits with a hash of the file's content.
+                Defaults to False.
+        """
+
+        self.cache_path = cache_path
+        self.max_size = max_size
+        self.use_content_hash = use_content_hash
+
+        cache_path.mkdir(parents=True, exist_ok=True)
+        self.__connection = sqlite3.connect(cache_path / PexCache.DATABASE_NAME)
+
+        # Databases of versions without a compact column are recreated
+        columns: list[tuple[Any, ...]] = self.__connection.execute(
+            "PRAGMA table_info(entries)"
+        ).fetchall()
+        if columns and "compact" not in (column[1] for column in columns):
+            self.__connection.execute("DROP TABLE entries")
+
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT PRIMARY KEY, "
+            "size INTEGER NOT NULL, "
+            "mtime INTEGER NOT NULL, "
+            "content_hash BLOB, "
+            "version INTEGER NOT NULL, "
+            "validated INTEGER NOT NULL, "
+            "compact INTEGER NOT NULL, "
+            "last_access INTEGER NOT NULL, "
+            "data BLOB NOT NULL)"
+        )
+        self.__connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+        )
+        self.__connection.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the database of the cache.
+        """
+
+        self.__connection.close()
+
+    def parse(
+        self, path: Path, *, validate: bool = True, compact: bool = False
+    ) -> PexFile:
+        """
+        Loads a PEX file from the cache or, if there is no valid entry for it, parses
+        it and stores it in the cache.
+
+        Args:
+            path (Path): Path to the PEX file.
+            validate (bool, optional):
+                Whether the file must be validated. Entries of files that were parsed
+                without validation are not used if this is True. Defaults to True.
+            compact (bool, optional):
+                Whether to decode the instructions of functions into a `CompactCode`.
+                Entries of files that were parsed otherwise are not used.
+                Defaults to False.
+
+        Returns:
+            PexFile: The parsed PEX file.
+        """
+
+        key: str = str(path.resolve())
+        stat: os.stat_result = path.stat()
+        row: Optional[tuple[int, int, Optional[bytes], bytes]] = (
+            self.__connection.execute(
+                "SELECT size, mtime, content_hash, data FROM entries "
+                "WHERE path = ? AND version = ? AND (validated OR NOT ?) "
+                "AND compact = ?",
+                (key, PexCache.FORMAT_VERSION, validate, compact),
+            ).fetchone()
+        )
+
+        data: Optional[bytes] = None
+        content_hash: Optional[bytes] = None
+        if self.use_content_hash:
+            data = path.read_bytes()
+            content_hash = hashlib.blake2b(data, digest_size=16).digest()
+
+        if row is not None:
+            size, mtime, cached_hash, cached_data = row
+            is_hit: bool
+            if self.use_content_hash:
+                is_hit = cached_hash == content_hash
+            else:
+                is_hit = size == stat.st_size and mtime == stat.st_mtime_ns
+
+            if is_hit:
+                self.__connection.execute(
+                    "UPDATE entries SET size = ?, mtime = ?, last_access = ? "
+                    "WHERE path = ?",
+                    (stat.st_size, stat.st_mtime_ns, time.time_ns(), key),
+                )
+                self.__connection.commit()
+
+                pex_file: PexFile = pickle.loads(zlib.decompress(cached_data))
+                return pex_file
+
+        if data is None:
+            data = path.read_bytes()
+
+        pex_file = PexFile.from_buffer(data, validate=validate, compact=compact)
+        self.__store(key, stat, content_hash, validate, compact, pex_file)
+
+        return pex_file
+
+    def __store(
+        self,
+        key: str,
+        stat: os.stat_result,
+        content_hash: Optional[bytes],
+        validated: bool,
+        compact: bool,
+        pex_file: PexFile,
+    ) -> None:
+        # Compressing the pickled model is cheap and makes most entries smaller than
+        # their files
+        data: bytes = zlib.compress(
+            pickle.dumps(pex_file, protocol=pickle.HIGHEST_PROTOCOL), 1
+        )
+
+        # An entry that does not fit into the cache would only evict all others
+        if self.max_size is not None and len(data) > self.max_size:
+            self.__connection.execute("DELETE FROM entries WHERE path = ?", (key,))
+            self.__connection.commit()
+            return
+
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(path, size, mtime, content_hash, version, validated, compact, "
+            "last_access, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                stat.st_size,
+                stat.st_mtime_ns,
+                content_hash,
+                PexCache.FORMAT_VERSION,
+                validated,
+                compact,
+                time.time_ns(),
+                data,
+            ),
+        )
+        self.__evict()
+        self.__connection.commit()
+
+    def __evict(self) -> None:
+        if self.max_size is None:
+            return
+
+        total_size: int = self.size
+
+        rows: list[tuple[str, int]] = self.__connection.execute(
+            "SELECT path, LENGTH(data) FROM entries ORDER BY last_access"
+        ).fetchall()
+        for path, size in rows:
+            if total_size <= self.max_size:
+                break
+
+            self.__connection.execute("DELETE FROM entries WHERE path = ?", (path,))
+            total_size -= size
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+
+        self.__connection.execute("DELETE FROM entries")
+        self.__connection.commit()
+
+    @property
+    def size(self) -> int:
+        """The total size of all entries in bytes."""
+
+        return self.__connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM entries"
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.__connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __contains__(self, path: Path) -> bool:
+        return (
+            self.__connection.execute(
+                "SELECT 1 FROM entries WHERE path = ?", (str(path.resolve()),)
+            ).fetchone()
+            is not None
+        )
@@ -0,0 +1,374 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .pex_file import PexFile
+from .sections import Object
+from .string_table import StringTable
+from .symbol_index import ObjectSymbol, PropertySymbol, SymbolLocation
+
+
+class _ClassData(NamedTuple):
+    """
+    Symbols of a loaded class.
+    """
+
+    object: ObjectSymbol
+    properties: list[PropertySymbol]
+
+
+class ClassHierarchy:
+    """
+    Resolves classes, their inheritance chains and their inherited functions and
+    properties from the PEX files in a script search path.
+
+    Classes are only loaded when they are needed and only their header, string table
+    and object data are decoded, while function bodies and debug info are skipped.
+    Loaded classes, inheritance chains, function sets and property sets are memoized
+    until `clear()` is called.
+
+    Like in Papyrus, names are case-insensitive.
+
+    Example:
+        >>> hierarchy = ClassHierarchy([Path("Data/Scripts"), Path("Source/Scripts")])
+        >>> print(hierarchy.get_chain("MyQuestScript"))
+        ['MyQuestScript', 'Quest', 'Form']
+        >>> print(hierarchy.get_function("MyQuestScript", "Start", "Running"))
+    """
+
+    search_path: list[Path]
+    """
+    The directories to search for PEX files, in order of precedence. A class is loaded
+    from the file named like it with the extension ".pex", in any case.
+    """
+
+    validate: bool
+    """Whether to validate the data of loaded classes."""
+
+    __listings: dict[Path, dict[str, Path]]
+    __classes: dict[str, Optional[_ClassData]]
+    __chains: dict[str, list[str]]
+    __state_functions: dict[tuple[str, str], dict[str, SymbolLocation]]
+    __functions: dict[tuple[str, str], dict[str, SymbolLocation]]
+    __properties: dict[str, dict[str, PropertySymbol]]
+
+    def __init__(self, search_path: Iterable[Path], validate: bool = True) -> None:
+        """
+        Args:
+            search_path (Iterable[Path]):
+                Directories to search for PEX files, in order of precedence.
+            validate (bool, optional):
+                Whether to validate the data of loaded classes. Defaults to True.
+        """
+
+        self.search_path = list(search_path)
+        self.validate = validate
+
+        self.__listings = {}
+        self.__classes = {}
+        self.__chains = {}
+        self.__state_functions = {}
+        self.__functions = {}
+        self.__properties = {}
+
+    def clear(self) -> None:
+        """
+        Clears all memoized classes and results, for example after files in the search
+        path changed.
+        """
+
+        self.__listings.clear()
+        self.__classes.clear()
+        self.__chains.clear()
+        self.__state_functions.clear()
+        self.__functions.clear()
+        self.__properties.clear()
+
+    def find_file(self, class_name: str) -> Optional[Path]:
+        """
+        Finds the PEX file of a class in the search path.
+
+        Args:
+            class_name (str): The name of the class.
+
+        Returns:
+            Optional[Path]: The path to the PEX file or None if there is none.
+        """
+
+        key: str = class_name.casefold()
+        for directory in self.search_path:
+            listing: Optional[dict[str, Path]] = self.__listings.get(directory)
+            if listing is None:
+                # Directories are listed once, so that file names and extensions can
+                # be matched case-insensitively on all platforms
+                listing = self.__listings[directory] = {
+                    path.stem.casefold(): path
+                    for path in (directory.iterdir() if directory.is_dir() else [])
+                    if path.suffix.lower() == ".pex"
+                }
+
+            path: Optional[Path] = listing.get(key)
+            if path is not None:
+                return path
+
+        return None
+
+    def get_class(self, class_name: str) -> Optional[ObjectSymbol]:
+        """
+        Gets a class, loading it from the search path if necessary.
+
+        Args:
+            class_name (str): The name of the class.
+
+        Returns:
+            Optional[ObjectSymbol]:
+                The class or None if it is not found in the search path.
+        """
+
+        data: Optional[_ClassData] = self.__get_class_data(class_name)
+
+        return data.object if data is not None else None
+
+    def get_chain(self, class_name: str) -> list[str]:
+        """
+        Gets the inheritance chain of a class, starting with the class itself. The chain
+        ends at the first class without parent or whose parent is not found in the
+        search path.
+
+        Args:
+            class_name (str): The name of the class.
+
+        Raises:
+            ValueError: If the inheritance chain is cyclic.
+
+        Returns:
+            list[str]:
+                The names of the classes in the chain or an empty list if the class is
+                not found in the search path.
+        """
+
+        key: str = class_name.lower()
+        chain: Optional[list[str]] = self.__chains.get(key)
+        if chain is not None:
+            return list(chain)
+
+        # The chain is resolved up to the first class whose chain is already known
+        pending: list[ObjectSymbol] = []
+        visited: set[str] = set()
+        tail: list[str] = []
+        current: Optional[str] = class_name
+        while current is not None:
+            current_key: str = current.lower()
+            known: Optional[list[str]] = self.__chains.get(current_key)
+            if known is not None:
+                tail = known
+                break
+
+            if current_key in visited:
+                raise ValueError(f"Cyclic inheritance of {class_name!r}!")
+            visited.add(current_key)
+
+            object: Optional[ObjectSymbol] = self.get_class(current)
+            if object is None:
+                break
+
+            pending.append(object)
+            current = object.parent_class_name
+
+        for object in reversed(pending):
+            tail = [object.name, *tail]
+            self.__chains[object.name.lower()] = tail
+
+        return list(self.__chains.get(key, []))
+
+    def get_functions(
+        self, class_name: str, state_name: str = ""
+    ) -> dict[str, SymbolLocation]:
+        """
+        Gets the effective functions of a class in a state, including the inherited
+        ones.
+
+        A function is looked up in the state of the class and its parents first and
+        then in the empty state of the class and its parents. Functions of a class
+        override the ones of its parents in the same state.
+
+        Args:
+            class_name (str): The name of the class.
+            state_name (str, optional): The name of the state. Defaults to "".
+
+        Raises:
+            ValueError: If the inheritance chain is cyclic.
+
+        Returns:
+            dict[str, SymbolLocation]:
+                The locations of the functions, by lower-cased function name.
+        """
+
+        key: tuple[str, str] = (class_name.lower(), state_name.lower())
+        functions: Optional[dict[str, SymbolLocation]] = self.__functions.get(key)
+        if functions is None:
+            functions = dict(self.__get_state_functions(class_name, ""))
+            if state_name:
+                functions.update(self.__get_state_functions(class_name, state_name))
+
+            self.__functions[key] = functions
+
+        return dict(functions)
+
+    def get_function(
+        self, class_name: str, function_name: str, state_name: str = ""
+    ) -> Optional[SymbolLocation]:
+        """
+        Resolves a function of a class in a state, see `get_functions()`.
+
+        Args:
+            class_name (str): The name of the class.
+            function_name (str): The name of the function.
+            state_name (str, optional): The name of the state. Defaults to "".
+
+        Raises:
+            ValueError: If the inheritance chain is cyclic.
+
+        Returns:
+            Optional[SymbolLocation]:
+                The location of the function or None if it cannot be resolved.
+        """
+
+        key: tuple[str, str] = (class_name.lower(), state_name.lower())
+        if key not in self.__functions:
+            self.get_functions(class_name, state_name)
+
+        return self.__functions[key].get(function_name.lower())
+
+    def get_properties(self, class_name: str) -> dict[str, PropertySymbol]:
+        """
+        Gets the effective properties of a class, including the inherited ones.
+
+        Args:
+            class_name (str): The name of the class.
+
+        Raises:
+            ValueError: If the inheritance chain is cyclic.
+
+        Returns:
+            dict[str, PropertySymbol]: The properties, by lower-cased property name.
+        """
+
+        key: str = class_name.lower()
+        properties: Optional[dict[str, PropertySymbol]] = self.__properties.get(key)
+        if properties is None:
+            chain: list[str] = self.get_chain(class_name)
+            data: Optional[_ClassData] = self.__get_class_data(class_name)
+            properties = self.get_properties(chain[1]) if len(chain) > 1 else {}
+            if data is not None:
+                for property in data.properties:
+                    properties[property.name.lower()] = property
+
+            self.__properties[key] = properties
+
+        return dict(properties)
+
+    def get_property(
+        self, class_name: str, property_name: str
+    ) -> Optional[PropertySymbol]:
+        """
+        Resolves a property of a class, see `get_properties()`.
+
+        Args:
+            class_name (str): The name of the class.
+            property_name (str): The name of the property.
+
+        Raises:
+            ValueError: If the inheritance chain is cyclic.
+
+        Returns:
+            Optional[PropertySymbol]:
+                The property or None if it cannot be resolved.
+        """
+
+        key: str = class_name.lower()
+        if key not in self.__properties:
+            self.get_properties(class_name)
+
+        return self.__properties[key].get(property_name.lower())
+
+    def __get_state_functions(
+        self, class_name: str, state_name: str
+    ) -> dict[str, SymbolLocation]:
+        """
+        Gets the functions of a state of a class, including the ones inherited in the
+        same state. Built on top of the memoized functions of the parent.
+        """
+
+        key: tuple[str, str] = (class_name.lower(), state_name.lower())
+        functions: Optional[dict[str, SymbolLocation]] = self.__state_functions.get(key)
+        if functions is not None:
+            return functions
+
+        chain: list[str] = self.get_chain(class_name)
+        functions = (
+            dict(self.__get_state_functions(chain[1], state_name))
+            if len(chain) > 1
+            else {}
+        )
+
+        data: Optional[_ClassData] = self.__get_class_data(class_name)
+        if data is not None:
+            for name, function_names in data.object.states.items():
+                if name.lower() == key[1]:
+                    for function_name in function_names:
+                        functions[function_name.lower()] = SymbolLocation(
+                            data.object.path, data.object.name, name, function_name
+                        )
+
+        self.__state_functions[key] = functions
+
+        return functions
+
+    def __get_class_data(self, class_name: str) -> Optional[_ClassData]:
+        key: str = class_name.lower()
+        if key in self.__classes:
+            return self.__classes[key]
+
+        path: Optional[Path] = self.find_file(class_name)
+        data: Optional[_ClassData] = None
+        if path is not None:
+            data = self.__load(path, class_name)
+
+        self.__classes[key] = data
+
+        return data
+
+    def __load(self, path: Path, class_name: str) -> Optional[_ClassData]:
+        # Function bodies and debug info stay undecoded, as only names are needed
+        pex_file: PexFile = PexFile.from_path(path, validate=self.validate, lazy=True)
+        string_table: StringTable = pex_file.string_table
+
+        # A file without an object of the class does not define it, even if it is
+        # named like it
+        object: Optional[Object] = next(
+            (
+                object
+                for object in pex_file.objects
+                if string_table[object.name_index].lower() == class_name.lower()
+            ),
+            None,
+        )
+        if object is None:
+            return None
+
+        object_symbol = ObjectSymbol.from_object(object, string_table, str(path))
+
+        return _ClassData(
+            object_symbol,
+            [
+                PropertySymbol.from_property(
+                    property, object_symbol.name, string_table, str(path)
+                )
+                for property in object.data.properties
+            ],
+        )
@@ -2,9 +2,15 @@
 Copyright (c) Cutleast
 """
 
+import os
 import struct
+import sys
+from array import array
+from collections.abc import Buffer, Iterable
 from enum import Enum, IntFlag, auto
-from typing import BinaryIO, Literal, Optional, Self, overload
+from typing import Annotated, Any, BinaryIO, Literal, Optional, Self, overload
+
+from pydantic import PlainSerializer, PlainValidator
 
 
 class IntegerCodec:
@@ -25,10 +31,10 @@ class IntegerCodec:
         UInt64 = (8, False)
         """Unsigned integer of size 8."""
 
-        UShort = (2, False)
+        UShort = (2, False)  # noqa: PIE796
         """Same as UInt16."""
 
-        ULong = (4, False)
+        ULong = (4, False)  # noqa: PIE796
         """Same as UInt32."""
 
         Int8 = (1, True)
@@ -43,12 +49,23 @@ class IntegerCodec:
         Int64 = (8, True)
         """Signed integer of size 8."""
 
-        Short = (2, True)
+        Short = (2, True)  # noqa: PIE796
         """Same as Int16."""
 
-        Long = (4, True)
+        Long = (4, True)  # noqa: PIE796
         """Same as Int32."""
 
+        @property
+        def format(self) -> str:
+            """The format character of this type for the `struct` module."""
+
+            size: int
+            signed: bool
+            size, signed = self.value
+            format: str = {1: "b", 2: "h", 4: "i", 8: "q"}[size]
+
+            return format if signed else format.upper()
+
     @staticmethod
     def parse(stream: BinaryIO, type: IntType) -> int:
         """
@@ -85,6 +102,151 @@ class IntegerCodec:
 
         output.write(value.to_bytes(size, byteorder="big", signed=signed))
 
+    @staticmethod
+    def decode_array(data: Buffer, type: IntType) -> array[int]:
+        """
+        Decodes a run of big-endian integers of the specified type in bulk.
+
+        Args:
+            data (Buffer): Raw bytes of the integers.
+            type (IntType): Integer type.
+
+        Returns:
+            array[int]: Decoded integers.
+        """
+
+        values: array[int] = array(type.format)
+        values.frombytes(data)
+        if sys.byteorder == "little" and values.itemsize > 1:
+            values.byteswap()
+
+        return values
+
+    @staticmethod
+    def encode_array(values: Iterable[int], type: IntType) -> bytes:
+        """
+        Encodes a run of integers of the specified type as big-endian bytes in bulk.
+
+        Args:
+            values (Iterable[int]): Integers to encode.
+            type (IntType): Integer type.
+
+        Returns:
+            bytes: Encoded integers.
+        """
+
+        encoded: array[int] = array(type.format, values)
+        if sys.byteorder == "little" and encoded.itemsize > 1:
+            encoded.byteswap()
+
+        return encoded.tobytes()
+
+    @staticmethod
+    def parse_array(stream: BinaryIO, type: IntType, count: int) -> array[int]:
+        """
+        Parses a run of integers of the specified type from a byte stream.
+
+        Args:
+            stream (BinaryIO): Byte stream to read from.
+            type (IntType): Integer type.
+            count (int): Number of integers.
+
+        Returns:
+            array[int]: Parsed integers.
+        """
+
+        return IntegerCodec.decode_array(stream.read(count * type.value[0]), type)
+
+    @staticmethod
+    def dump_array(values: Iterable[int], type: IntType, output: BinaryIO) -> None:
+        """
+        Dumps a run of integers of the specified type to a byte stream.
+
+        Args:
+            values (Iterable[int]): Integers to dump.
+            type (IntType): Integer type.
+            output (BinaryIO): Byte stream to write to.
+        """
+
+        output.write(IntegerCodec.encode_array(values, type))
+
+
+def _validate_uint16_array(value: Any) -> array[int]:
+    if isinstance(value, array) and value.typecode == "H":
+        return value
+
+    try:
+        return array("H", value)
+    except OverflowError as ex:
+        raise ValueError("Values must be in the range of an uint16!") from ex
+
+
+UInt16Array = Annotated[
+    array[int],
+    PlainValidator(_validate_uint16_array),
+    PlainSerializer(lambda value: value.tolist()),
+]
+"""
+Compact array of uint16 values for pydantic models. Any iterable of integers is
+accepted and converted on validation.
+"""
+
+
+class StructLayout:
+    """
+    Declarative layout of a fixed-size record of big-endian integers that is compiled
+    into a single `struct.Struct`, so that the entire record is decoded and encoded
+    in one call.
+
+    Example:
+        >>> layout = StructLayout(
+        ...     ("name_index", IntegerCodec.IntType.UInt16),
+        ...     ("flag_index", IntegerCodec.IntType.UInt8),
+        ... )
+        >>> layout.compiled.format
+        '>HB'
+    """
+
+    __slots__ = ("compiled", "field_names", "size")
+
+    field_names: tuple[str, ...]
+    """The names of the fields in the order they are stored."""
+
+    compiled: struct.Struct
+    """The compiled struct."""
+
+    size: int
+    """The size of the record in bytes."""
+
+    def __init__(self, *fields: tuple[str, IntegerCodec.IntType]) -> None:
+        self.field_names = tuple(name for name, _ in fields)
+        self.compiled = struct.Struct(">" + "".join(type.format for _, type in fields))
+        self.size = self.compiled.size
+
+    def parse(self, stream: BinaryIO) -> tuple[Any, ...]:
+        """
+        Parses a record from a byte stream.
+
+        Args:
+            stream (BinaryIO): Byte stream to read from.
+
+        Returns:
+            tuple[Any, ...]: The values of the fields.
+        """
+
+        return self.compiled.unpack(stream.read(self.size))
+
+    def dump(self, values: tuple[Any, ...], output: BinaryIO) -> None:
+        """
+        Dumps a record to a byte stream.
+
+        Args:
+            values (tuple[Any, ...]): The values of the fields.
+            output (BinaryIO): Byte stream to write to.
+        """
+
+        output.write(self.compiled.pack(*values))
+
 
 class StringCodec:
     """
@@ -94,6 +256,9 @@ class StringCodec:
     ENCODING: str = "cp1252"
     """The default encoding used in Bethesda's file formats."""
 
+    LIST_CHUNK_SIZE: int = 4096
+    """The number of bytes that are read at once when parsing a list of strings."""
+
     class StrType(Enum):
         Char = auto()
         """8-bit character."""
@@ -194,22 +359,64 @@ class StringCodec:
                 text = stream.read(size).strip(b"\x00")
 
             case StringCodec.StrType.List:
-                strings: list[str] = []
-
                 if size is None:
                     raise ValueError("'size' must not be None when 'type' is 'List'!")
 
-                while len(strings) < size:
-                    string = b""
-                    while (char := stream.read(1)) != b"\x00" and char:
-                        string += char
+                return StringCodec._parse_list(stream, size)
 
-                    if string:
-                        strings.append(string.decode(StringCodec.ENCODING))
+        return text.decode(StringCodec.ENCODING)
+
+    @staticmethod
+    def _parse_list(stream: BinaryIO, size: int) -> list[str]:
+        """
+        Parses a list of non-empty strings separated by `\\x00` from a byte stream.
+        Empty strings are skipped and do not count towards `size`.
 
-                return strings
+        The stream is read in chunks that are split with `bytearray.find()`. Data that
+        was read beyond the end of the list is given back by seeking backwards, so
+        non-seekable streams are read byte by byte instead.
 
-        return text.decode(StringCodec.ENCODING)
+        Args:
+            stream (BinaryIO): Byte stream to read from.
+            size (int): Number of strings.
+
+        Returns:
+            list[str]: Parsed strings.
+        """
+
+        chunk_size: int = StringCodec.LIST_CHUNK_SIZE if stream.seekable() else 1
+        strings: list[str] = []
+        buffer = bytearray()
+        start: int = 0  # Start of the current string in the buffer
+        search_start: int = 0  # Position in the buffer that is not searched yet
+
+        while len(strings) < size:
+            end: int = buffer.find(b"\x00", search_start)
+
+            if end == -1:
+                chunk: bytes = stream.read(chunk_size)
+                if not chunk:
+                    if start < len(buffer):
+                        strings.append(buffer[start:].decode(StringCodec.ENCODING))
+                    start = len(buffer)
+                    break
+
+                # Drop the strings that are already decoded before growing the buffer
+                del buffer[:start]
+                start = 0
+                search_start = len(buffer)
+                buffer += chunk
+                continue
+
+            if end > start:
+                strings.append(buffer[start:end].decode(StringCodec.ENCODING))
+
+            start = search_start = end + 1
+
+        if start < len(buffer):
+            stream.seek(start - len(buffer), os.SEEK_CUR)
+
+        return strings
 
     @staticmethod
     @overload
@@ -282,8 +489,9 @@ class StringCodec:
                 if not isinstance(value, list):
                     raise TypeError("'value' must be a list!")
 
-                for string in value:
-                    output.write(string.encode(StringCodec.ENCODING) + b"\x00")
+                output.writelines(
+                    string.encode(StringCodec.ENCODING) + b"\x00" for string in value
+                )
 
 
 class FloatCodec:
@@ -302,10 +510,10 @@ class FloatCodec:
         Float64 = (8, "d")
         """Float of Size 8."""
 
-        Float = (4, "f")
+        Float = (4, "f")  # noqa: PIE796
         """Alias for Float32."""
 
-        Double = (8, "d")
+        Double = (8, "d")  # noqa: PIE796
         """Alias for Float64."""
 
     @staticmethod
@@ -337,7 +545,7 @@ class FloatCodec:
             output (BinaryIO): Byte stream to write to.
         """
 
-        size, format = type.value  # type: ignore
+        _, format = type.value  # type: ignore
         output.write(struct.pack(format, value))
 
 
@@ -0,0 +1,291 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, NamedTuple, Optional, Self
+
+from .pex_file import PexFile
+from .sections import Function
+from .string_table import StringTable
+
+
+class FunctionLocation(NamedTuple):
+    """
+    Location of a function in a PEX file.
+    """
+
+    path: str
+    """The path of the PEX file."""
+
+    object_name: str
+    """The name of the object."""
+
+    state_name: str
+    """The name of the state, empty for the default state and property handlers."""
+
+    function_name: str
+    """The name of the function or of the property, for property handlers."""
+
+    handler: Literal["", "read", "write"] = ""
+    """The kind of property handler or empty for functions of states."""
+
+
+class FunctionStore:
+    """
+    Store that keeps every distinct function body only once, keyed by its
+    fingerprint (see `Function.fingerprint()`), together with all locations it was
+    found at. The store is kept in memory or, if a path is specified, in an SQLite
+    database on disk.
+
+    Example:
+        >>> with FunctionStore(Path("functions.sqlite")) as store:
+        ...     for path in Path("Scripts").glob("*.pex"):
+        ...         store.add_file(PexFile.from_path(path), str(path))
+        ...     copies = store.get_locations(fingerprint)
+    """
+
+    database_path: Optional[Path]
+    """The path to the database or None if the store is only kept in memory."""
+
+    def __init__(self, database_path: Optional[Path] = None) -> None:
+        """
+        Args:
+            database_path (Optional[Path], optional):
+                Path to the database. It is created if it does not exist. Defaults to
+                a store in memory.
+        """
+
+        self.database_path = database_path
+
+        self.__connection = sqlite3.connect(
+            database_path if database_path is not None else ":memory:"
+        )
+
+        # Databases of versions without property handlers are recreated
+        columns: list[tuple[Any, ...]] = self.__connection.execute(
+            "PRAGMA table_info(locations)"
+        ).fetchall()
+        if columns and "handler" not in (column[1] for column in columns):
+            self.__connection.execute("DROP TABLE locations")
+            self.__connection.execute("DROP TABLE functions")
+
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS functions ("
+            "fingerprint BLOB PRIMARY KEY, "
+            "data BLOB NOT NULL)"
+        )
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS locations ("
+            "fingerprint BLOB NOT NULL, "
+            "path TEXT NOT NULL, "
+            "object_name TEXT NOT NULL, "
+            "state_name TEXT NOT NULL, "
+            "function_name TEXT NOT NULL, "
+            "handler TEXT NOT NULL, "
+            "PRIMARY KEY (path, object_name, state_name, function_name, handler))"
+        )
+        self.__connection.execute(
+            "CREATE INDEX IF NOT EXISTS locations_fingerprint "
+            "ON locations (fingerprint)"
+        )
+        self.__connection.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the database of the store.
+        """
+
+        self.__connection.close()
+
+    def add(
+        self, function: Function, string_table: StringTable, location: FunctionLocation
+    ) -> bytes:
+        """
+        Adds a function and its location to the store. The function body is only
+        stored if there is no identical one in the store yet. A function that was
+        previously added at the same location is replaced.
+
+        Args:
+            function (Function): The function.
+            string_table (StringTable): The string table of the function's file.
+            location (FunctionLocation): The location of the function.
+
+        Returns:
+            bytes: The fingerprint of the function.
+        """
+
+        previous: list[tuple[bytes]] = self.__connection.execute(
+            "SELECT fingerprint FROM locations WHERE path = ? AND object_name = ? "
+            "AND state_name = ? AND function_name = ? AND handler = ?",
+            location,
+        ).fetchall()
+        fingerprint: bytes = self.__add(function, string_table, location)
+        self.__prune(previous)
+        self.__connection.commit()
+
+        return fingerprint
+
+    def add_file(self, pex_file: PexFile, path: str) -> list[bytes]:
+        """
+        Adds all functions of the states and all property handlers of a PEX file to
+        the store. Functions that were previously added for the same path are
+        replaced.
+
+        Args:
+            pex_file (PexFile): The PEX file.
+            path (str): The path of the PEX file.
+
+        Returns:
+            list[bytes]: The fingerprints of the functions, in file order.
+        """
+
+        string_table: StringTable = pex_file.string_table
+        fingerprints: list[bytes] = []
+
+        self.__remove(path)
+        for object in pex_file.objects:
+            object_name: str = string_table[object.name_index]
+            for property in object.data.properties:
+                property_name: str = string_table[property.name]
+                handlers: list[tuple[Literal["read", "write"], Optional[Function]]] = [
+                    ("read", property.read_handler),
+                    ("write", property.write_handler),
+                ]
+                for handler, function in handlers:
+                    if function is not None:
+                        location = FunctionLocation(
+                            path, object_name, "", property_name, handler
+                        )
+                        fingerprints.append(
+                            self.__add(function, string_table, location)
+                        )
+
+            for state in object.data.states:
+                for named_function in state.functions:
+                    location = FunctionLocation(
+                        path,
+                        object_name,
+                        string_table[state.name],
+                        string_table[named_function.function_name],
+                    )
+                    fingerprints.append(
+                        self.__add(named_function.function, string_table, location)
+                    )
+        self.__connection.commit()
+
+        return fingerprints
+
+    def __add(
+        self, function: Function, string_table: StringTable, location: FunctionLocation
+    ) -> bytes:
+        data: bytes = function.to_canonical_bytes(string_table)
+        fingerprint: bytes = Function.fingerprint_canonical_bytes(data)
+
+        self.__connection.execute(
+            "INSERT OR IGNORE INTO functions (fingerprint, data) VALUES (?, ?)",
+            (fingerprint, data),
+        )
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO locations "
+            "(fingerprint, path, object_name, state_name, function_name, handler) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (fingerprint, *location),
+        )
+
+        return fingerprint
+
+    def get(self, fingerprint: bytes, string_table: StringTable) -> Optional[Function]:
+        """
+        Gets a function by its fingerprint for a file. The strings the function
+        references are added to the file's string table, if they are missing.
+
+        Args:
+            fingerprint (bytes): The fingerprint of the function.
+            string_table (StringTable): The string table of the target file.
+
+        Returns:
+            Optional[Function]: The function or None if it is not in the store.
+        """
+
+        row: Optional[tuple[bytes]] = self.__connection.execute(
+            "SELECT data FROM functions WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return Function.from_canonical_bytes(row[0], string_table)
+
+    def get_locations(self, fingerprint: bytes) -> list[FunctionLocation]:
+        """
+        Gets all locations of a function.
+
+        Args:
+            fingerprint (bytes): The fingerprint of the function.
+
+        Returns:
+            list[FunctionLocation]: The locations of the function.
+        """
+
+        rows: list[tuple[Any, ...]] = self.__connection.execute(
+            "SELECT path, object_name, state_name, function_name, handler "
+            "FROM locations WHERE fingerprint = ? "
+            "ORDER BY path, object_name, state_name, function_name, handler",
+            (fingerprint,),
+        ).fetchall()
+
+        return [FunctionLocation(*row) for row in rows]
+
+    def remove(self, path: str) -> None:
+        """
+        Removes the locations of a file from the store, together with the functions
+        that have no locations left.
+
+        Args:
+            path (str): The path of the PEX file.
+        """
+
+        self.__remove(path)
+        self.__connection.commit()
+
+    def __remove(self, path: str) -> None:
+        # Only the functions of the file may have lost their last location
+        fingerprints: list[tuple[bytes]] = self.__connection.execute(
+            "SELECT DISTINCT fingerprint FROM locations WHERE path = ?", (path,)
+        ).fetchall()
+        self.__connection.execute("DELETE FROM locations WHERE path = ?", (path,))
+        self.__prune(fingerprints)
+
+    def __prune(self, fingerprints: list[tuple[bytes]]) -> None:
+        # Deletes those of the functions that have no locations left
+        self.__connection.executemany(
+            "DELETE FROM functions WHERE fingerprint = ? AND NOT EXISTS "
+            "(SELECT 1 FROM locations "
+            "WHERE locations.fingerprint = functions.fingerprint)",
+            fingerprints,
+        )
+
+    def __len__(self) -> int:
+        return self.__connection.execute("SELECT COUNT(*) FROM functions").fetchone()[0]
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        return (
+            self.__connection.execute(
+                "SELECT 1 FROM functions WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+            is not None
+        )
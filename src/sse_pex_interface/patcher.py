@@ -0,0 +1,270 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+from typing import ClassVar, Optional, Self
+
+from .binary_model import BinaryModel
+from .buffer_reader import BufferReader
+from .buffer_writer import BufferWriter
+from .datatypes import IntegerCodec, StructLayout
+from .pex_file import PexFile
+from .pex_index import FunctionEntry, ObjectEntry, PexIndex, Span
+from .sections import Function, Property
+from .string_table import StringTable
+
+
+class PexPatcher:
+    """
+    Patches single sections of a PEX file without parsing and dumping the entire file.
+
+    Only the modified sections are encoded again, all other bytes are copied verbatim
+    and the sizes of the affected objects are fixed up.
+
+    Example:
+        >>> PexPatcher(Path("myscript.pex")).set_string(0, "MyScript").commit()
+    """
+
+    _SIZE_LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("size", IntegerCodec.IntType.UInt32)
+    )
+    """Layout of the size field of an object, behind its name index."""
+
+    path: Path
+    """The path to the PEX file."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path (Path): Path to the PEX file.
+        """
+
+        self.path = path
+
+        self.__load(path.read_bytes())
+
+    def __load(self, data: bytes) -> None:
+        self.__data: bytes = data
+        self.__index: PexIndex = PexFile.index_buffer(data)
+        self.__string_table: Optional[StringTable] = None
+        self.__patches: dict[Span, bytes] = {}
+
+    @property
+    def index(self) -> PexIndex:
+        """The index of the file as it was before the pending patches."""
+
+        return self.__index
+
+    @property
+    def string_table(self) -> StringTable:
+        """
+        The string table of the file. Modifications are written when the patches are
+        committed.
+        """
+
+        if self.__string_table is None:
+            reader = BufferReader(self.__index.string_table.view(self.__data))
+            string_count: int = reader.read_uint16()
+            self.__string_table = StringTable(reader.read_wstrings(string_count))
+
+        return self.__string_table
+
+    def set_string(self, index: int, string: str) -> Self:
+        """
+        Replaces a string of the string table.
+
+        Args:
+            index (int): Index of the string.
+            string (str): New string.
+
+        Returns:
+            Self: The patcher itself.
+        """
+
+        self.string_table[index] = string
+
+        return self
+
+    def get_property(self, object_index: int, property_index: int) -> Property:
+        """
+        Parses a single property of an object.
+
+        Args:
+            object_index (int): Index of the object.
+            property_index (int): Index of the property in the object.
+
+        Returns:
+            Property: The parsed property.
+        """
+
+        span: Span = self.__index.objects[object_index].properties[property_index].span
+
+        return Property.from_buffer(self.__get_bytes(span))
+
+    def set_property(
+        self, object_index: int, property_index: int, property: Property
+    ) -> Self:
+        """
+        Replaces a property of an object.
+
+        Args:
+            object_index (int): Index of the object.
+            property_index (int): Index of the property in the object.
+            property (Property): New property.
+
+        Returns:
+            Self: The patcher itself.
+        """
+
+        span: Span = self.__index.objects[object_index].properties[property_index].span
+
+        return self.__patch(span, property)
+
+    def set_property_flags(
+        self, object_index: int, property_index: int, flags: int
+    ) -> Self:
+        """
+        Changes the flags of a property.
+
+        Args:
+            object_index (int): Index of the object.
+            property_index (int): Index of the property in the object.
+            flags (int): New flags.
+
+        Raises:
+            ValueError:
+                If the flags require an auto variable or a handler that the property
+                does not have.
+
+        Returns:
+            Self: The patcher itself.
+        """
+
+        property: Property = self.get_property(object_index, property_index)
+        property.flags = flags
+
+        return self.set_property(object_index, property_index, property)
+
+    def get_function(
+        self, object_index: int, state_index: int, function_index: int
+    ) -> Function:
+        """
+        Parses a single function of a state.
+
+        Args:
+            object_index (int): Index of the object.
+            state_index (int): Index of the state in the object.
+            function_index (int): Index of the function in the state.
+
+        Returns:
+            Function: The parsed function.
+        """
+
+        entry: FunctionEntry = (
+            self.__index.objects[object_index]
+            .states[state_index]
+            .functions[function_index]
+        )
+
+        return Function.from_buffer(self.__get_bytes(entry.function))
+
+    def set_function(
+        self,
+        object_index: int,
+        state_index: int,
+        function_index: int,
+        function: Function,
+    ) -> Self:
+        """
+        Replaces a function of a state.
+
+        Args:
+            object_index (int): Index of the object.
+            state_index (int): Index of the state in the object.
+            function_index (int): Index of the function in the state.
+            function (Function): New function.
+
+        Returns:
+            Self: The patcher itself.
+        """
+
+        entry: FunctionEntry = (
+            self.__index.objects[object_index]
+            .states[state_index]
+            .functions[function_index]
+        )
+
+        return self.__patch(entry.function, function)
+
+    def __get_bytes(self, span: Span) -> bytes:
+        patch: Optional[bytes] = self.__patches.get(span)
+
+        return patch if patch is not None else bytes(span.view(self.__data))
+
+    def __patch(self, span: Span, model: BinaryModel) -> Self:
+        self.__patches[span] = model.to_bytes()
+
+        return self
+
+    def to_bytes(self) -> bytes:
+        """
+        Applies the pending patches to a copy of the file's data.
+
+        Returns:
+            bytes: The patched data.
+        """
+
+        patches: dict[Span, bytes] = dict(self.__patches)
+
+        if self.__string_table is not None:
+            writer = BufferWriter()
+            writer.write_uint16(len(self.__string_table))
+            for string in self.__string_table:
+                writer.write_wstring(string)
+            patches[self.__index.string_table] = writer.getvalue()
+
+        for object_entry in self.__index.objects:
+            self.__patch_object_size(object_entry, patches)
+
+        output = bytearray()
+        position: int = 0
+        for span in sorted(patches):
+            output += self.__data[position : span.offset]
+            output += patches[span]
+            position = span.end
+        output += self.__data[position:]
+
+        return bytes(output)
+
+    def __patch_object_size(
+        self, object_entry: ObjectEntry, patches: dict[Span, bytes]
+    ) -> None:
+        size_delta: int = sum(
+            len(data) - span.size
+            for span, data in patches.items()
+            if object_entry.data.offset <= span.offset < object_entry.data.end
+        )
+
+        if size_delta != 0:
+            # The size field follows the uint16 name index of the object
+            size_span = Span(object_entry.span.offset + 2, self._SIZE_LAYOUT.size)
+            size: int = BufferReader(size_span.view(self.__data)).read_uint32()
+
+            writer = BufferWriter()
+            writer.pack(self._SIZE_LAYOUT, (size + size_delta,))
+            patches[size_span] = writer.getvalue()
+
+    def commit(self, path: Optional[Path] = None) -> None:
+        """
+        Writes the patched file. Afterwards, the patcher continues on the patched data.
+
+        Args:
+            path (Optional[Path], optional):
+                Path to write to. Defaults to the path of the original file.
+        """
+
+        data: bytes = self.to_bytes()
+        (path or self.path).write_bytes(data)
+
+        self.__load(data)
@@ -2,11 +2,17 @@
 Copyright (c) Cutleast
 """
 
+from collections.abc import Buffer
+from pathlib import Path
 from typing import BinaryIO, Self, override
 
 from .binary_model import BinaryModel
+from .buffer_reader import BufferReader
+from .buffer_writer import BufferWriter
 from .datatypes import IntegerCodec, StringCodec
+from .pex_index import ObjectEntry, PexIndex, Span
 from .sections import DebugInfo, Header, Object, UserFlag
+from .string_table import StringTable
 
 
 class PexFile(BinaryModel):
@@ -17,7 +23,7 @@ class PexFile(BinaryModel):
     header: Header
     """The header of the PEX file."""
 
-    string_table: list[str]
+    string_table: StringTable
     """The string table of the PEX file."""
 
     debug_info: DebugInfo
@@ -31,27 +37,172 @@ class PexFile(BinaryModel):
 
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        header: Header = Header.parse(stream)
+    def parse(
+        cls,
+        stream: BinaryIO,
+        *,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> Self:
+        # A PEX file spans the rest of the stream, so it is read with a single call
+        with BufferReader.from_stream(
+            stream, validate=validate, lazy=lazy, compact=compact
+        ) as reader:
+            return cls.from_reader(reader)
 
-        string_count: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        string_table: list[str] = []
+    @classmethod
+    def from_path(
+        cls,
+        path: Path,
+        *,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> Self:
+        """
+        Parses a PEX file from a path, reading the whole file with a single call.
+
+        Args:
+            path (Path): Path to the PEX file.
+            validate (bool, optional):
+                Whether to validate the parsed models. Defaults to True.
+            lazy (bool, optional):
+                Whether to decode object data, function bodies and debug info lazily.
+                Defaults to False.
+            compact (bool, optional):
+                Whether to decode the instructions of functions into a `CompactCode`.
+                Defaults to False.
+
+        Returns:
+            Self: The parsed PEX file.
+        """
+
+        return cls.from_buffer(
+            path.read_bytes(), validate=validate, lazy=lazy, compact=compact
+        )
+
+    @staticmethod
+    def read_header(path: Path) -> Header:
+        """
+        Reads only the header of a PEX file without reading the rest of the file.
+
+        Args:
+            path (Path): Path to the PEX file.
+
+        Returns:
+            Header: The header of the PEX file.
+        """
+
+        with path.open("rb") as stream:
+            return Header.parse(stream)
+
+    @staticmethod
+    def read_strings(path: Path) -> StringTable:
+        """
+        Reads only the string table of a PEX file and stops reading right after it.
+
+        Args:
+            path (Path): Path to the PEX file.
+
+        Returns:
+            StringTable: The string table of the PEX file.
+        """
+
+        with path.open("rb") as stream:
+            Header.parse(stream)
+
+            string_count: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+            string_table = StringTable()
+            for _ in range(string_count):
+                string_table.append(
+                    StringCodec.parse(stream, StringCodec.StrType.WString)
+                )
+
+        return string_table
+
+    @classmethod
+    def read_index(cls, path: Path) -> PexIndex:
+        """
+        Reads a table of contents of a PEX file with the absolute byte offset and size
+        of each section, without building any models.
+
+        Args:
+            path (Path): Path to the PEX file.
+
+        Returns:
+            PexIndex: The table of contents of the PEX file.
+        """
+
+        return cls.index_buffer(path.read_bytes())
+
+    @staticmethod
+    def index_buffer(buffer: Buffer) -> PexIndex:
+        """
+        Reads a table of contents of a PEX file from a buffer, see `read_index()`.
+
+        Args:
+            buffer (Buffer): Buffer of the entire PEX file.
+
+        Returns:
+            PexIndex: The table of contents of the PEX file.
+        """
+
+        reader = BufferReader(buffer)
+
+        Header.from_reader(reader)
+        header = Span(0, reader.offset)
+
+        start: int = reader.offset
+        string_count: int = reader.read_uint16()
         for _ in range(string_count):
-            string_table.append(StringCodec.parse(stream, StringCodec.StrType.WString))
+            reader.skip(reader.read_uint16())
+        string_table = Span(start, reader.offset - start)
+
+        start = reader.offset
+        debug_functions: list[Span] = DebugInfo.index_from_reader(reader)
+        debug_info = Span(start, reader.offset - start)
+
+        start = reader.offset
+        user_flag_count: int = reader.read_uint16()
+        for _ in range(user_flag_count):
+            UserFlag.skip(reader)
+        user_flags = Span(start, reader.offset - start)
+
+        object_count: int = reader.read_uint16()
+        objects: list[ObjectEntry] = []
+        for _ in range(object_count):
+            objects.append(Object.index_from_reader(reader))
+
+        if reader.offset > len(reader):
+            raise EOFError(f"Offset {reader.offset} is beyond the end of the buffer!")
+
+        return PexIndex(
+            header, string_table, debug_info, debug_functions, user_flags, objects
+        )
+
+    @override
+    @classmethod
+    def from_reader(cls, reader: BufferReader) -> Self:
+        header: Header = Header.from_reader(reader)
+
+        string_count: int = reader.read_uint16()
+        string_table = StringTable(reader.read_wstrings(string_count))
 
-        debug_info: DebugInfo = DebugInfo.parse(stream)
+        debug_info: DebugInfo = DebugInfo.from_reader_lazy(reader)
 
-        user_flag_count: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        user_flag_count: int = reader.read_uint16()
         user_flags: list[UserFlag] = []
         for _ in range(user_flag_count):
-            user_flags.append(UserFlag.parse(stream))
+            user_flags.append(UserFlag.from_reader(reader))
 
-        object_count: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        object_count: int = reader.read_uint16()
         objects: list[Object] = []
         for _ in range(object_count):
-            objects.append(Object.parse(stream))
+            objects.append(Object.from_reader(reader))
 
-        return cls(
+        return cls._build(
+            reader.validate,
             header=header,
             string_table=string_table,
             debug_info=debug_info,
@@ -60,19 +211,19 @@ class PexFile(BinaryModel):
         )
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        self.header.dump(output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        self.header.to_writer(writer)
 
-        IntegerCodec.dump(len(self.string_table), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.string_table))
         for string in self.string_table:
-            StringCodec.dump(string, StringCodec.StrType.WString, output)
+            writer.write_wstring(string)
 
-        self.debug_info.dump(output)
+        self.debug_info.to_writer(writer)
 
-        IntegerCodec.dump(len(self.user_flags), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.user_flags))
         for user_flag in self.user_flags:
-            user_flag.dump(output)
+            user_flag.to_writer(writer)
 
-        IntegerCodec.dump(len(self.objects), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.objects))
         for object in self.objects:
-            object.dump(output)
+            object.to_writer(writer)
@@ -0,0 +1,132 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Buffer
+from typing import NamedTuple, Optional
+
+
+class Span(NamedTuple):
+    """
+    Region of a PEX file.
+    """
+
+    offset: int
+    """The absolute offset of the region in bytes."""
+
+    size: int
+    """The size of the region in bytes."""
+
+    @property
+    def end(self) -> int:
+        """The absolute offset right behind the region."""
+
+        return self.offset + self.size
+
+    def view(self, buffer: Buffer) -> memoryview:
+        """
+        Gets the bytes of the region from the buffer of the entire file without
+        copying them, for example to parse the region with `from_buffer()`.
+
+        Args:
+            buffer (Buffer): Buffer of the entire file.
+
+        Returns:
+            memoryview: View of the region.
+        """
+
+        return memoryview(buffer)[self.offset : self.end]
+
+
+class FunctionEntry(NamedTuple):
+    """
+    Index entry of a named function.
+    """
+
+    name_index: int
+    """Index(base 0) of the function's name into the string table."""
+
+    span: Span
+    """Region of the entire named function."""
+
+    function: Span
+    """Region of the function itself, without its name."""
+
+
+class PropertyEntry(NamedTuple):
+    """
+    Index entry of a property.
+    """
+
+    name_index: int
+    """Index(base 0) of the property's name into the string table."""
+
+    span: Span
+    """Region of the entire property."""
+
+    read_handler: Optional[Span]
+    """Region of the read handler function, if any."""
+
+    write_handler: Optional[Span]
+    """Region of the write handler function, if any."""
+
+
+class StateEntry(NamedTuple):
+    """
+    Index entry of a state.
+    """
+
+    name_index: int
+    """Index(base 0) of the state's name into the string table."""
+
+    span: Span
+    """Region of the entire state."""
+
+    functions: list[FunctionEntry]
+    """Entries of the state's functions."""
+
+
+class ObjectEntry(NamedTuple):
+    """
+    Index entry of an object.
+    """
+
+    name_index: int
+    """Index(base 0) of the object's name into the string table."""
+
+    span: Span
+    """Region of the entire object."""
+
+    data: Span
+    """Region of the object's data."""
+
+    properties: list[PropertyEntry]
+    """Entries of the object's properties."""
+
+    states: list[StateEntry]
+    """Entries of the object's states."""
+
+
+class PexIndex(NamedTuple):
+    """
+    Table of contents of a PEX file with the absolute byte offset and size of each
+    section, see `PexFile.read_index()`.
+    """
+
+    header: Span
+    """Region of the header."""
+
+    string_table: Span
+    """Region of the string table, including its count."""
+
+    debug_info: Span
+    """Region of the debug info."""
+
+    debug_functions: list[Span]
+    """Regions of the debug functions."""
+
+    user_flags: Span
+    """Region of the user flags, including their count."""
+
+    objects: list[ObjectEntry]
+    """Entries of the objects."""
@@ -0,0 +1,86 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Buffer
+from pathlib import Path
+
+from .buffer_reader import BufferReader
+from .pex_visitor import PexVisitor
+from .sections import DebugInfo, Header, Object, UserFlag
+
+
+class PexReader:
+    """
+    Streaming reader that walks a PEX file once and passes its contents to a
+    `PexVisitor`, without building a `PexFile`. Only the records that are passed to
+    the visitor are decoded into (short-lived) models, so memory usage does not grow
+    with the number of functions and instructions.
+
+    The debug info is skipped.
+
+    Example:
+        >>> class CallCollector(PexVisitor):
+        ...     def on_instruction(self, op, arguments):
+        ...         if op == Instruction.OpCode.CALLSTATIC:
+        ...             print(arguments[0].data, arguments[1].data)
+        >>> PexReader(CallCollector()).read_path(Path("myscript.pex"))
+    """
+
+    visitor: PexVisitor
+    """The visitor that is called."""
+
+    validate: bool
+    """Whether the records passed to the visitor are validated."""
+
+    def __init__(self, visitor: PexVisitor, *, validate: bool = False) -> None:
+        """
+        Args:
+            visitor (PexVisitor): Visitor to call.
+            validate (bool, optional):
+                Whether to validate the records passed to the visitor. Defaults to
+                False.
+        """
+
+        self.visitor = visitor
+        self.validate = validate
+
+    def read_path(self, path: Path) -> None:
+        """
+        Walks a PEX file from a path.
+
+        Args:
+            path (Path): Path to the PEX file.
+        """
+
+        self.read_buffer(path.read_bytes())
+
+    def read_buffer(self, buffer: Buffer) -> None:
+        """
+        Walks a PEX file from a buffer.
+
+        Args:
+            buffer (Buffer): Buffer of the entire PEX file.
+        """
+
+        reader = BufferReader(buffer, validate=self.validate)
+        visitor: PexVisitor = self.visitor
+
+        visitor.on_header(Header.from_reader(reader))
+
+        string_count: int = reader.read_uint16()
+        for index, string in enumerate(reader.read_wstrings(string_count)):
+            visitor.on_string(index, string)
+
+        DebugInfo.skip(reader)
+
+        user_flag_count: int = reader.read_uint16()
+        for _ in range(user_flag_count):
+            visitor.on_user_flag(UserFlag.from_reader(reader))
+
+        object_count: int = reader.read_uint16()
+        for _ in range(object_count):
+            Object.visit_from_reader(reader, visitor)
+
+        if reader.offset > len(reader):
+            raise EOFError(f"Offset {reader.offset} is beyond the end of the buffer!")
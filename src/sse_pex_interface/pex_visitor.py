@@ -0,0 +1,152 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from .sections import (
+        Header,
+        Instruction,
+        UserFlag,
+        Variable,
+        VariableData,
+        VariableType,
+    )
+
+
+class PexVisitor:
+    """
+    Base class for visitors of a `PexReader`. The reader walks a PEX file once and calls
+    the methods below in file order, without building a `PexFile`.
+
+    All methods do nothing by default, so subclasses only have to override the events
+    they are interested in. The values passed to them are only valid during the call
+    and should be copied if they are kept.
+    """
+
+    def on_header(self, header: "Header") -> None:
+        """
+        Called for the header of the file.
+
+        Args:
+            header (Header): The header.
+        """
+
+    def on_string(self, index: int, string: str) -> None:
+        """
+        Called for every string of the string table.
+
+        Args:
+            index (int): Index(base 0) of the string.
+            string (str): The string.
+        """
+
+    def on_user_flag(self, user_flag: "UserFlag") -> None:
+        """
+        Called for every user flag.
+
+        Args:
+            user_flag (UserFlag): The user flag.
+        """
+
+    def on_object_begin(
+        self, name: int, parent_class_name: int, auto_state_name: int
+    ) -> None:
+        """
+        Called at the start of every object, before its variables, properties and
+        states.
+
+        Args:
+            name (int): Index(base 0) of the object's name into the string table.
+            parent_class_name (int):
+                Index(base 0) of the parent class' name into the string table.
+            auto_state_name (int):
+                Index(base 0) of the auto state's name into the string table.
+        """
+
+    def on_object_end(self) -> None:
+        """
+        Called at the end of every object.
+        """
+
+    def on_variable(self, variable: "Variable") -> None:
+        """
+        Called for every variable of an object.
+
+        Args:
+            variable (Variable): The variable.
+        """
+
+    def on_property(self, name: int, type: int, flags: int) -> None:
+        """
+        Called for every property of an object. The read and write handlers of the
+        property follow, each announced by `on_property_handler()`.
+
+        Args:
+            name (int): Index(base 0) of the property's name into the string table.
+            type (int): Index(base 0) of the property's type into the string table.
+            flags (int): Flags of the property, see `Property.flags`.
+        """
+
+    def on_property_handler(self, name: int, handler: Literal["read", "write"]) -> None:
+        """
+        Called before the read or write handler of a property, which then follows as a
+        function named like the property.
+
+        Args:
+            name (int): Index(base 0) of the property's name into the string table.
+            handler (Literal["read", "write"]): Whether it is the read or write handler.
+        """
+
+    def on_state_begin(self, name: int) -> None:
+        """
+        Called at the start of every state, before its functions.
+
+        Args:
+            name (int):
+                Index(base 0) of the state's name into the string table, empty string
+                for the default state.
+        """
+
+    def on_state_end(self) -> None:
+        """
+        Called at the end of every state.
+        """
+
+    def on_function_begin(
+        self,
+        name: int,
+        return_type: int,
+        flags: int,
+        params: "list[VariableType]",
+        locals: "list[VariableType]",
+    ) -> None:
+        """
+        Called at the start of every function, before its instructions.
+
+        Args:
+            name (int): Index(base 0) of the function's name into the string table.
+            return_type (int):
+                Index(base 0) of the function's return type into the string table.
+            flags (int): Flags of the function, see `Function.flags`.
+            params (list[VariableType]): The parameter types.
+            locals (list[VariableType]): The local variable types.
+        """
+
+    def on_function_end(self) -> None:
+        """
+        Called at the end of every function.
+        """
+
+    def on_instruction(
+        self, op: "Instruction.OpCode", arguments: "list[VariableData]"
+    ) -> None:
+        """
+        Called for every instruction of a function.
+
+        Args:
+            op (Instruction.OpCode): The opcode.
+            arguments (list[VariableData]):
+                The arguments, including the count of variable arguments.
+        """
@@ -0,0 +1,259 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import Any, Literal, Optional
+
+from .binary_model import BinaryModel
+from .buffer_reader import BufferReader
+from .buffer_writer import BufferWriter
+from .sections import CompactCode
+
+type Operation = Literal["parse", "skip", "build", "dump"]
+"""
+The profiled operations: `parse` (`from_reader()`), `skip` (`skip()`), `build`
+(constructing and, unless trusted, validating a model) and `dump` (`to_writer()`).
+"""
+
+
+class SectionStats:
+    """
+    Statistics of one operation of one section class.
+    """
+
+    __slots__ = ("bytes", "calls", "own_time", "total_time")
+
+    calls: int
+    """The number of calls."""
+
+    total_time: float
+    """The time spent in the calls in seconds, including nested sections."""
+
+    own_time: float
+    """The time spent in the calls in seconds, excluding nested sections."""
+
+    bytes: int
+    """The number of bytes consumed (`parse`, `skip`) or written (`dump`)."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.own_time = 0.0
+        self.bytes = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"SectionStats(calls={self.calls}, total_time={self.total_time:.6f}, "
+            f"own_time={self.own_time:.6f}, bytes={self.bytes})"
+        )
+
+
+class ProfileStats:
+    """
+    Statistics recorded by `pex_profile()`, per section class and operation.
+    """
+
+    sections: dict[tuple[str, Operation], SectionStats]
+    """Statistics by section class name and operation."""
+
+    def __init__(self) -> None:
+        self.sections = {}
+
+    def get(self, section: str, operation: Operation) -> SectionStats:
+        """
+        Gets the statistics of an operation of a section class.
+
+        Args:
+            section (str): Name of the section class, for example `"Function"`.
+            operation (Operation): The operation.
+
+        Returns:
+            SectionStats:
+                The statistics. If nothing was recorded, all values are zero.
+        """
+
+        return self.sections.get((section, operation)) or SectionStats()
+
+    def format(self) -> str:
+        """
+        Formats the statistics as a table, sorted by own time.
+
+        Returns:
+            str: The formatted table.
+        """
+
+        lines: list[str] = [
+            (
+                f"{'section':<16} {'operation':<9} {'calls':>9} {'total ms':>10} "
+                f"{'own ms':>10} {'bytes':>10}"
+            )
+        ]
+        for (section, operation), stats in sorted(
+            self.sections.items(), key=lambda item: item[1].own_time, reverse=True
+        ):
+            lines.append(
+                f"{section:<16} {operation:<9} {stats.calls:>9} "
+                f"{stats.total_time * 1000:>10.2f} {stats.own_time * 1000:>10.2f} "
+                f"{stats.bytes:>10}"
+            )
+
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+class _Profiler:
+    """
+    Installs timing wrappers around the parse and dump methods of all section classes
+    and removes them again, so that nothing is measured (or slowed down) when
+    profiling is disabled.
+    """
+
+    stats: ProfileStats
+    __lock: threading.Lock
+    __local: threading.local
+    __originals: list[tuple[type, str, Any]]
+
+    def __init__(self) -> None:
+        self.stats = ProfileStats()
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__originals = []
+
+    def install(self) -> None:
+        methods: list[tuple[str, Operation]] = [
+            ("from_reader", "parse"),
+            ("skip", "skip"),
+            ("_build", "build"),
+        ]
+        for cls in _get_section_classes():
+            for name, operation in methods:
+                descriptor: Any = cls.__dict__.get(name)
+                if isinstance(descriptor, classmethod):
+                    self.__originals.append((cls, name, descriptor))
+                    setattr(
+                        cls,
+                        name,
+                        classmethod(self.__wrap(descriptor.__func__, operation)),
+                    )
+
+            function: Any = cls.__dict__.get("to_writer")
+            if callable(function):
+                self.__originals.append((cls, "to_writer", function))
+                cls.to_writer = self.__wrap(function, "dump")
+
+    def uninstall(self) -> None:
+        for cls, name, original in reversed(self.__originals):
+            setattr(cls, name, original)
+
+        self.__originals.clear()
+
+    def __wrap(
+        self, function: Callable[..., Any], operation: Operation
+    ) -> Callable[..., Any]:
+        local: threading.local = self.__local
+        lock: threading.Lock = self.__lock
+        sections: dict[tuple[str, Operation], SectionStats] = self.stats.sections
+
+        def wrapper(owner: Any, *args: Any, **kwargs: Any) -> Any:
+            # `owner` is the class for classmethods and the instance for `to_writer()`
+            section: str = (owner if isinstance(owner, type) else type(owner)).__name__
+            position: Optional[int] = _get_position(args)
+
+            # Time spent in nested sections is collected in a per-thread stack
+            stack: Optional[list[float]] = getattr(local, "stack", None)
+            if stack is None:
+                stack = local.stack = []
+            stack.append(0.0)
+            start: float = time.perf_counter()
+            try:
+                return function(owner, *args, **kwargs)
+            finally:
+                elapsed: float = time.perf_counter() - start
+                nested: float = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+
+                end_position: Optional[int] = _get_position(args)
+                with lock:
+                    stats: Optional[SectionStats] = sections.get((section, operation))
+                    if stats is None:
+                        stats = sections[(section, operation)] = SectionStats()
+
+                    stats.calls += 1
+                    stats.total_time += elapsed
+                    stats.own_time += elapsed - nested
+                    if position is not None and end_position is not None:
+                        stats.bytes += end_position - position
+
+        return wrapper
+
+
+def _get_section_classes() -> list[type[Any]]:
+    classes: list[type[Any]] = [CompactCode]
+    pending: list[type[Any]] = [BinaryModel]
+    while pending:
+        cls: type[Any] = pending.pop()
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+
+    return classes
+
+
+def _get_position(args: tuple[Any, ...]) -> Optional[int]:
+    if args:
+        if isinstance(args[0], BufferReader):
+            return args[0].offset
+        elif isinstance(args[0], BufferWriter):
+            return len(args[0])
+
+    return None
+
+
+_active_lock = threading.Lock()
+_active: bool = False
+
+
+@contextmanager
+def pex_profile() -> Generator[ProfileStats]:
+    """
+    Records the number of calls, the time and the number of bytes of parsing,
+    skipping, building and dumping per section class while the context is active.
+    This includes all threads.
+
+    When no profile is active, the parse and dump methods are not instrumented at all.
+    Only one profile can be active at a time.
+
+    Example:
+        >>> with pex_profile() as stats:
+        ...     PexFile.from_path(Path("myscript.pex"))
+        >>> print(stats)
+
+    Raises:
+        RuntimeError: If a profile is already active.
+
+    Yields:
+        ProfileStats: The recorded statistics, complete once the context is left.
+    """
+
+    global _active
+
+    with _active_lock:
+        if _active:
+            raise RuntimeError("A profile is already active!")
+
+        _active = True
+
+    profiler = _Profiler()
+    profiler.install()
+    try:
+        yield profiler.stats
+    finally:
+        profiler.uninstall()
+        with _active_lock:
+            _active = False
@@ -2,6 +2,7 @@
 Copyright (c) Cutleast
 """
 
+from .compact_code import CompactCode
 from .debug_function import DebugFunction
 from .debug_info import DebugInfo
 from .function import Function
@@ -18,6 +19,7 @@ from .variable_data import VariableData
 from .variable_type import VariableType
 
 __all__ = [
+    "CompactCode",
     "DebugFunction",
     "DebugInfo",
     "Function",
@@ -0,0 +1,271 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import struct
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from io import BytesIO
+from typing import Any, BinaryIO, Optional, Self, overload, override
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from .. import _codec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import FloatCodec
+from .instruction import Instruction, OpCodeSignature
+from .variable_data import VariableData
+
+_UINT32 = struct.Struct(">I")
+_FLOAT32 = struct.Struct(FloatCodec.FloatType.Float32.value[1])
+
+
+class CompactCode(Sequence[Instruction]):
+    """
+    Compact representation of the instructions of a function as parallel arrays
+    instead of one `Instruction` model with a `VariableData` model per argument.
+
+    The arguments are stored as their raw bits, so that they are dumped byte-identical.
+    Accessing an instruction by index creates an `Instruction` model on the fly, that
+    is not linked to the arrays. To modify the instructions, convert them to a list
+    first, for example with `function.instructions = list(function.instructions)`.
+    """
+
+    __slots__ = ("arg_starts", "arg_types", "arg_values", "ops")
+
+    ops: array[int]
+    """uint8: The opcode of each instruction."""
+
+    arg_starts: array[int]
+    """
+    uint32: Index of the first argument of each instruction in `arg_types` and
+    `arg_values`, followed by the total number of arguments.
+    """
+
+    arg_types: array[int]
+    """uint8: The `VariableData.Type` of each argument."""
+
+    arg_values: array[int]
+    """uint32: The raw bits of the data of each argument (0 for `NULL`)."""
+
+    def __init__(
+        self,
+        ops: array[int],
+        arg_starts: array[int],
+        arg_types: array[int],
+        arg_values: array[int],
+    ) -> None:
+        self.ops = ops
+        self.arg_starts = arg_starts
+        self.arg_types = arg_types
+        self.arg_values = arg_values
+
+    @classmethod
+    def from_reader(cls, reader: BufferReader, count: int) -> Self:
+        """
+        Decodes a run of instructions into arrays without creating any models.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            count (int): Number of instructions.
+
+        Raises:
+            ValueError: If an opcode or argument type is invalid.
+            EOFError: If the buffer ends before the last instruction.
+
+        Returns:
+            Self: The decoded instructions.
+        """
+
+        if not reader.buffered:
+            # The size of the run is unknown until it is decoded
+            return cls.from_instructions(
+                Instruction.from_reader(reader) for _ in range(count)
+            )
+
+        ops: list[int]
+        arg_starts: list[int]
+        arg_types: list[int]
+        arg_values: list[int]
+        try:
+            ops, arg_starts, arg_types, arg_values, reader.offset = (
+                _codec.decode_instructions(
+                    reader.buffer,
+                    reader.offset,
+                    count,
+                    Instruction.FIXED_ARG_COUNTS,
+                    Instruction.HAS_VARARGS,
+                )
+            )
+        except IndexError as ex:
+            raise EOFError(
+                f"Expected {count} instructions at offset {reader.offset}!"
+            ) from ex
+
+        return cls(
+            array("B", ops),
+            array("I", arg_starts),
+            array("B", arg_types),
+            array("I", arg_values),
+        )
+
+    @classmethod
+    def from_instructions(cls, instructions: Iterable[Instruction]) -> Self:
+        """
+        Creates the compact representation of a list of instructions.
+
+        Args:
+            instructions (Iterable[Instruction]): Instructions.
+
+        Returns:
+            Self: The compact instructions.
+        """
+
+        output = BytesIO()
+        count: int = 0
+        for instruction in instructions:
+            instruction.dump(output)
+            count += 1
+
+        return cls.from_reader(BufferReader(output.getvalue()), count)
+
+    def dump(self, output: BinaryIO) -> None:
+        """
+        Writes the instructions directly from the arrays to a stream of bytes.
+
+        Args:
+            output (BinaryIO): Byte stream to write to.
+        """
+
+        writer = BufferWriter()
+        self.to_writer(writer)
+        output.write(writer.buffer)
+
+    def to_writer(self, writer: BufferWriter) -> None:
+        """
+        Writes the instructions directly from the arrays to a buffer writer.
+
+        Args:
+            writer (BufferWriter): Writer to write to.
+        """
+
+        _codec.encode_instructions(
+            self.ops, self.arg_starts, self.arg_types, self.arg_values, writer.buffer
+        )
+
+    def get_op(self, index: int) -> Instruction.OpCode:
+        """
+        Gets the opcode of an instruction without creating its model.
+
+        Args:
+            index (int): Index of the instruction.
+
+        Returns:
+            Instruction.OpCode: The opcode.
+        """
+
+        return Instruction.OpCode(self.ops[index])
+
+    def __get_instruction(self, index: int) -> Instruction:
+        signature: Optional[OpCodeSignature[Instruction.OpCode]] = (
+            Instruction.OPCODE_TABLE[self.ops[index]]
+        )
+        assert signature is not None
+
+        start: int = self.arg_starts[index]
+        arguments: list[VariableData] = []
+        for arg_index in range(start, self.arg_starts[index + 1]):
+            # The vararg count is always read as a signed integer
+            integer_unsigned: bool = signature.integer_unsigned and not (
+                signature.has_varargs and arg_index - start == signature.fixed_arg_count
+            )
+            type = VariableData.Type(self.arg_types[arg_index])
+
+            arguments.append(
+                VariableData.model_construct(
+                    type=type,
+                    data=_decode_value(
+                        type, self.arg_values[arg_index], integer_unsigned
+                    ),
+                    integer_unsigned=integer_unsigned,
+                )
+            )
+
+        return Instruction.model_construct(op=signature.op, arguments=arguments)
+
+    @overload
+    def __getitem__(self, index: int) -> Instruction: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Instruction]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> Instruction | list[Instruction]:
+        if isinstance(index, slice):
+            return [self.__get_instruction(i) for i in range(len(self.ops))[index]]
+
+        return self.__get_instruction(range(len(self.ops))[index])
+
+    @override
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    @override
+    def __iter__(self) -> Iterator[Instruction]:
+        for index in range(len(self.ops)):
+            yield self.__get_instruction(index)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactCode):
+            return (
+                self.ops == other.ops
+                and self.arg_starts == other.arg_starts
+                and self.arg_types == other.arg_types
+                and self.arg_values == other.arg_values
+            )
+        elif isinstance(other, list):
+            return list(self) == other
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __repr__(self) -> str:
+        return f"CompactCode({list(self)!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: [instruction.model_dump() for instruction in value]
+            ),
+        )
+
+
+def _to_int32(value: int) -> int:
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def _decode_value(
+    type: VariableData.Type, value: int, integer_unsigned: bool
+) -> Optional[int | float]:
+    match type:
+        case VariableData.Type.NULL:
+            return None
+
+        case VariableData.Type.INTEGER:
+            return value if integer_unsigned else _to_int32(value)
+
+        case VariableData.Type.FLOAT:
+            # Decoded from the original bytes like `FloatCodec.FloatType.Float32`
+            return _FLOAT32.unpack(_UINT32.pack(value))[0]
+
+        case _:
+            return value
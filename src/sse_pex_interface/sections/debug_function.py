@@ -2,10 +2,13 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Literal, Self, override
+from array import array
+from typing import ClassVar, Literal, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout, UInt16Array
 
 
 class DebugFunction(BinaryModel):
@@ -25,32 +28,42 @@ class DebugFunction(BinaryModel):
     function_type: Literal[0, 1, 2, 3]
     """uint8: Function type."""
 
-    line_numbers: list[int]
+    line_numbers: UInt16Array
     """uint16[instruction_count]: Maps instructions to their original lines in the source."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("object_name_index", IntegerCodec.IntType.UInt16),
+        ("state_name_index", IntegerCodec.IntType.UInt16),
+        ("function_name_index", IntegerCodec.IntType.UInt16),
+        ("function_type", IntegerCodec.IntType.UInt8),
+        ("instruction_count", IntegerCodec.IntType.UInt16),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        object_name_index: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        state_name_index: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        function_name_index: int = IntegerCodec.parse(
-            stream, IntegerCodec.IntType.UInt16
-        )
-        function_type: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        object_name_index: int
+        state_name_index: int
+        function_name_index: int
+        function_type: int
+        instruction_count: int
+        (
+            object_name_index,
+            state_name_index,
+            function_name_index,
+            function_type,
+            instruction_count,
+        ) = reader.unpack(cls._LAYOUT)
 
-        instruction_count: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        line_numbers: list[int] = []
-        for _ in range(instruction_count):
-            line_numbers.append(IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16))
+        line_numbers: array[int] = reader.read_array(
+            IntegerCodec.IntType.UInt16, instruction_count
+        )
 
-        assert (
-            function_type == 0
-            or function_type == 1
-            or function_type == 2
-            or function_type == 3
-        ), f"Function type {function_type} not supported!"
+        if function_type > 3:
+            raise ValueError(f"Function type {function_type} not supported!")
 
-        return cls(
+        return cls._build(
+            reader.validate,
             object_name_index=object_name_index,
             state_name_index=state_name_index,
             function_name_index=function_name_index,
@@ -59,12 +72,22 @@ class DebugFunction(BinaryModel):
         )
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.object_name_index, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.state_name_index, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.function_name_index, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.function_type, IntegerCodec.IntType.UInt8, output)
-
-        IntegerCodec.dump(len(self.line_numbers), IntegerCodec.IntType.UInt16, output)
-        for line_number in self.line_numbers:
-            IntegerCodec.dump(line_number, IntegerCodec.IntType.UInt16, output)
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        reader.skip(cls._LAYOUT.size - 2)
+        instruction_count: int = reader.read_uint16()
+        reader.skip(instruction_count * 2)
+
+    @override
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.pack(
+            self._LAYOUT,
+            (
+                self.object_name_index,
+                self.state_name_index,
+                self.function_name_index,
+                self.function_type,
+                len(self.line_numbers),
+            ),
+        )
+        writer.write_array(self.line_numbers, IntegerCodec.IntType.UInt16)
@@ -2,10 +2,12 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Optional, Self, override
+from typing import Optional, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..pex_index import Span
 from .debug_function import DebugFunction
 
 
@@ -27,42 +29,82 @@ class DebugInfo(BinaryModel):
 
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        has_debug_info: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        has_debug_info: int = reader.read_uint8()
 
         modification_time: Optional[int] = None
         functions: Optional[list[DebugFunction]] = None
 
         if has_debug_info != 0:
-            modification_time = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt64)
+            modification_time = reader.read_uint64()
 
-            function_count: int = IntegerCodec.parse(
-                stream, IntegerCodec.IntType.UInt16
-            )
+            function_count: int = reader.read_uint16()
             functions = []
             for _ in range(function_count):
-                functions.append(DebugFunction.parse(stream))
+                functions.append(DebugFunction.from_reader(reader))
 
-        return cls(
+        return cls._build(
+            reader.validate,
             has_debug_info=has_debug_info,
             modification_time=modification_time,
             functions=functions,
         )
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.has_debug_info, IntegerCodec.IntType.UInt8, output)
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        has_debug_info: int = reader.read_uint8()
+
+        if has_debug_info != 0:
+            reader.skip(8)
+
+            function_count: int = reader.read_uint16()
+            for _ in range(function_count):
+                DebugFunction.skip(reader)
+
+    @classmethod
+    def index_from_reader(cls, reader: BufferReader) -> list[Span]:
+        """
+        Skips over the debug info and records where its functions are located.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+
+        Returns:
+            list[Span]: Regions of the debug functions.
+        """
+
+        functions: list[Span] = []
+        has_debug_info: int = reader.read_uint8()
+
+        if has_debug_info != 0:
+            reader.skip(8)
+
+            function_count: int = reader.read_uint16()
+            for _ in range(function_count):
+                start: int = reader.offset
+                DebugFunction.skip(reader)
+                functions.append(Span(start, reader.offset - start))
+
+        return functions
+
+    @override
+    def to_writer(self, writer: BufferWriter) -> None:
+        raw_data: Optional[bytes] = self.get_raw_data()
+        if raw_data is not None:
+            writer.write_bytes(raw_data)
+            return
+
+        writer.write_uint8(self.has_debug_info)
 
         if self.has_debug_info != 0:
             assert self.modification_time is not None
-            IntegerCodec.dump(
-                self.modification_time, IntegerCodec.IntType.UInt64, output
-            )
+            writer.write_uint64(self.modification_time)
 
             assert self.functions is not None
-            IntegerCodec.dump(len(self.functions), IntegerCodec.IntType.UInt16, output)
+            writer.write_uint16(len(self.functions))
             for function in self.functions:
-                function.dump(output)
+                function.to_writer(writer)
 
     @override
     def validate_model(self) -> None:
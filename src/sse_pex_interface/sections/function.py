@@ -2,11 +2,19 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+import hashlib
+from collections.abc import Callable, Sequence
+from typing import ClassVar, Optional, Self, cast, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout
+from ..pex_visitor import PexVisitor
+from ..string_table import StringTable
+from .compact_code import CompactCode
 from .instruction import Instruction
+from .variable_data import VariableData
 from .variable_type import VariableType
 
 
@@ -38,33 +46,49 @@ class Function(BinaryModel):
     locals: list[VariableType]
     """List of local variable types."""
 
-    instructions: list[Instruction]
-    """List of instructions."""
+    instructions: list[Instruction] | CompactCode
+    """
+    List of instructions or, if the function was parsed with `compact=True`, their
+    compact representation.
+    """
+
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("return_type", IntegerCodec.IntType.UInt16),
+        ("docstring", IntegerCodec.IntType.UInt16),
+        ("user_flags", IntegerCodec.IntType.UInt32),
+        ("flags", IntegerCodec.IntType.UInt8),
+    )
 
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        return_type: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        docstring: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        user_flags: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt32)
-        flags: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        return_type: int
+        docstring: int
+        user_flags: int
+        flags: int
+        return_type, docstring, user_flags, flags = reader.unpack(cls._LAYOUT)
 
-        num_params: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        num_params: int = reader.read_uint16()
         params: list[VariableType] = []
         for _ in range(num_params):
-            params.append(VariableType.parse(stream))
+            params.append(VariableType.from_reader(reader))
 
-        num_locals: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        num_locals: int = reader.read_uint16()
         locals: list[VariableType] = []
         for _ in range(num_locals):
-            locals.append(VariableType.parse(stream))
+            locals.append(VariableType.from_reader(reader))
 
-        num_instructions: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        instructions: list[Instruction] = []
-        for _ in range(num_instructions):
-            instructions.append(Instruction.parse(stream))
+        num_instructions: int = reader.read_uint16()
+        instructions: list[Instruction] | CompactCode
+        if reader.compact:
+            instructions = CompactCode.from_reader(reader, num_instructions)
+        else:
+            instructions = []
+            for _ in range(num_instructions):
+                instructions.append(Instruction.from_reader(reader))
 
-        return cls(
+        return cls._build(
+            reader.validate,
             return_type=return_type,
             docstring=docstring,
             user_flags=user_flags,
@@ -74,21 +98,216 @@ class Function(BinaryModel):
             instructions=instructions,
         )
 
+    @classmethod
+    def visit_from_reader(
+        cls, reader: BufferReader, visitor: PexVisitor, name: int
+    ) -> None:
+        """
+        Reads a function and passes it and its instructions to a visitor without
+        building a model.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            visitor (PexVisitor): Visitor to call.
+            name (int): Index(base 0) of the function's name into the string table.
+        """
+
+        return_type: int
+        flags: int
+        return_type, _, _, flags = reader.unpack(cls._LAYOUT)
+
+        num_params: int = reader.read_uint16()
+        params: list[VariableType] = []
+        for _ in range(num_params):
+            params.append(VariableType.from_reader(reader))
+
+        num_locals: int = reader.read_uint16()
+        locals: list[VariableType] = []
+        for _ in range(num_locals):
+            locals.append(VariableType.from_reader(reader))
+
+        visitor.on_function_begin(name, return_type, flags, params, locals)
+
+        num_instructions: int = reader.read_uint16()
+        for _ in range(num_instructions):
+            Instruction.visit_from_reader(reader, visitor)
+
+        visitor.on_function_end()
+
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.return_type, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.docstring, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.user_flags, IntegerCodec.IntType.UInt32, output)
-        IntegerCodec.dump(self.flags, IntegerCodec.IntType.UInt8, output)
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        reader.skip(cls._LAYOUT.size)
+
+        num_params: int = reader.read_uint16()
+        for _ in range(num_params):
+            VariableType.skip(reader)
+
+        num_locals: int = reader.read_uint16()
+        for _ in range(num_locals):
+            VariableType.skip(reader)
+
+        Instruction.skip_run(reader, reader.read_uint16())
+
+    def map_strings(self, map_index: Callable[[int], int]) -> Self:
+        """
+        Creates a copy of the function with all indices into the string table replaced,
+        for example to move it to a file with a different string table.
+
+        Args:
+            map_index (Callable[[int], int]):
+                Function that returns the new index of a string for its old index.
+
+        Returns:
+            Self: The copy of the function.
+        """
+
+        def map_argument(argument: VariableData) -> VariableData:
+            if argument.type not in (
+                VariableData.Type.IDENTIFIER,
+                VariableData.Type.STRING,
+            ):
+                return argument
+
+            return VariableData.model_construct(
+                type=argument.type,
+                data=map_index(cast(int, argument.data)),
+                integer_unsigned=argument.integer_unsigned,
+            )
+
+        def map_variable_type(variable_type: VariableType) -> VariableType:
+            return VariableType.model_construct(
+                name=map_index(variable_type.name), type=map_index(variable_type.type)
+            )
+
+        return self.model_copy(
+            update={
+                "return_type": map_index(self.return_type),
+                "docstring": map_index(self.docstring),
+                "params": [map_variable_type(param) for param in self.params],
+                "locals": [map_variable_type(local) for local in self.locals],
+                "instructions": [
+                    Instruction.model_construct(
+                        op=instruction.op,
+                        arguments=[
+                            map_argument(argument) for argument in instruction.arguments
+                        ],
+                    )
+                    for instruction in self.instructions
+                ],
+            }
+        )
+
+    def to_canonical_bytes(self, string_table: Sequence[str]) -> bytes:
+        """
+        Serializes the function independently of the string table of its file: The
+        strings it references are stored with it, in the order they are first used.
+        Identical functions have identical canonical bytes, regardless of where their
+        strings are located in the string tables of their files.
+
+        Args:
+            string_table (Sequence[str]): The string table of the function's file.
+
+        Returns:
+            bytes: The canonical bytes of the function.
+        """
+
+        strings: list[str] = []
+        local_indices: dict[str, int] = {}
+
+        def to_local_index(index: int) -> int:
+            string: str = string_table[index]
+            local_index: Optional[int] = local_indices.get(string)
+
+            if local_index is None:
+                local_index = local_indices[string] = len(strings)
+                strings.append(string)
+
+            return local_index
+
+        function: Function = self.map_strings(to_local_index)
+
+        writer = BufferWriter()
+        writer.write_uint16(len(strings))
+        for string in strings:
+            writer.write_wstring(string)
+        function.to_writer(writer)
+
+        return writer.getvalue()
+
+    @classmethod
+    def from_canonical_bytes(cls, data: bytes, string_table: StringTable) -> Self:
+        """
+        Parses a function from its canonical bytes (see `to_canonical_bytes()`) and
+        adds the strings it references to a string table, if they are missing.
+
+        Args:
+            data (bytes): The canonical bytes of the function.
+            string_table (StringTable): The string table of the target file.
+
+        Returns:
+            Self: The parsed function.
+        """
+
+        reader = BufferReader(data, validate=False)
+        strings: list[str] = reader.read_wstrings(reader.read_uint16())
+        function: Self = cls.from_reader(reader)
+
+        return function.map_strings(lambda index: string_table.intern(strings[index]))
+
+    def fingerprint(self, string_table: Sequence[str]) -> bytes:
+        """
+        Hashes the function with its string indices resolved, so that identical
+        functions have the same fingerprint in all files.
+
+        Args:
+            string_table (Sequence[str]): The string table of the function's file.
+
+        Returns:
+            bytes: The 16 bytes long fingerprint.
+        """
+
+        return Function.fingerprint_canonical_bytes(
+            self.to_canonical_bytes(string_table)
+        )
+
+    @staticmethod
+    def fingerprint_canonical_bytes(data: bytes) -> bytes:
+        """
+        Hashes the canonical bytes of a function (see `to_canonical_bytes()`).
+
+        Args:
+            data (bytes): The canonical bytes of the function.
+
+        Returns:
+            bytes: The 16 bytes long fingerprint.
+        """
+
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    @override
+    def to_writer(self, writer: BufferWriter) -> None:
+        raw_data: Optional[bytes] = self.get_raw_data()
+        if raw_data is not None:
+            writer.write_bytes(raw_data)
+            return
+
+        writer.pack(
+            self._LAYOUT,
+            (self.return_type, self.docstring, self.user_flags, self.flags),
+        )
 
-        IntegerCodec.dump(len(self.params), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.params))
         for param in self.params:
-            param.dump(output)
+            param.to_writer(writer)
 
-        IntegerCodec.dump(len(self.locals), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.locals))
         for local in self.locals:
-            local.dump(output)
+            local.to_writer(writer)
 
-        IntegerCodec.dump(len(self.instructions), IntegerCodec.IntType.UInt16, output)
-        for instruction in self.instructions:
-            instruction.dump(output)
+        writer.write_uint16(len(self.instructions))
+        if isinstance(self.instructions, CompactCode):
+            self.instructions.to_writer(writer)
+        else:
+            for instruction in self.instructions:
+                instruction.to_writer(writer)
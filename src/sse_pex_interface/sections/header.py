@@ -2,10 +2,12 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Literal, Self, override
+from typing import BinaryIO, ClassVar, Literal, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec, StringCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StringCodec, StructLayout
 
 
 class Header(BinaryModel):
@@ -37,24 +39,100 @@ class Header(BinaryModel):
     machinename: str
     """wstring: Machine name used to compile the script."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("magic", IntegerCodec.IntType.UInt32),
+        ("major_version", IntegerCodec.IntType.UInt8),
+        ("minor_version", IntegerCodec.IntType.UInt8),
+        ("game_id", IntegerCodec.IntType.UInt16),
+        ("compilation_time", IntegerCodec.IntType.UInt64),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        magic: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt32)
-        major_version: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
-        minor_version: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
-        game_id: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        compilation_time: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt64)
+    def parse(
+        cls,
+        stream: BinaryIO,
+        *,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> Self:
+        # The header is read field by field, so that nothing behind it is read from
+        # the stream. This keeps probing the headers of many files cheap.
+        magic: int
+        major_version: int
+        minor_version: int
+        game_id: int
+        compilation_time: int
+        magic, major_version, minor_version, game_id, compilation_time = (
+            cls._LAYOUT.parse(stream)
+        )
         source_file_name: str = StringCodec.parse(stream, StringCodec.StrType.WString)
         username: str = StringCodec.parse(stream, StringCodec.StrType.WString)
         machinename: str = StringCodec.parse(stream, StringCodec.StrType.WString)
 
-        assert magic == 0xFA57C0DE, "File format not supported!"
-        assert major_version == 3, "File format not supported!"
-        assert minor_version == 1 or minor_version == 2, "File format not supported!"
-        assert game_id == 1, "File format not supported!"
+        return cls._from_values(
+            validate,
+            magic,
+            major_version,
+            minor_version,
+            game_id,
+            compilation_time,
+            source_file_name,
+            username,
+            machinename,
+        )
+
+    @override
+    @classmethod
+    def from_reader(cls, reader: BufferReader) -> Self:
+        magic: int
+        major_version: int
+        minor_version: int
+        game_id: int
+        compilation_time: int
+        magic, major_version, minor_version, game_id, compilation_time = reader.unpack(
+            cls._LAYOUT
+        )
+        source_file_name: str = reader.read_wstring()
+        username: str = reader.read_wstring()
+        machinename: str = reader.read_wstring()
+
+        return cls._from_values(
+            reader.validate,
+            magic,
+            major_version,
+            minor_version,
+            game_id,
+            compilation_time,
+            source_file_name,
+            username,
+            machinename,
+        )
 
-        return cls(
+    @classmethod
+    def _from_values(
+        cls,
+        validate: bool,
+        magic: int,
+        major_version: int,
+        minor_version: int,
+        game_id: int,
+        compilation_time: int,
+        source_file_name: str,
+        username: str,
+        machinename: str,
+    ) -> Self:
+        if (
+            magic != 0xFA57C0DE
+            or major_version != 3
+            or (minor_version != 1 and minor_version != 2)
+            or game_id != 1
+        ):
+            raise ValueError("File format not supported!")
+
+        return cls._build(
+            validate,
             magic=magic,
             major_version=major_version,
             minor_version=minor_version,
@@ -66,12 +144,17 @@ class Header(BinaryModel):
         )
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.magic, IntegerCodec.IntType.UInt32, output)
-        IntegerCodec.dump(self.major_version, IntegerCodec.IntType.UInt8, output)
-        IntegerCodec.dump(self.minor_version, IntegerCodec.IntType.UInt8, output)
-        IntegerCodec.dump(self.game_id, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.compilation_time, IntegerCodec.IntType.UInt64, output)
-        StringCodec.dump(self.source_file_name, StringCodec.StrType.WString, output)
-        StringCodec.dump(self.username, StringCodec.StrType.WString, output)
-        StringCodec.dump(self.machinename, StringCodec.StrType.WString, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.pack(
+            self._LAYOUT,
+            (
+                self.magic,
+                self.major_version,
+                self.minor_version,
+                self.game_id,
+                self.compilation_time,
+            ),
+        )
+        writer.write_wstring(self.source_file_name)
+        writer.write_wstring(self.username)
+        writer.write_wstring(self.machinename)
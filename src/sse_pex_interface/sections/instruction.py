@@ -3,13 +3,57 @@ Copyright (c) Cutleast
 """
 
 from enum import IntEnum
-from typing import BinaryIO, Self, cast, override
+from typing import ClassVar, NamedTuple, Optional, Self, cast, override
 
+from .. import _codec
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..pex_visitor import PexVisitor
 from .variable_data import VariableData
 
 
+class OpCodeSignature[T: IntEnum](NamedTuple):
+    """
+    Argument signature of an opcode.
+    """
+
+    op: T
+    """The opcode."""
+
+    fixed_arg_count: int
+    """The number of fixed arguments."""
+
+    has_varargs: bool
+    """Whether the fixed arguments are followed by a count and variable arguments."""
+
+    integer_unsigned: bool
+    """Whether integer arguments are interpreted as unsigned."""
+
+
+def _build_opcode_table[T: IntEnum](
+    signatures: dict[T, tuple[int, bool, bool]],
+) -> tuple[Optional[OpCodeSignature[T]], ...]:
+    """
+    Builds a table that maps every possible opcode byte to its signature.
+
+    Args:
+        signatures (dict[T, tuple[int, bool, bool]]):
+            Number of fixed arguments, whether there are varargs and whether integer
+            arguments are unsigned for each opcode.
+
+    Returns:
+        tuple[Optional[OpCodeSignature[T]], ...]:
+            Signature for each opcode byte or None if the byte is no valid opcode.
+    """
+
+    table: list[Optional[OpCodeSignature[T]]] = [None] * 256
+    for op, signature in signatures.items():
+        table[op] = OpCodeSignature(op, *signature)
+
+    return tuple(table)
+
+
 class Instruction(BinaryModel):
     """
     Model representing an instruction of a PEX file.
@@ -132,97 +176,189 @@ class Instruction(BinaryModel):
     arguments: list[VariableData]
     """Arguments. Length is dependen on opcode, also varargs."""
 
+    _SIGNATURES: ClassVar[dict[OpCode, tuple[int, bool, bool]]] = {
+        OpCode.NOP: (0, False, False),
+        OpCode.IADD: (3, False, False),
+        OpCode.FADD: (3, False, False),
+        OpCode.ISUB: (3, False, False),
+        OpCode.FSUB: (3, False, False),
+        OpCode.IMUL: (3, False, False),
+        OpCode.FMUL: (3, False, False),
+        OpCode.IDIV: (3, False, False),
+        OpCode.FDIV: (3, False, False),
+        OpCode.IMOD: (3, False, False),
+        OpCode.NOT: (2, False, False),
+        OpCode.INEG: (2, False, False),
+        OpCode.FNEG: (2, False, False),
+        OpCode.ASSIGN: (2, False, False),
+        OpCode.CAST: (2, False, False),
+        OpCode.CMP_EQ: (3, False, False),
+        OpCode.CMP_LT: (3, False, False),
+        OpCode.CMP_LE: (3, False, False),
+        OpCode.CMP_GT: (3, False, False),
+        OpCode.CMP_GE: (3, False, False),
+        OpCode.JMP: (1, False, False),
+        OpCode.JMPT: (2, False, False),
+        OpCode.JMPF: (2, False, False),
+        OpCode.CALLMETHOD: (3, True, False),
+        OpCode.CALLPARENT: (2, True, False),
+        OpCode.CALLSTATIC: (3, True, False),
+        OpCode.RETURN: (1, False, False),
+        OpCode.STRCAT: (3, False, False),
+        OpCode.PROPGET: (3, False, False),
+        OpCode.PROPSET: (3, False, False),
+        OpCode.ARRAY_CREATE: (2, False, True),
+        OpCode.ARRAY_LENGTH: (2, False, False),
+        OpCode.ARRAY_GETELEMENT: (3, False, False),
+        OpCode.ARRAY_SETELEMENT: (3, False, False),
+        OpCode.ARRAY_FINDELEMENT: (4, False, False),
+        OpCode.ARRAY_RFINDELEMENT: (4, False, False),
+    }
+    """
+    Number of fixed arguments, whether there are varargs and whether integer arguments
+    are unsigned for each opcode.
+    """
+
+    OPCODE_TABLE: ClassVar[tuple[Optional[OpCodeSignature[OpCode]], ...]] = (
+        _build_opcode_table(_SIGNATURES)
+    )
+    """Signature for each opcode byte, built once from `_SIGNATURES`."""
+
+    FIXED_ARG_COUNTS: ClassVar[tuple[int, ...]] = tuple(
+        -1 if signature is None else signature.fixed_arg_count
+        for signature in OPCODE_TABLE
+    )
+    """Number of fixed arguments for each opcode byte, -1 for invalid opcodes."""
+
+    HAS_VARARGS: ClassVar[tuple[bool, ...]] = tuple(
+        signature is not None and signature.has_varargs for signature in OPCODE_TABLE
+    )
+    """Whether each opcode byte has varargs."""
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        op: Instruction.OpCode = Instruction.OpCode(
-            IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
-        )
-
-        arguments: list[VariableData] = []
-
-        fixed_arg_count: int = 0
-        has_varargs: bool = False
-        integer_unsigned: bool = False
-        """if variable data of type integer should be interpreted as unsigned"""
-
-        match op:
-            case Instruction.OpCode.NOP:
-                pass
-
-            case (
-                Instruction.OpCode.IADD
-                | Instruction.OpCode.FADD
-                | Instruction.OpCode.ISUB
-                | Instruction.OpCode.FSUB
-                | Instruction.OpCode.IMUL
-                | Instruction.OpCode.FMUL
-                | Instruction.OpCode.IDIV
-                | Instruction.OpCode.FDIV
-                | Instruction.OpCode.IMOD
-                | Instruction.OpCode.CMP_EQ
-                | Instruction.OpCode.CMP_LT
-                | Instruction.OpCode.CMP_LE
-                | Instruction.OpCode.CMP_GT
-                | Instruction.OpCode.CMP_GE
-                | Instruction.OpCode.STRCAT
-                | Instruction.OpCode.PROPGET
-                | Instruction.OpCode.PROPSET
-                | Instruction.OpCode.ARRAY_GETELEMENT
-                | Instruction.OpCode.ARRAY_SETELEMENT
-            ):
-                fixed_arg_count = 3
-
-            case (
-                Instruction.OpCode.NOT
-                | Instruction.OpCode.INEG
-                | Instruction.OpCode.FNEG
-                | Instruction.OpCode.ASSIGN
-                | Instruction.OpCode.CAST
-                | Instruction.OpCode.JMPT
-                | Instruction.OpCode.JMPF
-            ):
-                fixed_arg_count = 2
-
-            case Instruction.OpCode.JMP | Instruction.OpCode.RETURN:
-                fixed_arg_count = 1
-
-            case Instruction.OpCode.CALLMETHOD | Instruction.OpCode.CALLSTATIC:
-                fixed_arg_count = 3
-                has_varargs = True
-
-            case Instruction.OpCode.CALLPARENT:
-                fixed_arg_count = 2
-                has_varargs = True
-
-            case Instruction.OpCode.ARRAY_CREATE | Instruction.OpCode.ARRAY_LENGTH:
-                fixed_arg_count = 2
-
-                if op == Instruction.OpCode.ARRAY_CREATE:
-                    integer_unsigned = True
-
-            case (
-                Instruction.OpCode.ARRAY_FINDELEMENT
-                | Instruction.OpCode.ARRAY_RFINDELEMENT
-            ):
-                fixed_arg_count = 4
-
-        for _ in range(fixed_arg_count):
-            arguments.append(VariableData.parse(stream, integer_unsigned))
-
-        if has_varargs:
-            vararg_count: VariableData = VariableData.parse(stream)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        op: Instruction.OpCode
+        arguments: list[VariableData]
+        op, arguments = cls._read_values(reader)
+
+        return cls._build(reader.validate, op=op, arguments=arguments)
+
+    @classmethod
+    def visit_from_reader(cls, reader: BufferReader, visitor: PexVisitor) -> None:
+        """
+        Reads an instruction and passes it to a visitor without building a model.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            visitor (PexVisitor): Visitor to call.
+        """
+
+        visitor.on_instruction(*cls._read_values(reader))
+
+    @classmethod
+    def _read_values(cls, reader: BufferReader) -> tuple[OpCode, list[VariableData]]:
+        """
+        Reads the opcode and the arguments of an instruction.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+
+        Returns:
+            tuple[OpCode, list[VariableData]]: The opcode and the arguments.
+        """
+
+        signature: OpCodeSignature[Instruction.OpCode] = cls._read_signature(reader)
+        integer_unsigned: bool = signature.integer_unsigned
+        read_argument = VariableData.from_reader
+
+        arguments: list[VariableData] = [
+            read_argument(reader, integer_unsigned)
+            for _ in range(signature.fixed_arg_count)
+        ]
+
+        if signature.has_varargs:
+            vararg_count: VariableData = read_argument(reader)
             arguments.append(vararg_count)
 
             count: int = cast(int, vararg_count.data)
             for _ in range(count):
-                arguments.append(VariableData.parse(stream, integer_unsigned))
+                arguments.append(read_argument(reader, integer_unsigned))
+
+        return signature.op, arguments
+
+    @override
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        signature: OpCodeSignature[Instruction.OpCode] = cls._read_signature(reader)
+
+        for _ in range(signature.fixed_arg_count):
+            VariableData.skip(reader)
+
+        if signature.has_varargs:
+            count: int = cast(int, VariableData.from_reader(reader).data)
+            for _ in range(count):
+                VariableData.skip(reader)
+
+    @classmethod
+    def skip_run(cls, reader: BufferReader, count: int) -> None:
+        """
+        Skips over a run of instructions without decoding their arguments.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+            count (int): Number of instructions.
+
+        Raises:
+            ValueError: If an opcode or argument type is invalid.
+            EOFError: If the buffer ends before the last instruction.
+        """
+
+        if not reader.buffered:
+            # The size of the run is unknown until it is decoded
+            for _ in range(count):
+                cls.skip(reader)
+            return
+
+        try:
+            reader.offset = _codec.skip_instructions(
+                reader.buffer,
+                reader.offset,
+                count,
+                cls.FIXED_ARG_COUNTS,
+                cls.HAS_VARARGS,
+            )
+        except IndexError as ex:
+            raise EOFError(
+                f"Expected {count} instructions at offset {reader.offset}!"
+            ) from ex
+
+    @classmethod
+    def _read_signature(cls, reader: BufferReader) -> OpCodeSignature[OpCode]:
+        """
+        Reads an opcode and looks up its signature.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+
+        Raises:
+            ValueError: If the opcode is invalid.
+
+        Returns:
+            OpCodeSignature[OpCode]: The signature of the opcode.
+        """
+
+        op: int = reader.read_uint8()
+        signature: Optional[OpCodeSignature[Instruction.OpCode]] = cls.OPCODE_TABLE[op]
+
+        if signature is None:
+            raise ValueError(f"{op} is not a valid Instruction.OpCode")
 
-        return cls(op=op, arguments=arguments)
+        return signature
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.op, IntegerCodec.IntType.UInt8, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.write_uint8(self.op)
 
         for argument in self.arguments:
-            argument.dump(output)
+            argument.to_writer(writer)
@@ -2,10 +2,13 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+from typing import Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..pex_index import FunctionEntry, Span
+from ..pex_visitor import PexVisitor
 from .function import Function
 
 
@@ -22,14 +25,52 @@ class NamedFunction(BinaryModel):
 
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        function_name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        function: Function = Function.parse(stream)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        function_name: int = reader.read_uint16()
+        function: Function = Function.from_reader_lazy(reader)
 
-        return cls(function_name=function_name, function=function)
+        return cls._build(
+            reader.validate, function_name=function_name, function=function
+        )
+
+    @classmethod
+    def index_from_reader(cls, reader: BufferReader) -> FunctionEntry:
+        """
+        Skips over a named function and records where it is located.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+
+        Returns:
+            FunctionEntry: Index entry of the named function.
+        """
+
+        start: int = reader.offset
+        function_name: int = reader.read_uint16()
+        function_start: int = reader.offset
+        Function.skip(reader)
+
+        return FunctionEntry(
+            function_name,
+            Span(start, reader.offset - start),
+            Span(function_start, reader.offset - function_start),
+        )
+
+    @classmethod
+    def visit_from_reader(cls, reader: BufferReader, visitor: PexVisitor) -> None:
+        """
+        Reads a named function and passes it to a visitor without building a model.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            visitor (PexVisitor): Visitor to call.
+        """
+
+        function_name: int = reader.read_uint16()
+        Function.visit_from_reader(reader, visitor, function_name)
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.function_name, IntegerCodec.IntType.UInt16, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.write_uint16(self.function_name)
 
-        self.function.dump(output)
+        self.function.to_writer(writer)
@@ -2,10 +2,14 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+from typing import ClassVar, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout
+from ..pex_index import ObjectEntry, PropertyEntry, Span, StateEntry
+from ..pex_visitor import PexVisitor
 from .object_data import ObjectData
 
 
@@ -18,22 +22,89 @@ class Object(BinaryModel):
     """uint16: Index(base 0) into string table."""
 
     size: int
-    """uint32: Size of the following data block."""
+    """
+    uint32: Size of the following data block. This is recomputed from the data when
+    the object is dumped.
+    """
 
     data: ObjectData
     """bytes[size-4]: Object data. Size includes itself for some reason, hence size-4."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("name_index", IntegerCodec.IntType.UInt16),
+        ("size", IntegerCodec.IntType.UInt32),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        name_index: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        size: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt32)
-        data: ObjectData = ObjectData.parse(stream)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        name_index: int
+        size: int
+        name_index, size = reader.unpack(cls._LAYOUT)
+
+        data: ObjectData
+        if reader.lazy:
+            data = ObjectData.from_raw_data(
+                reader.read_bytes(size - 4),
+                validate=reader.validate,
+                compact=reader.compact,
+            )
+        else:
+            data = ObjectData.from_reader(reader)
+
+        return cls._build(reader.validate, name_index=name_index, size=size, data=data)
+
+    @classmethod
+    def index_from_reader(cls, reader: BufferReader) -> ObjectEntry:
+        """
+        Skips over an object and records where it and its contents are located.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+
+        Returns:
+            ObjectEntry: Index entry of the object.
+        """
 
-        return cls(name_index=name_index, size=size, data=data)
+        start: int = reader.offset
+        name_index: int
+        name_index, _ = reader.unpack(cls._LAYOUT)
+
+        data_start: int = reader.offset
+        properties: list[PropertyEntry]
+        states: list[StateEntry]
+        properties, states = ObjectData.index_from_reader(reader)
+
+        return ObjectEntry(
+            name_index,
+            Span(start, reader.offset - start),
+            Span(data_start, reader.offset - data_start),
+            properties,
+            states,
+        )
+
+    @classmethod
+    def visit_from_reader(cls, reader: BufferReader, visitor: PexVisitor) -> None:
+        """
+        Reads an object and passes its contents to a visitor without building a
+        model.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            visitor (PexVisitor): Visitor to call.
+        """
+
+        name_index: int
+        name_index, _ = reader.unpack(cls._LAYOUT)
+
+        ObjectData.visit_from_reader(reader, visitor, name_index)
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.name_index, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.size, IntegerCodec.IntType.UInt32, output)
-        self.data.dump(output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        start: int = len(writer)
+        writer.pack(self._LAYOUT, (self.name_index, 0))
+        self.data.to_writer(writer)
+
+        # The size includes the size field itself but not the name index
+        size: int = len(writer) - start - 2
+        writer.pack_into(self._LAYOUT, start, (self.name_index, size))
@@ -2,10 +2,14 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+from typing import ClassVar, Optional, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout
+from ..pex_index import PropertyEntry, StateEntry
+from ..pex_visitor import PexVisitor
 from .property import Property
 from .state import State
 from .variable import Variable
@@ -37,30 +41,41 @@ class ObjectData(BinaryModel):
     states: list[State]
     """List of states."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("parent_class_name", IntegerCodec.IntType.UInt16),
+        ("docstring", IntegerCodec.IntType.UInt16),
+        ("user_flags", IntegerCodec.IntType.UInt32),
+        ("auto_state_name", IntegerCodec.IntType.UInt16),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        parent_class_name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        docstring: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        user_flags: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt32)
-        auto_state_name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        parent_class_name: int
+        docstring: int
+        user_flags: int
+        auto_state_name: int
+        parent_class_name, docstring, user_flags, auto_state_name = reader.unpack(
+            cls._LAYOUT
+        )
 
-        num_variables: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        num_variables: int = reader.read_uint16()
         variables: list[Variable] = []
         for _ in range(num_variables):
-            variables.append(Variable.parse(stream))
+            variables.append(Variable.from_reader(reader))
 
-        num_properties: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        num_properties: int = reader.read_uint16()
         properties: list[Property] = []
         for _ in range(num_properties):
-            properties.append(Property.parse(stream))
+            properties.append(Property.from_reader(reader))
 
-        num_states: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        num_states: int = reader.read_uint16()
         states: list[State] = []
         for _ in range(num_states):
-            states.append(State.parse(stream))
+            states.append(State.from_reader(reader))
 
-        return cls(
+        return cls._build(
+            reader.validate,
             parent_class_name=parent_class_name,
             docstring=docstring,
             user_flags=user_flags,
@@ -70,21 +85,99 @@ class ObjectData(BinaryModel):
             states=states,
         )
 
+    @classmethod
+    def index_from_reader(
+        cls, reader: BufferReader
+    ) -> tuple[list[PropertyEntry], list[StateEntry]]:
+        """
+        Skips over the data of an object and records where its properties and states
+        are located.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+
+        Returns:
+            tuple[list[PropertyEntry], list[StateEntry]]:
+                Index entries of the properties and states.
+        """
+
+        reader.skip(cls._LAYOUT.size)
+
+        num_variables: int = reader.read_uint16()
+        for _ in range(num_variables):
+            Variable.skip(reader)
+
+        num_properties: int = reader.read_uint16()
+        properties: list[PropertyEntry] = []
+        for _ in range(num_properties):
+            properties.append(Property.index_from_reader(reader))
+
+        num_states: int = reader.read_uint16()
+        states: list[StateEntry] = []
+        for _ in range(num_states):
+            states.append(State.index_from_reader(reader))
+
+        return properties, states
+
+    @classmethod
+    def visit_from_reader(
+        cls, reader: BufferReader, visitor: PexVisitor, name: int
+    ) -> None:
+        """
+        Reads the data of an object and passes it and its contents to a visitor
+        without building a model.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            visitor (PexVisitor): Visitor to call.
+            name (int): Index(base 0) of the object's name into the string table.
+        """
+
+        parent_class_name: int
+        auto_state_name: int
+        parent_class_name, _, _, auto_state_name = reader.unpack(cls._LAYOUT)
+
+        visitor.on_object_begin(name, parent_class_name, auto_state_name)
+
+        num_variables: int = reader.read_uint16()
+        for _ in range(num_variables):
+            visitor.on_variable(Variable.from_reader(reader))
+
+        num_properties: int = reader.read_uint16()
+        for _ in range(num_properties):
+            Property.visit_from_reader(reader, visitor)
+
+        num_states: int = reader.read_uint16()
+        for _ in range(num_states):
+            State.visit_from_reader(reader, visitor)
+
+        visitor.on_object_end()
+
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.parent_class_name, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.docstring, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.user_flags, IntegerCodec.IntType.UInt32, output)
-        IntegerCodec.dump(self.auto_state_name, IntegerCodec.IntType.UInt16, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        raw_data: Optional[bytes] = self.get_raw_data()
+        if raw_data is not None:
+            writer.write_bytes(raw_data)
+            return
+
+        writer.pack(
+            self._LAYOUT,
+            (
+                self.parent_class_name,
+                self.docstring,
+                self.user_flags,
+                self.auto_state_name,
+            ),
+        )
 
-        IntegerCodec.dump(len(self.variables), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.variables))
         for variable in self.variables:
-            variable.dump(output)
+            variable.to_writer(writer)
 
-        IntegerCodec.dump(len(self.properties), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.properties))
         for property in self.properties:
-            property.dump(output)
+            property.to_writer(writer)
 
-        IntegerCodec.dump(len(self.states), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.states))
         for state in self.states:
-            state.dump(output)
+            state.to_writer(writer)
@@ -2,10 +2,14 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Optional, Self, override
+from typing import ClassVar, Optional, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout
+from ..pex_index import PropertyEntry, Span
+from ..pex_visitor import PexVisitor
 from .function import Function
 
 
@@ -47,29 +51,39 @@ class Property(BinaryModel):
     write_handler: Optional[Function]
     """Function, present if `(flags & 6) == 2`."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("name", IntegerCodec.IntType.UInt16),
+        ("type", IntegerCodec.IntType.UInt16),
+        ("docstring", IntegerCodec.IntType.UInt16),
+        ("user_flags", IntegerCodec.IntType.UInt32),
+        ("flags", IntegerCodec.IntType.UInt8),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        type: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        docstring: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        user_flags: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt32)
-        flags: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        name: int
+        type: int
+        docstring: int
+        user_flags: int
+        flags: int
+        name, type, docstring, user_flags, flags = reader.unpack(cls._LAYOUT)
 
         auto_var_name: Optional[int] = None
         read_handler: Optional[Function] = None
         write_handler: Optional[Function] = None
 
         if (flags & 4) != 0:
-            auto_var_name = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+            auto_var_name = reader.read_uint16()
 
         if (flags & 5) == 1:
-            read_handler = Function.parse(stream)
+            read_handler = Function.from_reader_lazy(reader)
 
         if (flags & 6) == 2:
-            write_handler = Function.parse(stream)
+            write_handler = Function.from_reader_lazy(reader)
 
-        return cls(
+        return cls._build(
+            reader.validate,
             name=name,
             type=type,
             docstring=docstring,
@@ -80,25 +94,90 @@ class Property(BinaryModel):
             write_handler=write_handler,
         )
 
+    @classmethod
+    def index_from_reader(cls, reader: BufferReader) -> PropertyEntry:
+        """
+        Skips over a property and records where it and its handlers are located.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+
+        Returns:
+            PropertyEntry: Index entry of the property.
+        """
+
+        start: int = reader.offset
+        name: int
+        flags: int
+        name, _, _, _, flags = reader.unpack(cls._LAYOUT)
+
+        read_handler: Optional[Span] = None
+        write_handler: Optional[Span] = None
+
+        if (flags & 4) != 0:
+            reader.skip(2)
+
+        if (flags & 5) == 1:
+            handler_start: int = reader.offset
+            Function.skip(reader)
+            read_handler = Span(handler_start, reader.offset - handler_start)
+
+        if (flags & 6) == 2:
+            handler_start = reader.offset
+            Function.skip(reader)
+            write_handler = Span(handler_start, reader.offset - handler_start)
+
+        return PropertyEntry(
+            name, Span(start, reader.offset - start), read_handler, write_handler
+        )
+
+    @classmethod
+    def visit_from_reader(cls, reader: BufferReader, visitor: PexVisitor) -> None:
+        """
+        Reads a property and passes it and its handlers to a visitor without building
+        a model.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            visitor (PexVisitor): Visitor to call.
+        """
+
+        name: int
+        type: int
+        flags: int
+        name, type, _, _, flags = reader.unpack(cls._LAYOUT)
+
+        visitor.on_property(name, type, flags)
+
+        if (flags & 4) != 0:
+            reader.skip(2)
+
+        if (flags & 5) == 1:
+            visitor.on_property_handler(name, "read")
+            Function.visit_from_reader(reader, visitor, name)
+
+        if (flags & 6) == 2:
+            visitor.on_property_handler(name, "write")
+            Function.visit_from_reader(reader, visitor, name)
+
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.name, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.type, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.docstring, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.user_flags, IntegerCodec.IntType.UInt32, output)
-        IntegerCodec.dump(self.flags, IntegerCodec.IntType.UInt8, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.pack(
+            self._LAYOUT,
+            (self.name, self.type, self.docstring, self.user_flags, self.flags),
+        )
 
         if (self.flags & 4) != 0:
             assert self.auto_var_name is not None
-            IntegerCodec.dump(self.auto_var_name, IntegerCodec.IntType.UInt16, output)
+            writer.write_uint16(self.auto_var_name)
 
         if (self.flags & 5) == 1:
             assert self.read_handler is not None
-            self.read_handler.dump(output)
+            self.read_handler.to_writer(writer)
 
         if (self.flags & 6) == 2:
             assert self.write_handler is not None
-            self.write_handler.dump(output)
+            self.write_handler.to_writer(writer)
 
     @override
     def validate_model(self) -> None:
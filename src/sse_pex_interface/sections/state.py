@@ -2,10 +2,13 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+from typing import Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..pex_index import FunctionEntry, Span, StateEntry
+from ..pex_visitor import PexVisitor
 from .named_function import NamedFunction
 
 
@@ -22,20 +25,61 @@ class State(BinaryModel):
 
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        name: int = reader.read_uint16()
 
-        num_functions: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+        num_functions: int = reader.read_uint16()
         functions: list[NamedFunction] = []
         for _ in range(num_functions):
-            functions.append(NamedFunction.parse(stream))
+            functions.append(NamedFunction.from_reader(reader))
 
-        return cls(name=name, functions=functions)
+        return cls._build(reader.validate, name=name, functions=functions)
+
+    @classmethod
+    def index_from_reader(cls, reader: BufferReader) -> StateEntry:
+        """
+        Skips over a state and records where it and its functions are located.
+
+        Args:
+            reader (BufferReader): Reader to advance.
+
+        Returns:
+            StateEntry: Index entry of the state.
+        """
+
+        start: int = reader.offset
+        name: int = reader.read_uint16()
+
+        num_functions: int = reader.read_uint16()
+        functions: list[FunctionEntry] = []
+        for _ in range(num_functions):
+            functions.append(NamedFunction.index_from_reader(reader))
+
+        return StateEntry(name, Span(start, reader.offset - start), functions)
+
+    @classmethod
+    def visit_from_reader(cls, reader: BufferReader, visitor: PexVisitor) -> None:
+        """
+        Reads a state and passes it and its functions to a visitor without building a
+        model.
+
+        Args:
+            reader (BufferReader): Reader to read from.
+            visitor (PexVisitor): Visitor to call.
+        """
+
+        visitor.on_state_begin(reader.read_uint16())
+
+        num_functions: int = reader.read_uint16()
+        for _ in range(num_functions):
+            NamedFunction.visit_from_reader(reader, visitor)
+
+        visitor.on_state_end()
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.name, IntegerCodec.IntType.UInt16, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.write_uint16(self.name)
 
-        IntegerCodec.dump(len(self.functions), IntegerCodec.IntType.UInt16, output)
+        writer.write_uint16(len(self.functions))
         for function in self.functions:
-            function.dump(output)
+            function.to_writer(writer)
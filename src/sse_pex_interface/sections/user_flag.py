@@ -2,10 +2,12 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+from typing import ClassVar, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout
 
 
 class UserFlag(BinaryModel):
@@ -19,15 +21,25 @@ class UserFlag(BinaryModel):
     flag_index: int
     """uint8: Bit index."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("name_index", IntegerCodec.IntType.UInt16),
+        ("flag_index", IntegerCodec.IntType.UInt8),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        name_index: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        flag_index: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        name_index: int
+        flag_index: int
+        name_index, flag_index = reader.unpack(cls._LAYOUT)
+
+        return cls._build(reader.validate, name_index=name_index, flag_index=flag_index)
 
-        return cls(name_index=name_index, flag_index=flag_index)
+    @override
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        reader.skip(cls._LAYOUT.size)
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.name_index, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.flag_index, IntegerCodec.IntType.UInt8, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.pack(self._LAYOUT, (self.name_index, self.flag_index))
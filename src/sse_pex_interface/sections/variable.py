@@ -2,10 +2,12 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+from typing import ClassVar, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout
 from .variable_data import VariableData
 
 
@@ -26,20 +28,37 @@ class Variable(BinaryModel):
     data: VariableData
     """Default value."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("name", IntegerCodec.IntType.UInt16),
+        ("type_name", IntegerCodec.IntType.UInt16),
+        ("user_flags", IntegerCodec.IntType.UInt32),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        type_name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        user_flags: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt32)
-        data: VariableData = VariableData.parse(stream)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        name: int
+        type_name: int
+        user_flags: int
+        name, type_name, user_flags = reader.unpack(cls._LAYOUT)
+        data: VariableData = VariableData.from_reader(reader)
+
+        return cls._build(
+            reader.validate,
+            name=name,
+            type_name=type_name,
+            user_flags=user_flags,
+            data=data,
+        )
 
-        return cls(name=name, type_name=type_name, user_flags=user_flags, data=data)
+    @override
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        reader.skip(cls._LAYOUT.size)
+        VariableData.skip(reader)
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.name, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.type_name, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.user_flags, IntegerCodec.IntType.UInt32, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.pack(self._LAYOUT, (self.name, self.type_name, self.user_flags))
 
-        self.data.dump(output)
+        self.data.to_writer(writer)
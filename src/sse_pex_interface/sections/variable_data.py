@@ -2,11 +2,23 @@
 Copyright (c) Cutleast
 """
 
+import struct
 from enum import IntEnum
-from typing import BinaryIO, Optional, Self, override
+from typing import (
+    Any,
+    BinaryIO,
+    ClassVar,
+    Optional,
+    Self,
+    SupportsIndex,
+    cast,
+    override,
+)
 
 from ..binary_model import BinaryModel
-from ..datatypes import FloatCodec, IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import FloatCodec
 
 
 class VariableData(BinaryModel):
@@ -33,56 +45,211 @@ class VariableData(BinaryModel):
     integer_unsigned: bool
     """If the variable type is integer, the data is interpreted as an uint32."""
 
+    _DATA_SIZES: ClassVar[dict[Type, int]] = {
+        Type.NULL: 0,
+        Type.IDENTIFIER: 2,
+        Type.STRING: 2,
+        Type.INTEGER: 4,
+        Type.FLOAT: 4,
+        Type.BOOL: 1,
+    }
+    """Sizes of the data of each variable type in bytes."""
+
+    _TYPES: ClassVar[tuple[Type, ...]] = tuple(Type)
+    """Variable types by their value."""
+
+    _STRUCTS: ClassVar[tuple[Optional[struct.Struct], ...]] = (
+        None,  # NULL
+        struct.Struct(">H"),  # IDENTIFIER
+        struct.Struct(">H"),  # STRING
+        struct.Struct(">i"),  # INTEGER
+        struct.Struct(FloatCodec.FloatType.Float32.value[1]),  # FLOAT
+        struct.Struct(">B"),  # BOOL
+    )
+    """Precompiled structs of the data of each variable type."""
+
+    _UNSIGNED_STRUCTS: ClassVar[tuple[Optional[struct.Struct], ...]] = (
+        None,  # NULL
+        struct.Struct(">H"),  # IDENTIFIER
+        struct.Struct(">H"),  # STRING
+        struct.Struct(">I"),  # INTEGER
+        struct.Struct(FloatCodec.FloatType.Float32.value[1]),  # FLOAT
+        struct.Struct(">B"),  # BOOL
+    )
+    """Precompiled structs of the data of each variable type if integers are unsigned."""
+
+    _SHARED_INTEGERS: ClassVar[range] = range(-1, 256)
+    """Integers that are parsed as shared instances in trusted mode."""
+
+    _shared_instances: ClassVar[
+        dict[tuple[Type, Optional[int | float], bool], "VariableData"]
+    ] = {}
+    """
+    Shared instances of immutable values (NULL, BOOL and small INTEGER values), that
+    are handed out when parsing without validation.
+    """
+
+    @override
+    @classmethod
+    def parse(
+        cls,
+        stream: BinaryIO,
+        integer_unsigned: bool = False,
+        *,
+        validate: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+    ) -> Self:
+        # The type and the data are read with one call each, so that exactly the
+        # bytes of the value are consumed from the stream
+        data: bytes = stream.read(1)
+        if data and data[0] < len(cls._TYPES):
+            data += stream.read(cls._DATA_SIZES[cls._TYPES[data[0]]])
+
+        return cls.from_reader(
+            BufferReader(data, validate=validate, lazy=lazy, compact=compact),
+            integer_unsigned,
+        )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO, integer_unsigned: bool = False) -> Self:
-        type = cls.Type(IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8))
+    def from_reader(cls, reader: BufferReader, integer_unsigned: bool = False) -> Self:
+        offset: int = reader.offset
+        buffer: memoryview = reader.buffer
+        if offset + 5 > buffer.nbytes and not reader.buffered:
+            # Only the bytes of the value may be read from a stream
+            reader.ensure(1)
+            if offset < len(reader) and reader.buffer[offset] < len(cls._TYPES):
+                reader.ensure(1 + cls._DATA_SIZES[cls._TYPES[reader.buffer[offset]]])
+            buffer = reader.buffer
+
+        if offset >= buffer.nbytes:
+            raise EOFError(f"Expected variable data at offset {offset}!")
+
+        type_value: int = buffer[offset]
+
+        if type_value >= len(cls._TYPES):
+            raise ValueError(f"{type_value} is not a valid VariableData.Type")
+
+        type: VariableData.Type = cls._TYPES[type_value]
+        data_struct: Optional[struct.Struct] = (
+            cls._UNSIGNED_STRUCTS if integer_unsigned else cls._STRUCTS
+        )[type_value]
 
         data: Optional[int | float] = None
-        match type:
-            case VariableData.Type.NULL:
-                pass
-            case VariableData.Type.IDENTIFIER | VariableData.Type.STRING:
-                data = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-            case VariableData.Type.INTEGER:
-                if integer_unsigned:
-                    data = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt32)
-                else:
-                    data = IntegerCodec.parse(stream, IntegerCodec.IntType.Int32)
-            case VariableData.Type.FLOAT:
-                data = FloatCodec.parse(stream, FloatCodec.FloatType.Float32)
-            case VariableData.Type.BOOL:
-                data = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt8)
+        if data_struct is not None:
+            data = data_struct.unpack_from(buffer, offset + 1)[0]
+            reader.offset = offset + 1 + data_struct.size
+        else:
+            reader.offset = offset + 1
+
+        if reader.validate:
+            return cls._build(
+                True, type=type, data=data, integer_unsigned=integer_unsigned
+            )
+
+        if (
+            type == VariableData.Type.NULL
+            or type == VariableData.Type.BOOL
+            or (type == VariableData.Type.INTEGER and data in cls._SHARED_INTEGERS)
+        ):
+            return cls._get_shared(type, cast(Optional[int], data), integer_unsigned)
 
-        return cls(type=type, data=data, integer_unsigned=integer_unsigned)
+        return cls._build(
+            False, type=type, data=data, integer_unsigned=integer_unsigned
+        )
+
+    @classmethod
+    def _get_shared(
+        cls, type: Type, data: Optional[int], integer_unsigned: bool
+    ) -> Self:
+        """
+        Gets a shared instance of an immutable value and creates it if necessary.
+
+        Args:
+            type (Type): Type of the variable.
+            data (Optional[int]): Data of the variable.
+            integer_unsigned (bool): Whether integers are interpreted as unsigned.
+
+        Returns:
+            Self: The shared instance.
+        """
+
+        key: tuple[VariableData.Type, Optional[int | float], bool] = (
+            type,
+            data,
+            integer_unsigned,
+        )
+        instance: Optional[VariableData] = cls._shared_instances.get(key)
+
+        if instance is None:
+            instance = cls._build(
+                False, type=type, data=data, integer_unsigned=integer_unsigned
+            )
+            cls._shared_instances[key] = instance
+
+        return cast(Self, instance)
+
+    def is_shared(self) -> bool:
+        """
+        Returns:
+            bool:
+                Whether this is a shared instance of an immutable value that was
+                handed out by parsing without validation. Shared instances cannot be
+                modified and have to be replaced instead.
+        """
+
+        key: tuple[VariableData.Type, Optional[int | float], bool] = (
+            self.type,
+            self.data,
+            self.integer_unsigned,
+        )
+
+        return self._shared_instances.get(key) is self
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.type, IntegerCodec.IntType.UInt8, output)
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        reader.skip(cls._DATA_SIZES[cls.Type(reader.read_uint8())])
 
-        match self.type:
-            case VariableData.Type.NULL:
-                pass
+    @override
+    def to_writer(self, writer: BufferWriter) -> None:
+        data_struct: Optional[struct.Struct] = (
+            self._UNSIGNED_STRUCTS if self.integer_unsigned else self._STRUCTS
+        )[self.type]
+
+        writer.write_uint8(self.type)
+        if data_struct is not None:
+            writer.write_bytes(data_struct.pack(self.data))
 
-            case VariableData.Type.IDENTIFIER | VariableData.Type.STRING:
-                assert isinstance(self.data, int)
-                IntegerCodec.dump(self.data, IntegerCodec.IntType.UInt16, output)
+    @override
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        # Shared instances are unpickled as the shared instances of the loading
+        # process, so that they stay protected against modification
+        if self.is_shared():
+            return (
+                VariableData._get_shared,
+                (self.type, cast(Optional[int], self.data), self.integer_unsigned),
+            )
 
-            case VariableData.Type.INTEGER:
-                assert isinstance(self.data, int)
+        return super().__reduce_ex__(protocol)
 
-                if self.integer_unsigned:
-                    IntegerCodec.dump(self.data, IntegerCodec.IntType.UInt32, output)
-                else:
-                    IntegerCodec.dump(self.data, IntegerCodec.IntType.Int32, output)
+    @override
+    def __deepcopy__(self, memo: Optional[dict[int, Any]] = None) -> Self:
+        if self.is_shared():
+            return self
 
-            case VariableData.Type.FLOAT:
-                assert isinstance(self.data, float)
-                FloatCodec.dump(self.data, FloatCodec.FloatType.Float32, output)
+        return super().__deepcopy__(memo)
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.is_shared():
+            raise TypeError(
+                "Shared VariableData instances cannot be modified! "
+                "Replace the instance instead."
+            )
 
-            case VariableData.Type.BOOL:
-                assert isinstance(self.data, int)
-                IntegerCodec.dump(self.data, IntegerCodec.IntType.UInt8, output)
+        super().__setattr__(name, value)
 
     @override
     def validate_model(self) -> None:
@@ -2,10 +2,12 @@
 Copyright (c) Cutleast
 """
 
-from typing import BinaryIO, Self, override
+from typing import ClassVar, Self, override
 
 from ..binary_model import BinaryModel
-from ..datatypes import IntegerCodec
+from ..buffer_reader import BufferReader
+from ..buffer_writer import BufferWriter
+from ..datatypes import IntegerCodec, StructLayout
 
 
 class VariableType(BinaryModel):
@@ -19,15 +21,25 @@ class VariableType(BinaryModel):
     type: int
     """uint16: Index(base 0) into string table."""
 
+    _LAYOUT: ClassVar[StructLayout] = StructLayout(
+        ("name", IntegerCodec.IntType.UInt16),
+        ("type", IntegerCodec.IntType.UInt16),
+    )
+
     @override
     @classmethod
-    def parse(cls, stream: BinaryIO) -> Self:
-        name: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
-        type: int = IntegerCodec.parse(stream, IntegerCodec.IntType.UInt16)
+    def from_reader(cls, reader: BufferReader) -> Self:
+        name: int
+        type: int
+        name, type = reader.unpack(cls._LAYOUT)
+
+        return cls._build(reader.validate, name=name, type=type)
 
-        return cls(name=name, type=type)
+    @override
+    @classmethod
+    def skip(cls, reader: BufferReader) -> None:
+        reader.skip(cls._LAYOUT.size)
 
     @override
-    def dump(self, output: BinaryIO) -> None:
-        IntegerCodec.dump(self.name, IntegerCodec.IntType.UInt16, output)
-        IntegerCodec.dump(self.type, IntegerCodec.IntType.UInt16, output)
+    def to_writer(self, writer: BufferWriter) -> None:
+        writer.pack(self._LAYOUT, (self.name, self.type))
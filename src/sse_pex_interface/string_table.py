@@ -0,0 +1,204 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import sys
+from collections.abc import Iterable, Iterator, MutableSequence
+from typing import Any, Optional, Self, overload, override
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+class StringTable(MutableSequence[str]):
+    """
+    String table of a PEX file that keeps the order of its strings and an index of
+    their positions, so that looking up the index of a string is O(1).
+
+    All strings are interned with `sys.intern()`, so that identical strings of many
+    loaded files are only stored once.
+
+    If a string is contained more than once, lookups return its first index, like
+    `list.index()`.
+    """
+
+    __slots__ = ("__indices", "__strings")
+
+    __strings: list[str]
+    __indices: dict[str, int]
+
+    def __init__(self, strings: Iterable[str] = ()) -> None:
+        self.__strings = [sys.intern(string) for string in strings]
+        self.__rebuild_indices()
+
+    def __rebuild_indices(self) -> None:
+        self.__indices = {}
+        for index, string in enumerate(self.__strings):
+            self.__indices.setdefault(string, index)
+
+    def intern(self, string: str) -> int:
+        """
+        Returns the index of a string and appends it first if it is not in the table.
+
+        Args:
+            string (str): String to look up.
+
+        Returns:
+            int: Index of the string.
+        """
+
+        index: Optional[int] = self.__indices.get(string)
+
+        if index is None:
+            index = len(self.__strings)
+            self.append(string)
+
+        return index
+
+    @override
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        Returns the first index of a string.
+
+        Args:
+            value (Any): String to look up.
+            start (int, optional): Index to start the search at. Defaults to 0.
+            stop (int, optional): Index to stop the search at. Defaults to the end.
+
+        Raises:
+            ValueError: If the string is not in the table.
+
+        Returns:
+            int: Index of the string.
+        """
+
+        # Negative bounds are relative to the end, like for `list.index()`
+        size: int = len(self.__strings)
+        if start < 0:
+            start = max(start + size, 0)
+        if stop < 0:
+            stop = max(stop + size, 0)
+
+        index: Optional[int] = self.__indices.get(value)
+
+        if index is not None and start <= index < stop:
+            return index
+        elif index is None or start <= 0:
+            raise ValueError(f"{value!r} is not in string table!")
+
+        # Only searches that start behind the first occurrence have to scan
+        return self.__strings.index(value, start, stop)
+
+    @override
+    def append(self, value: str) -> None:
+        value = sys.intern(value)
+        self.__indices.setdefault(value, len(self.__strings))
+        self.__strings.append(value)
+
+    @override
+    def insert(self, index: int, value: str) -> None:
+        if index >= len(self.__strings):
+            self.append(value)
+            return
+
+        self.__strings.insert(index, sys.intern(value))
+        self.__rebuild_indices()
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        return self.__strings[index]
+
+    @overload
+    def __setitem__(self, index: int, value: str) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[str]) -> None: ...
+
+    @override
+    def __setitem__(self, index: int | slice, value: str | Iterable[str]) -> None:
+        if isinstance(index, slice):
+            self.__strings[index] = [sys.intern(string) for string in value]
+            self.__rebuild_indices()
+            return
+
+        if not isinstance(value, str):
+            raise TypeError("'value' must be a string!")
+
+        index = range(len(self.__strings))[index]
+        old_value: str = self.__strings[index]
+        value = sys.intern(value)
+        self.__strings[index] = value
+
+        if self.__indices.get(old_value) == index:
+            # An earlier occurrence of the old string would have been indexed instead
+            try:
+                self.__indices[old_value] = self.__strings.index(old_value, index + 1)
+            except ValueError:
+                del self.__indices[old_value]
+
+        if self.__indices.get(value, index) >= index:
+            self.__indices[value] = index
+
+    @override
+    def __delitem__(self, index: int | slice) -> None:
+        del self.__strings[index]
+        self.__rebuild_indices()
+
+    @override
+    def __len__(self) -> int:
+        return len(self.__strings)
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__strings)
+
+    @override
+    def __contains__(self, value: object) -> bool:
+        return value in self.__indices
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StringTable):
+            return self.__strings == other.__strings
+        elif isinstance(other, list):
+            return self.__strings == other
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __repr__(self) -> str:
+        return f"StringTable({self.__strings!r})"
+
+    def __reduce__(self) -> tuple[type[Self], tuple[list[str]]]:
+        # The strings are interned again when they are unpickled
+        return (type(self), (self.__strings,))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(
+            cls.__validate,
+            core_schema.union_schema(
+                [
+                    core_schema.is_instance_schema(cls),
+                    core_schema.list_schema(core_schema.str_schema()),
+                ]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(list),
+        )
+
+    @classmethod
+    def __validate(cls, value: "StringTable | list[str]") -> "StringTable":
+        if isinstance(value, StringTable):
+            return value
+
+        return cls(value)
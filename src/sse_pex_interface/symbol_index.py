@@ -0,0 +1,637 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import pickle
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple, Optional, Self
+
+from .pex_file import PexFile
+from .sections import (
+    CompactCode,
+    Function,
+    Instruction,
+    Object,
+    Property,
+    VariableData,
+)
+from .string_table import StringTable
+
+
+class SymbolLocation(NamedTuple):
+    """
+    Location of a function in a PEX file.
+    """
+
+    path: str
+    """The path of the PEX file."""
+
+    object_name: str
+    """The name of the object."""
+
+    state_name: str
+    """The name of the state, empty for the default state and property handlers."""
+
+    function_name: str
+    """The name of the function or of the property, for property handlers."""
+
+
+class ObjectSymbol(NamedTuple):
+    """
+    Symbol of an object.
+    """
+
+    path: str
+    """The path of the PEX file."""
+
+    name: str
+    """The name of the object."""
+
+    parent_class_name: Optional[str]
+    """The name of the parent class or None if the object has no parent."""
+
+    auto_state_name: str
+    """The name of the state the object is initially in."""
+
+    states: dict[str, list[str]]
+    """The names of the functions of each state, by state name."""
+
+    @classmethod
+    def from_object(
+        cls, object: Object, string_table: StringTable, path: str
+    ) -> "ObjectSymbol":
+        """
+        Creates the symbol of an object.
+
+        Args:
+            object (Object): The object.
+            string_table (StringTable): The string table of the object's file.
+            path (str): The path of the PEX file.
+
+        Returns:
+            ObjectSymbol: The symbol of the object.
+        """
+
+        return cls(
+            path,
+            string_table[object.name_index],
+            string_table[object.data.parent_class_name] or None,
+            string_table[object.data.auto_state_name],
+            {
+                string_table[state.name]: [
+                    string_table[named_function.function_name]
+                    for named_function in state.functions
+                ]
+                for state in object.data.states
+            },
+        )
+
+
+class PropertySymbol(NamedTuple):
+    """
+    Symbol of a property.
+    """
+
+    path: str
+    """The path of the PEX file."""
+
+    object_name: str
+    """The name of the object."""
+
+    name: str
+    """The name of the property."""
+
+    type_name: str
+    """The name of the property's type."""
+
+    auto_var_name: Optional[str]
+    """The name of the property's auto variable or None if it has none."""
+
+    @classmethod
+    def from_property(
+        cls, property: Property, object_name: str, string_table: StringTable, path: str
+    ) -> "PropertySymbol":
+        """
+        Creates the symbol of a property.
+
+        Args:
+            property (Property): The property.
+            object_name (str): The name of the property's object.
+            string_table (StringTable): The string table of the property's file.
+            path (str): The path of the PEX file.
+
+        Returns:
+            PropertySymbol: The symbol of the property.
+        """
+
+        return cls(
+            path,
+            object_name,
+            string_table[property.name],
+            string_table[property.type],
+            (
+                string_table[property.auto_var_name]
+                if property.auto_var_name is not None
+                else None
+            ),
+        )
+
+
+class CallSite(NamedTuple):
+    """
+    Instruction that calls a function or accesses a property.
+    """
+
+    op: Instruction.OpCode
+    """
+    The opcode of the instruction: `CALLMETHOD`, `CALLPARENT`, `CALLSTATIC`, `PROPGET`
+    or `PROPSET`.
+    """
+
+    class_name: Optional[str]
+    """
+    The name of the class the called function or accessed property belongs to or None
+    if it cannot be resolved from the declared type of the receiver.
+    """
+
+    member_name: str
+    """The name of the called function or accessed property."""
+
+    location: SymbolLocation
+    """The location of the calling function."""
+
+    instruction_index: int
+    """The index(base 0) of the instruction in the calling function."""
+
+
+class _FileSymbols(NamedTuple):
+    """
+    All symbols of a single file, so that they can be retracted again.
+    """
+
+    objects: list[ObjectSymbol]
+    properties: list[PropertySymbol]
+    functions: list[SymbolLocation]
+    call_sites: list[CallSite]
+
+
+_CALL_OPS: frozenset[Instruction.OpCode] = frozenset(
+    {
+        Instruction.OpCode.CALLMETHOD,
+        Instruction.OpCode.CALLPARENT,
+        Instruction.OpCode.CALLSTATIC,
+        Instruction.OpCode.PROPGET,
+        Instruction.OpCode.PROPSET,
+    }
+)
+
+
+class SymbolIndex:
+    """
+    Index of the objects, states, functions, properties and call sites of many PEX
+    files with constant-time lookups by name.
+
+    Like in Papyrus, names are case-insensitive. The symbols themselves keep the names
+    as they are written in the files.
+
+    **Saved indices must be trusted, as they are loaded with `pickle`!**
+
+    Example:
+        >>> index = SymbolIndex()
+        >>> for path in Path("Scripts").glob("*.pex"):
+        ...     index.add_file(PexFile.from_path(path, compact=True), str(path))
+        >>> for call_site in index.get_call_sites("RemoveSpell", "Actor"):
+        ...     print(call_site.location)
+        >>> index.save(Path("symbols.idx"))
+    """
+
+    FORMAT_VERSION: int = 1
+    """The version of the format of saved indices."""
+
+    __files: dict[str, _FileSymbols]
+    __objects: dict[str, list[ObjectSymbol]]
+    __children: dict[str, list[ObjectSymbol]]
+    __properties: dict[tuple[str, str], list[PropertySymbol]]
+    __functions: dict[str, list[SymbolLocation]]
+    __call_sites: dict[str, list[CallSite]]
+    __class_call_sites: dict[tuple[str, str], list[CallSite]]
+
+    def __init__(self) -> None:
+        self.__files = {}
+        self.__objects = {}
+        self.__children = {}
+        self.__properties = {}
+        self.__functions = {}
+        self.__call_sites = {}
+        self.__class_call_sites = {}
+
+    def add_file(self, pex_file: PexFile, path: str) -> None:
+        """
+        Adds the symbols of a PEX file to the index. Symbols that were previously added
+        for the same path are replaced.
+
+        Args:
+            pex_file (PexFile): The PEX file.
+            path (str): The path of the PEX file.
+        """
+
+        self.remove_file(path)
+        self.__add_symbols(path, SymbolIndex.__collect(pex_file, path))
+
+    def remove_file(self, path: str) -> None:
+        """
+        Removes the symbols of a PEX file from the index, if any.
+
+        Args:
+            path (str): The path of the PEX file.
+        """
+
+        symbols: Optional[_FileSymbols] = self.__files.pop(path, None)
+        if symbols is None:
+            return
+
+        def is_stale(symbol: ObjectSymbol | PropertySymbol | SymbolLocation) -> bool:
+            return symbol.path == path
+
+        _retract(self.__objects, _keys(symbols.objects, _object_key), is_stale)
+        _retract(
+            self.__children,
+            (
+                object.parent_class_name.lower()
+                for object in symbols.objects
+                if object.parent_class_name is not None
+            ),
+            is_stale,
+        )
+        _retract(self.__properties, _keys(symbols.properties, _property_key), is_stale)
+        _retract(self.__functions, _keys(symbols.functions, _function_key), is_stale)
+
+        def is_stale_call_site(call_site: CallSite) -> bool:
+            return call_site.location.path == path
+
+        _retract(
+            self.__call_sites,
+            _keys(symbols.call_sites, _call_site_key),
+            is_stale_call_site,
+        )
+        _retract(
+            self.__class_call_sites,
+            _keys(symbols.call_sites, _class_call_site_key),
+            is_stale_call_site,
+        )
+
+    @property
+    def paths(self) -> list[str]:
+        """The paths of all files in the index."""
+
+        return list(self.__files)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.__files
+
+    def __len__(self) -> int:
+        return len(self.__files)
+
+    def get_object(self, name: str) -> Optional[ObjectSymbol]:
+        """
+        Gets an object by its name. If several files define an object with the same
+        name, the one added last is returned.
+
+        Args:
+            name (str): The name of the object.
+
+        Returns:
+            Optional[ObjectSymbol]: The object or None if it is not in the index.
+        """
+
+        objects: Optional[list[ObjectSymbol]] = self.__objects.get(name.lower())
+
+        return objects[-1] if objects else None
+
+    def get_parent(self, name: str) -> Optional[str]:
+        """
+        Gets the name of the parent class of an object.
+
+        Args:
+            name (str): The name of the object.
+
+        Returns:
+            Optional[str]:
+                The name of the parent class or None if the object has no parent or is
+                not in the index.
+        """
+
+        object: Optional[ObjectSymbol] = self.get_object(name)
+
+        return object.parent_class_name if object is not None else None
+
+    def get_children(self, name: str) -> list[ObjectSymbol]:
+        """
+        Gets the objects that directly extend a class.
+
+        Args:
+            name (str): The name of the class.
+
+        Returns:
+            list[ObjectSymbol]: The child objects.
+        """
+
+        return list(self.__children.get(name.lower(), []))
+
+    def get_property(
+        self, object_name: str, property_name: str
+    ) -> Optional[PropertySymbol]:
+        """
+        Gets a property that is defined by an object itself.
+
+        Args:
+            object_name (str): The name of the object.
+            property_name (str): The name of the property.
+
+        Returns:
+            Optional[PropertySymbol]:
+                The property or None if the object does not define it.
+        """
+
+        properties: Optional[list[PropertySymbol]] = self.__properties.get(
+            (object_name.lower(), property_name.lower())
+        )
+
+        return properties[-1] if properties else None
+
+    def get_functions(self, name: str) -> list[SymbolLocation]:
+        """
+        Gets the locations of all functions with a name, in all objects and states.
+
+        Args:
+            name (str): The name of the function.
+
+        Returns:
+            list[SymbolLocation]: The locations of the functions.
+        """
+
+        return list(self.__functions.get(name.lower(), []))
+
+    def get_call_sites(
+        self, member_name: str, class_name: Optional[str] = None
+    ) -> list[CallSite]:
+        """
+        Gets all instructions that call a function or access a property.
+
+        Args:
+            member_name (str): The name of the function or property.
+            class_name (Optional[str], optional):
+                The name of the class of the function or property. Defaults to all
+                classes, including call sites whose class cannot be resolved.
+
+        Returns:
+            list[CallSite]: The call sites.
+        """
+
+        if class_name is None:
+            return list(self.__call_sites.get(member_name.lower(), []))
+
+        return list(
+            self.__class_call_sites.get((class_name.lower(), member_name.lower()), [])
+        )
+
+    def save(self, path: Path) -> None:
+        """
+        Saves the index to a file.
+
+        Args:
+            path (Path): The path of the file.
+        """
+
+        path.write_bytes(
+            pickle.dumps(
+                (SymbolIndex.FORMAT_VERSION, self.__files),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        """
+        Loads an index from a file that was created with `save()`.
+
+        Args:
+            path (Path): The path of the file.
+
+        Raises:
+            ValueError: If the file was saved in another format version.
+
+        Returns:
+            Self: The loaded index.
+        """
+
+        version: int
+        files: dict[str, _FileSymbols]
+        version, files = pickle.loads(path.read_bytes())
+
+        if version != SymbolIndex.FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported symbol index format version: {version} "
+                f"(expected {SymbolIndex.FORMAT_VERSION})"
+            )
+
+        index: Self = cls()
+        for file_path, symbols in files.items():
+            index.__add_symbols(file_path, symbols)
+
+        return index
+
+    def __getstate__(self) -> dict[str, _FileSymbols]:
+        # Only the symbols per file are pickled, the lookup tables are rebuilt
+        return self.__files
+
+    def __setstate__(self, files: dict[str, _FileSymbols]) -> None:
+        SymbolIndex.__init__(self)
+        for path, symbols in files.items():
+            self.__add_symbols(path, symbols)
+
+    def __add_symbols(self, path: str, symbols: _FileSymbols) -> None:
+        self.__files[path] = symbols
+
+        for object in symbols.objects:
+            self.__objects.setdefault(_object_key(object), []).append(object)
+            if object.parent_class_name is not None:
+                self.__children.setdefault(object.parent_class_name.lower(), []).append(
+                    object
+                )
+
+        for property in symbols.properties:
+            self.__properties.setdefault(_property_key(property), []).append(property)
+
+        for location in symbols.functions:
+            self.__functions.setdefault(_function_key(location), []).append(location)
+
+        for call_site in symbols.call_sites:
+            self.__call_sites.setdefault(_call_site_key(call_site), []).append(
+                call_site
+            )
+            if call_site.class_name is not None:
+                self.__class_call_sites.setdefault(
+                    _class_call_site_key(call_site), []
+                ).append(call_site)
+
+    @staticmethod
+    def __collect(pex_file: PexFile, path: str) -> _FileSymbols:
+        string_table: StringTable = pex_file.string_table
+        symbols = _FileSymbols([], [], [], [])
+
+        for object in pex_file.objects:
+            object_name: str = string_table[object.name_index]
+            symbols.objects.append(ObjectSymbol.from_object(object, string_table, path))
+
+            # Declared types of the object's variables, to resolve the class of calls
+            variable_types: dict[str, str] = {
+                string_table[variable.name].lower(): string_table[variable.type_name]
+                for variable in object.data.variables
+            }
+            variable_types["self"] = object_name
+
+            for property in object.data.properties:
+                property_name: str = string_table[property.name]
+                symbols.properties.append(
+                    PropertySymbol.from_property(
+                        property, object_name, string_table, path
+                    )
+                )
+
+                for handler in (property.read_handler, property.write_handler):
+                    if handler is not None:
+                        location = SymbolLocation(path, object_name, "", property_name)
+                        SymbolIndex.__collect_call_sites(
+                            handler,
+                            location,
+                            object,
+                            variable_types,
+                            string_table,
+                            symbols.call_sites,
+                        )
+
+            for state in object.data.states:
+                state_name: str = string_table[state.name]
+                for named_function in state.functions:
+                    location = SymbolLocation(
+                        path,
+                        object_name,
+                        state_name,
+                        string_table[named_function.function_name],
+                    )
+                    symbols.functions.append(location)
+                    SymbolIndex.__collect_call_sites(
+                        named_function.function,
+                        location,
+                        object,
+                        variable_types,
+                        string_table,
+                        symbols.call_sites,
+                    )
+
+        return symbols
+
+    @staticmethod
+    def __collect_call_sites(
+        function: Function,
+        location: SymbolLocation,
+        object: Object,
+        variable_types: dict[str, str],
+        string_table: StringTable,
+        call_sites: list[CallSite],
+    ) -> None:
+        types: Optional[dict[str, str]] = None
+
+        def get_type(argument: VariableData) -> Optional[str]:
+            nonlocal types
+
+            if argument.type != VariableData.Type.IDENTIFIER:
+                return None
+
+            # The types of parameters and locals are only collected if needed
+            if types is None:
+                types = dict(variable_types)
+                for variable in (*function.params, *function.locals):
+                    types[string_table[variable.name].lower()] = string_table[
+                        variable.type
+                    ]
+
+            return types.get(string_table[_get_index(argument)].lower())
+
+        instructions: list[Instruction] | CompactCode = function.instructions
+        for i in range(len(instructions)):
+            # Compactly parsed instructions are only built as models if they are calls
+            op: Instruction.OpCode = (
+                instructions.get_op(i)
+                if isinstance(instructions, CompactCode)
+                else instructions[i].op
+            )
+            if op not in _CALL_OPS:
+                continue
+
+            arguments: list[VariableData] = instructions[i].arguments
+            class_name: Optional[str]
+            if op == Instruction.OpCode.CALLSTATIC:
+                class_name = string_table[_get_index(arguments[0])]
+                member_name: str = string_table[_get_index(arguments[1])]
+            else:
+                member_name = string_table[_get_index(arguments[0])]
+                if op == Instruction.OpCode.CALLPARENT:
+                    class_name = string_table[object.data.parent_class_name] or None
+                else:
+                    class_name = get_type(arguments[1])
+
+            call_sites.append(CallSite(op, class_name, member_name, location, i))
+
+
+def _get_index(argument: VariableData) -> int:
+    return int(argument.data or 0)
+
+
+def _object_key(object: ObjectSymbol) -> str:
+    return object.name.lower()
+
+
+def _property_key(property: PropertySymbol) -> tuple[str, str]:
+    return property.object_name.lower(), property.name.lower()
+
+
+def _function_key(location: SymbolLocation) -> str:
+    return location.function_name.lower()
+
+
+def _call_site_key(call_site: CallSite) -> str:
+    return call_site.member_name.lower()
+
+
+def _class_call_site_key(call_site: CallSite) -> tuple[str, str]:
+    return (call_site.class_name or "").lower(), call_site.member_name.lower()
+
+
+def _keys[T, K](symbols: Iterable[T], key: Callable[[T], K]) -> Iterator[K]:
+    return (key(symbol) for symbol in symbols)
+
+
+def _retract[K, T](
+    mapping: dict[K, list[T]], keys: Iterable[K], is_stale: Callable[[T], bool]
+) -> None:
+    """
+    Removes the stale symbols from the lists of the specified keys of a mapping and
+    deletes lists that become empty.
+
+    Args:
+        mapping (dict[K, list[T]]): The mapping.
+        keys (Iterable[K]): The keys that may have stale symbols.
+        is_stale (Callable[[T], bool]): Function that tells if a symbol is stale.
+    """
+
+    for key in set(keys):
+        symbols: Optional[list[T]] = mapping.get(key)
+        if symbols is None:
+            continue
+
+        symbols[:] = [symbol for symbol in symbols if not is_stale(symbol)]
+        if not symbols:
+            del mapping[key]
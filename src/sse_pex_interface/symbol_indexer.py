@@ -0,0 +1,269 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import hashlib
+import os
+import pickle
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple, Optional, Self
+
+from .binary_model import PARSE_ERRORS
+from .pex_file import PexFile
+from .sections import Header
+from .symbol_index import SymbolIndex
+
+
+class FileState(NamedTuple):
+    """
+    State of an indexed file, used to detect changes.
+    """
+
+    size: int
+    """The size of the file in bytes."""
+
+    mtime: int
+    """The modification time of the file in nanoseconds."""
+
+    compilation_time: int
+    """The compilation timestamp from the file's header."""
+
+    content_hash: Optional[bytes]
+    """The hash of the file's content or None if content hashing is disabled."""
+
+
+class IndexUpdate(NamedTuple):
+    """
+    Summary of an update of a `SymbolIndexer`.
+    """
+
+    added: list[str]
+    """The paths of the files that were added to the index."""
+
+    changed: list[str]
+    """The paths of the files that were parsed again, as their content changed."""
+
+    removed: list[str]
+    """The paths of the files that were removed from the index."""
+
+    errors: dict[str, Exception]
+    """
+    The errors of the files that could not be read or parsed, by path. These files are
+    not in the index.
+    """
+
+
+class SymbolIndexer:
+    """
+    Keeps a `SymbolIndex` up to date with a set of files and parses only the files that
+    were added or changed since the last update.
+
+    A file whose size and modification time are unchanged is skipped without reading
+    it. Otherwise, only its header is read first: A different compilation time or size
+    means that the file was changed. If both are the same, the file is hashed to tell
+    whether it was modified (for example patched) or only touched. Without content
+    hashing, such files are assumed to be unchanged.
+
+    Files are identified by their resolved path.
+
+    **Saved indexers must be trusted, as they are loaded with `pickle`!**
+
+    Example:
+        >>> indexer = SymbolIndexer.load(Path("symbols.idx"))
+        >>> update = indexer.update(Path("Scripts").glob("*.pex"))
+        >>> indexer.index.get_call_sites("RemoveSpell", "Actor")
+        >>> indexer.save(Path("symbols.idx"))
+    """
+
+    FORMAT_VERSION: int = 1
+    """The version of the format of saved indexers."""
+
+    index: SymbolIndex
+    """The index of the files."""
+
+    use_content_hash: bool
+    """
+    Whether files with an unchanged compilation time and size are hashed to detect
+    modifications.
+    """
+
+    __states: dict[str, FileState]
+
+    def __init__(self, use_content_hash: bool = True) -> None:
+        """
+        Args:
+            use_content_hash (bool, optional):
+                Whether to hash files with an unchanged compilation time and size to
+                detect modifications. Defaults to True.
+        """
+
+        self.index = SymbolIndex()
+        self.use_content_hash = use_content_hash
+        self.__states = {}
+
+    def update(
+        self, paths: Iterable[Path], *, remove_missing: bool = True
+    ) -> IndexUpdate:
+        """
+        Updates the index with the specified files. Entries of changed files are
+        replaced and entries of files that no longer exist are retracted.
+
+        Args:
+            paths (Iterable[Path]): Paths to the PEX files.
+            remove_missing (bool, optional):
+                Whether to also remove indexed files that are not specified.
+                Defaults to True.
+
+        Returns:
+            IndexUpdate: The summary of the update.
+        """
+
+        result = IndexUpdate([], [], [], {})
+        seen: set[str] = set()
+
+        for path in paths:
+            key: str = str(path.resolve())
+            seen.add(key)
+
+            try:
+                self.__update_file(path, key, result)
+            except FileNotFoundError:
+                self.remove(key)
+                result.removed.append(key)
+            except PARSE_ERRORS as ex:
+                # The stale entries of the file must not be kept in the index
+                self.remove(key)
+                result.errors[key] = ex
+
+        if remove_missing:
+            for key in list(self.__states):
+                if key not in seen:
+                    self.remove(key)
+                    result.removed.append(key)
+
+        return result
+
+    def __update_file(self, path: Path, key: str, result: IndexUpdate) -> None:
+        stat: os.stat_result = path.stat()
+        state: Optional[FileState] = self.__states.get(key)
+
+        if (
+            state is not None
+            and state.size == stat.st_size
+            and state.mtime == stat.st_mtime_ns
+        ):
+            return
+
+        with path.open("rb") as stream:
+            # The header is read first, as a new compilation time or size means that
+            # the file was changed without having to read all of it
+            header: Header = Header.parse(stream, validate=False)
+            changed: bool = (
+                state is None
+                or state.size != stat.st_size
+                or state.compilation_time != header.compilation_time
+            )
+            if state is not None and not changed and not self.use_content_hash:
+                self.__states[key] = state._replace(mtime=stat.st_mtime_ns)
+                return
+
+            stream.seek(0)
+            data: bytes = stream.read()
+
+        content_hash: Optional[bytes] = None
+        if self.use_content_hash:
+            content_hash = hashlib.blake2b(data, digest_size=16).digest()
+
+        if state is not None and not changed and content_hash == state.content_hash:
+            self.__states[key] = state._replace(mtime=stat.st_mtime_ns)
+            return
+
+        pex_file: PexFile = PexFile.from_buffer(data, compact=True)
+        self.index.add_file(pex_file, key)
+        self.__states[key] = FileState(
+            stat.st_size, stat.st_mtime_ns, header.compilation_time, content_hash
+        )
+
+        if state is None:
+            result.added.append(key)
+        else:
+            result.changed.append(key)
+
+    def remove(self, path: str) -> None:
+        """
+        Removes a file from the index, if it is indexed.
+
+        Args:
+            path (str): The resolved path of the PEX file.
+        """
+
+        self.__states.pop(path, None)
+        self.index.remove_file(path)
+
+    def get_state(self, path: str) -> Optional[FileState]:
+        """
+        Gets the state of an indexed file.
+
+        Args:
+            path (str): The resolved path of the PEX file.
+
+        Returns:
+            Optional[FileState]: The state of the file or None if it is not indexed.
+        """
+
+        return self.__states.get(path)
+
+    def save(self, path: Path) -> None:
+        """
+        Saves the indexer, including its index, to a file.
+
+        Args:
+            path (Path): The path of the file.
+        """
+
+        path.write_bytes(
+            pickle.dumps(
+                (SymbolIndexer.FORMAT_VERSION, self.__states, self.index),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Path, use_content_hash: bool = True) -> Self:
+        """
+        Loads an indexer from a file that was created with `save()`. If the file does
+        not exist, an empty indexer is created.
+
+        Args:
+            path (Path): The path of the file.
+            use_content_hash (bool, optional):
+                Whether to hash files with an unchanged compilation time and size to
+                detect modifications. Defaults to True.
+
+        Raises:
+            ValueError: If the file was saved in another format version.
+
+        Returns:
+            Self: The loaded indexer.
+        """
+
+        indexer: Self = cls(use_content_hash)
+        if not path.is_file():
+            return indexer
+
+        version: int
+        states: dict[str, FileState]
+        index: SymbolIndex
+        version, states, index = pickle.loads(path.read_bytes())
+
+        if version != SymbolIndexer.FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported symbol indexer format version: {version} "
+                f"(expected {SymbolIndexer.FORMAT_VERSION})"
+            )
+
+        indexer.__states = states
+        indexer.index = index
+
+        return indexer
@@ -0,0 +1,79 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from io import BytesIO
+from pathlib import Path
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import CompactCode, Function, Instruction
+
+
+class TestCompactCode:
+    """
+    Tests for the CompactCode representation of instructions.
+    """
+
+    def test_parse_compact(self) -> None:
+        """
+        Tests that compactly parsed instructions are equal to their models.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        expected: PexFile = PexFile.from_path(pex_file_path)
+
+        # when
+        pex_file: PexFile = PexFile.from_path(pex_file_path, compact=True)
+
+        # then
+        function: Function = pex_file.objects[0].data.states[0].functions[0].function
+        expected_function: Function = (
+            expected.objects[0].data.states[0].functions[0].function
+        )
+        assert isinstance(function.instructions, CompactCode)
+        assert function.instructions[0] == expected_function.instructions[0]
+        assert function.instructions.get_op(0) == expected_function.instructions[0].op
+        assert function.instructions == expected_function.instructions
+        assert pex_file == expected
+        assert PexFile.model_validate(pex_file.model_dump()) == expected
+
+    def test_dump_compact(self) -> None:
+        """
+        Tests that compactly parsed instructions are dumped byte-identical.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path, compact=True, lazy=True)
+        pex_file.load()
+        output = BytesIO()
+
+        # when
+        pex_file.dump(output)
+
+        # then
+        assert output.getvalue() == pex_file_path.read_bytes()
+
+    def test_from_instructions(self) -> None:
+        """
+        Tests converting a list of instructions to the compact representation and back.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+        instructions: list[Instruction] = []
+        for state in pex_file.objects[0].data.states:
+            for named_function in state.functions:
+                assert isinstance(named_function.function.instructions, list)
+                instructions += named_function.function.instructions
+
+        # when
+        compact_code: CompactCode = CompactCode.from_instructions(instructions)
+
+        # then
+        assert len(compact_code) == len(instructions)
+        assert compact_code == instructions
+        assert list(compact_code) == instructions
+        assert compact_code[-2:] == instructions[-2:]
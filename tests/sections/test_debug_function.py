@@ -0,0 +1,62 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from array import array
+from io import BytesIO
+
+import pytest
+from pydantic import ValidationError
+
+from sse_pex_interface.sections import DebugFunction
+
+
+class TestDebugFunction:
+    """
+    Tests for the DebugFunction model.
+    """
+
+    def test_line_numbers_are_compact(self) -> None:
+        """
+        Tests that line numbers are stored as a compact uint16 array.
+        """
+
+        # when
+        debug_function = DebugFunction(
+            object_name_index=0,
+            state_name_index=1,
+            function_name_index=2,
+            function_type=0,
+            line_numbers=array("H", [10, 11, 12]),
+        )
+
+        # then
+        assert debug_function.line_numbers == array("H", [10, 11, 12])
+
+        # when/then
+        with pytest.raises(ValidationError):
+            debug_function.line_numbers = array("I", [70000])
+
+    def test_dump_debug_function(self) -> None:
+        """
+        Tests writing a debug function.
+        """
+
+        # given
+        debug_function = DebugFunction(
+            object_name_index=0,
+            state_name_index=1,
+            function_name_index=2,
+            function_type=3,
+            line_numbers=array("H", [10, 0x1234]),
+        )
+        output = BytesIO()
+
+        # when
+        debug_function.dump(output)
+        output.seek(0)
+        dumped_debug_function: DebugFunction = DebugFunction.parse(output)
+
+        # then
+        assert output.getvalue() == bytes.fromhex("0000 0001 0002 03 0002 000a 1234")
+        assert dumped_debug_function == debug_function
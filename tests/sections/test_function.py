@@ -0,0 +1,139 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+import pytest
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import Function
+from sse_pex_interface.string_table import StringTable
+
+
+class TestFunction:
+    """
+    Tests `sse_pex_interface.sections.Function`.
+    """
+
+    def test_fingerprint_string_table_order(self) -> None:
+        """
+        Tests that the fingerprint of a function does not depend on the order of the
+        string table of its file.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+        function: Function = pex_file.objects[0].data.states[0].functions[0].function
+        reversed_table = StringTable(reversed(pex_file.string_table))
+        last_index: int = len(pex_file.string_table) - 1
+
+        # when
+        moved: Function = function.map_strings(lambda index: last_index - index)
+
+        # then
+        assert moved != function
+        assert moved.fingerprint(reversed_table) == function.fingerprint(
+            pex_file.string_table
+        )
+
+    def test_fingerprint_across_files(self) -> None:
+        """
+        Tests that identical functions of different files have the same fingerprint,
+        although the string tables of the files differ.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        pex_file: PexFile = PexFile.from_path(test_data_path / "_wetquestscript.pex")
+        other_file: PexFile = PexFile.from_path(
+            test_data_path / "_wetquestscript_german.pex"
+        )
+
+        # when
+        fingerprints: list[bytes] = [
+            named_function.function.fingerprint(pex_file.string_table)
+            for state in pex_file.objects[0].data.states
+            for named_function in state.functions
+        ]
+        other_fingerprints: list[bytes] = [
+            named_function.function.fingerprint(other_file.string_table)
+            for state in other_file.objects[0].data.states
+            for named_function in state.functions
+        ]
+
+        # then
+        # Only "Maintenance" differs, as it contains translated string literals
+        different: list[int] = [
+            i
+            for i, (fingerprint, other_fingerprint) in enumerate(
+                zip(fingerprints, other_fingerprints, strict=True)
+            )
+            if fingerprint != other_fingerprint
+        ]
+        assert len(different) == 1
+        assert all(len(fingerprint) == 16 for fingerprint in fingerprints)
+        assert len(set(fingerprints)) == len(fingerprints)
+
+    def test_canonical_bytes(self) -> None:
+        """
+        Tests that a function is moved to another file via its canonical bytes.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+        function: Function = pex_file.objects[0].data.states[0].functions[0].function
+        string_table = StringTable(["Unrelated"])
+
+        # when
+        data: bytes = function.to_canonical_bytes(pex_file.string_table)
+        moved: Function = Function.from_canonical_bytes(data, string_table)
+
+        # then
+        assert string_table[0] == "Unrelated"
+        assert moved.to_canonical_bytes(string_table) == data
+        assert moved.fingerprint(string_table) == function.fingerprint(
+            pex_file.string_table
+        )
+        assert Function.from_canonical_bytes(data, pex_file.string_table) == function
+
+    @pytest.mark.parametrize("seekable", [True, False])
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_parse_sequential(self, seekable: bool, compact: bool) -> None:
+        """
+        Tests that consecutive functions are parsed from a stream and that only their
+        own data is consumed.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path, compact=compact)
+        functions: list[Function] = [
+            named_function.function
+            for named_function in pex_file.objects[0].data.states[0].functions[:3]
+        ]
+        data: bytes = b"".join(function.to_bytes() for function in functions)
+
+        stream: BinaryIO
+        if seekable:
+            stream = BytesIO(data + b"rest")
+        else:
+            read_fd, write_fd = os.pipe()
+            os.write(write_fd, data + b"rest")
+            os.close(write_fd)
+            stream = os.fdopen(read_fd, "rb")
+
+        with stream:
+            # when
+            parsed: list[Function] = [
+                Function.parse(stream, compact=compact) for _ in functions
+            ]
+
+            # then
+            assert parsed == functions
+            assert stream.read() == b"rest"
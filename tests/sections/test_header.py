@@ -6,6 +6,8 @@ from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
+import pytest
+
 from sse_pex_interface.sections import Header
 
 
@@ -25,8 +27,10 @@ class TestHeader:
         # when
         with pex_file.open("rb") as stream:
             header: Header = Header.parse(stream)
+            stream_position: int = stream.tell()
 
         # then
+        assert stream_position == 65
         assert header.magic == 0xFA57C0DE
         assert header.major_version == 3
         assert header.minor_version == 2
@@ -54,3 +58,16 @@ class TestHeader:
 
         # then
         assert header == dumped_header
+
+    def test_parse_unsupported_format(self) -> None:
+        """
+        Tests that a file of an unsupported format is rejected with a ValueError.
+        """
+
+        # given
+        pex_file: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        data: bytes = b"\x00" + pex_file.read_bytes()[1:]
+
+        # when/then
+        with pytest.raises(ValueError, match="File format not supported!"):
+            Header.parse(BytesIO(data))
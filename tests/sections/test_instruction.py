@@ -0,0 +1,62 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import pytest
+
+from sse_pex_interface.sections import Instruction, VariableData
+
+
+class TestInstruction:
+    """
+    Tests for the Instruction model.
+    """
+
+    def test_parse_varargs(self) -> None:
+        """
+        Tests parsing an instruction with variable arguments.
+        """
+
+        # given
+        data: bytes = (
+            b"\x17"  # CALLMETHOD
+            b"\x01\x00\x01"  # Identifier
+            b"\x02\x00\x02"  # String
+            b"\x02\x00\x03"  # String
+            b"\x03\x00\x00\x00\x01"  # Vararg count
+            b"\x03\xff\xff\xff\xff"  # Integer
+        )
+
+        # when
+        instruction: Instruction = Instruction.from_buffer(data)
+
+        # then
+        assert instruction.op == Instruction.OpCode.CALLMETHOD
+        assert len(instruction.arguments) == 5
+        assert instruction.arguments[3].data == 1
+        assert instruction.arguments[4].type == VariableData.Type.INTEGER
+        assert instruction.arguments[4].data == -1
+
+    def test_parse_unsigned(self) -> None:
+        """
+        Tests that integer arguments of ARRAY_CREATE are parsed as unsigned.
+        """
+
+        # given
+        data: bytes = b"\x1e\x02\x00\x01\x03\xff\xff\xff\xff"
+
+        # when
+        instruction: Instruction = Instruction.from_buffer(data)
+
+        # then
+        assert instruction.arguments[1].data == 0xFFFFFFFF
+        assert instruction.arguments[1].integer_unsigned
+
+    def test_parse_invalid_opcode(self) -> None:
+        """
+        Tests that parsing an invalid opcode fails.
+        """
+
+        # when/then
+        with pytest.raises(ValueError):
+            Instruction.from_buffer(b"\xff")
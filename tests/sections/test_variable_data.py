@@ -2,8 +2,15 @@
 Copyright (c) Cutleast
 """
 
+import os
+import pickle
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+
 import pytest
 
+from sse_pex_interface.pex_file import PexFile
 from sse_pex_interface.sections import VariableData
 
 
@@ -40,3 +47,135 @@ class TestVariableData:
         # when/then
         with pytest.raises(TypeError):
             variable_data.data = 2
+
+    def test_deferred_validation(self) -> None:
+        """
+        Tests that a model constructed without validation can be validated later on.
+        """
+
+        # given
+        variable_data = VariableData.model_construct(
+            type=VariableData.Type.NULL, data=2, integer_unsigned=False
+        )
+
+        # when/then
+        with pytest.raises(TypeError):
+            variable_data.revalidate()
+
+    @pytest.mark.parametrize(
+        "data, integer_unsigned, expected_type, expected_data",
+        [
+            (b"\x00", False, VariableData.Type.NULL, None),
+            (b"\x01\x12\x34", False, VariableData.Type.IDENTIFIER, 0x1234),
+            (b"\x02\x12\x34", False, VariableData.Type.STRING, 0x1234),
+            (b"\x03\xff\xff\xff\xfe", False, VariableData.Type.INTEGER, -2),
+            (b"\x03\xff\xff\xff\xfe", True, VariableData.Type.INTEGER, 0xFFFFFFFE),
+            (b"\x05\x01", False, VariableData.Type.BOOL, 1),
+        ],
+    )
+    def test_parse_and_dump(
+        self,
+        data: bytes,
+        integer_unsigned: bool,
+        expected_type: VariableData.Type,
+        expected_data: Optional[int],
+    ) -> None:
+        """
+        Tests that each variable type is parsed and dumped symmetrically.
+        """
+
+        # when
+        variable_data: VariableData = VariableData.parse(
+            BytesIO(data), integer_unsigned
+        )
+        output = BytesIO()
+        variable_data.dump(output)
+
+        # then
+        assert variable_data.type == expected_type
+        assert variable_data.data == expected_data
+        assert output.getvalue() == data
+
+    def test_shared_instances(self) -> None:
+        """
+        Tests that immutable values are shared when parsing without validation.
+        """
+
+        # when
+        first: VariableData = VariableData.from_buffer(
+            b"\x03\x00\x00\x00\x01", validate=False
+        )
+        second: VariableData = VariableData.from_buffer(
+            b"\x03\x00\x00\x00\x01", validate=False
+        )
+        validated: VariableData = VariableData.from_buffer(b"\x03\x00\x00\x00\x01")
+        large: VariableData = VariableData.from_buffer(
+            b"\x03\x00\x01\x00\x00", validate=False
+        )
+
+        # then
+        assert first is second
+        assert first.is_shared()
+        assert not validated.is_shared()
+        assert not large.is_shared()
+        assert first == validated
+
+        # when/then
+        with pytest.raises(TypeError):
+            first.data = 2
+
+        validated.data = 2
+        large.data = 2
+
+    def test_shared_instances_copied(self) -> None:
+        """
+        Tests that shared instances stay shared and protected when a file is pickled
+        or deep-copied.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path, validate=False)
+
+        for copy in (
+            pickle.loads(pickle.dumps(pex_file)),
+            pex_file.model_copy(deep=True),
+        ):
+            arguments: list[VariableData] = [
+                argument
+                for state in copy.objects[0].data.states
+                for named_function in state.functions
+                for instruction in named_function.function.instructions
+                for argument in instruction.arguments
+                if argument.type == VariableData.Type.INTEGER and argument.data == 1
+            ]
+            assert len(arguments) > 1
+
+            # when/then
+            assert all(argument.is_shared() for argument in arguments)
+            with pytest.raises(TypeError):
+                arguments[0].data = 99
+
+            assert all(argument.data == 1 for argument in arguments)
+
+    def test_parse_sequential(self) -> None:
+        """
+        Tests that consecutive values are parsed from a stream that is not seekable,
+        without consuming the data behind them.
+        """
+
+        # given
+        data: bytes = bytes([3, 0, 0, 0, 5, 5, 1, 0, 2, 0, 7]) + b"rest"
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, data)
+        os.close(write_fd)
+
+        with os.fdopen(read_fd, "rb") as stream:
+            # when
+            values: list[Optional[int | float]] = [
+                VariableData.parse(stream).data for _ in range(4)
+            ]
+
+            # then
+            assert values == [5, 1, None, 7]
+            assert stream.read() == b"rest"
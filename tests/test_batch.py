@@ -0,0 +1,138 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+from typing import Literal, Optional
+
+import pytest
+
+from sse_pex_interface.batch import BatchResult, MapResult, map_many, parse_many
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import CompactCode
+
+
+def count_functions(pex_file: PexFile) -> int:
+    return sum(
+        len(state.functions)
+        for object in pex_file.objects
+        for state in object.data.states
+    )
+
+
+def fail(pex_file: PexFile) -> None:
+    raise RuntimeError("Failed!")
+
+
+class TestBatch:
+    """
+    Tests parsing many PEX files in parallel.
+    """
+
+    @pytest.mark.parametrize("mode", ["process", "thread"])
+    def test_parse_many(
+        self, mode: Literal["process", "thread"], tmp_path: Path
+    ) -> None:
+        """
+        Tests that all files of a batch are parsed and that errors are reported per
+        file.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        pex_file_paths: list[Path] = [
+            test_data_path / "_wetquestscript.pex",
+            test_data_path / "_wetquestscript_german.pex",
+        ]
+        invalid_file_path: Path = tmp_path / "invalid.pex"
+        invalid_file_path.write_bytes(b"\x00\x01\x02")
+
+        # when
+        results: dict[Path, BatchResult] = {
+            result.path: result
+            for result in parse_many(
+                [*pex_file_paths, invalid_file_path],
+                workers=2,
+                mode=mode,
+            )
+        }
+
+        # then
+        assert len(results) == 3
+        for pex_file_path in pex_file_paths:
+            assert results[pex_file_path].error is None
+            assert results[pex_file_path].pex_file == PexFile.from_path(
+                pex_file_path, compact=mode == "process"
+            )
+        assert results[invalid_file_path].pex_file is None
+        assert results[invalid_file_path].error is not None
+
+    @pytest.mark.parametrize(
+        "mode, compact, expected_compact",
+        [
+            ("process", None, True),
+            ("process", False, False),
+            ("thread", None, False),
+            ("thread", True, True),
+        ],
+    )
+    def test_parse_many_compact(
+        self,
+        mode: Literal["process", "thread"],
+        compact: Optional[bool],
+        expected_compact: bool,
+    ) -> None:
+        """
+        Tests that files are parsed compactly in the workers, by default in process
+        mode.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+
+        # when
+        results: list[BatchResult] = list(
+            parse_many([pex_file_path], workers=1, mode=mode, compact=compact)
+        )
+
+        # then
+        pex_file: Optional[PexFile] = results[0].pex_file
+        assert pex_file is not None
+        assert (
+            isinstance(
+                pex_file.objects[0].data.states[0].functions[0].function.instructions,
+                CompactCode,
+            )
+            == expected_compact
+        )
+        assert pex_file.to_bytes() == pex_file_path.read_bytes()
+
+    @pytest.mark.parametrize("mode", ["process", "thread"])
+    def test_map_many(self, mode: Literal["process", "thread"], tmp_path: Path) -> None:
+        """
+        Tests that a function is called with each file in the workers and that errors
+        of the function are raised with the file's path.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        invalid_file_path: Path = tmp_path / "invalid.pex"
+        invalid_file_path.write_bytes(b"\x00\x01\x02")
+
+        # when
+        results: dict[Path, MapResult[int]] = {
+            result.path: result
+            for result in map_many(
+                [pex_file_path, invalid_file_path], count_functions, mode=mode
+            )
+        }
+
+        # then
+        assert results[pex_file_path] == MapResult(pex_file_path, 14, None)
+        assert results[invalid_file_path].value is None
+        assert results[invalid_file_path].error is not None
+
+        # when/then
+        with pytest.raises(RuntimeError) as exc_info:
+            list(map_many([pex_file_path], fail, mode=mode))
+        assert str(pex_file_path) in "".join(exc_info.value.__notes__)
@@ -0,0 +1,204 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sse_pex_interface.cache import PexCache
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import CompactCode
+
+
+class TestPexCache:
+    """
+    Tests the persistent parse cache.
+    """
+
+    def test_parse(self, tmp_path: Path) -> None:
+        """
+        Tests that parsed files are stored and loaded again from the cache.
+        """
+
+        # given
+        pex_file_path: Path = tmp_path / "_wetquestscript.pex"
+        shutil.copy(
+            Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex", pex_file_path
+        )
+        expected: PexFile = PexFile.from_path(pex_file_path)
+
+        # when
+        with PexCache(tmp_path / "cache") as cache:
+            cache.parse(pex_file_path)
+
+        with PexCache(tmp_path / "cache") as cache:
+            # then
+            assert pex_file_path in cache
+            assert cache.parse(pex_file_path) == expected
+
+    def test_parse_modified(self, tmp_path: Path) -> None:
+        """
+        Tests that an entry is not used anymore once its file is modified.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        pex_file_path: Path = tmp_path / "script.pex"
+        shutil.copy(test_data_path / "_wetquestscript.pex", pex_file_path)
+        stat: os.stat_result = pex_file_path.stat()
+
+        with PexCache(tmp_path / "cache", use_content_hash=True) as cache:
+            cache.parse(pex_file_path)
+
+            # when (the content changes while size and modification time stay)
+            shutil.copy(test_data_path / "_wetquestscript_german.pex", pex_file_path)
+            os.utime(pex_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            pex_file: PexFile = cache.parse(pex_file_path)
+
+        # then
+        assert pex_file == PexFile.from_path(pex_file_path)
+
+    def test_eviction(self, tmp_path: Path) -> None:
+        """
+        Tests that the least recently used entries are evicted when the cache is full.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        paths: list[Path] = []
+        for name in ["a.pex", "b.pex", "c.pex"]:
+            paths.append(tmp_path / name)
+            shutil.copy(test_data_path / "_wetquestscript.pex", paths[-1])
+        with PexCache(tmp_path / "other_cache") as cache:
+            cache.parse(paths[0])
+            entry_size: int = cache.size
+
+        with PexCache(tmp_path / "cache", max_size=2 * entry_size) as cache:
+            cache.parse(paths[0])
+            cache.parse(paths[1])
+            cache.parse(paths[0])
+
+            # when
+            cache.parse(paths[2])
+
+            # then
+            assert len(cache) == 2
+            assert paths[0] in cache
+            assert paths[1] not in cache
+            assert paths[2] in cache
+
+    def test_validation(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that entries of files parsed without validation are only used if no
+        validation is required and that entries of other format versions are not used.
+        """
+
+        # given
+        pex_file_path: Path = tmp_path / "_wetquestscript.pex"
+        shutil.copy(
+            Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex", pex_file_path
+        )
+        parsed: list[bool] = []
+        from_buffer = PexFile.from_buffer
+
+        def count_parses(*args: Any, **kwargs: Any) -> PexFile:
+            parsed.append(kwargs["validate"])
+            return from_buffer(*args, **kwargs)
+
+        monkeypatch.setattr(PexFile, "from_buffer", count_parses)
+
+        with PexCache(tmp_path / "cache") as cache:
+            # when
+            cache.parse(pex_file_path, validate=False)
+            cache.parse(pex_file_path, validate=False)
+            cache.parse(pex_file_path)
+            pex_file: PexFile = cache.parse(pex_file_path)
+            cache.parse(pex_file_path, validate=False)
+
+            # then
+            assert parsed == [False, True]
+            assert pex_file.to_bytes() == pex_file_path.read_bytes()
+
+        # when
+        with sqlite3.connect(tmp_path / "cache" / PexCache.DATABASE_NAME) as connection:
+            connection.execute("UPDATE entries SET version = 1")
+        connection.close()
+
+        with PexCache(tmp_path / "cache") as cache:
+            cache.parse(pex_file_path)
+
+        # then
+        assert parsed == [False, True, True]
+
+    def test_compact(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that entries are only used for the representation of instructions they
+        were parsed with.
+        """
+
+        # given
+        pex_file_path: Path = tmp_path / "_wetquestscript.pex"
+        shutil.copy(
+            Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex", pex_file_path
+        )
+        parsed: list[bool] = []
+        from_buffer = PexFile.from_buffer
+
+        def count_parses(*args: Any, **kwargs: Any) -> PexFile:
+            parsed.append(kwargs["compact"])
+            return from_buffer(*args, **kwargs)
+
+        monkeypatch.setattr(PexFile, "from_buffer", count_parses)
+
+        with PexCache(tmp_path / "cache") as cache:
+            # when
+            pex_file: PexFile = cache.parse(pex_file_path)
+            compact_file: PexFile = cache.parse(pex_file_path, compact=True)
+            cached_compact_file: PexFile = cache.parse(pex_file_path, compact=True)
+
+        # then
+        assert parsed == [False, True]
+        assert isinstance(
+            pex_file.objects[0].data.states[0].functions[0].function.instructions,
+            list,
+        )
+        for compact_pex_file in [compact_file, cached_compact_file]:
+            assert isinstance(
+                compact_pex_file.objects[0]
+                .data.states[0]
+                .functions[0]
+                .function.instructions,
+                CompactCode,
+            )
+            assert compact_pex_file.to_bytes() == pex_file_path.read_bytes()
+
+    def test_entry_too_large(self, tmp_path: Path) -> None:
+        """
+        Tests that files whose entries exceed the maximum size are not stored.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        paths: list[Path] = [tmp_path / "a.pex", tmp_path / "b.pex"]
+        shutil.copy(test_data_path / "_wetquestscript.pex", paths[0])
+        shutil.copy(test_data_path / "_wetquestscript.pex", paths[1])
+        with PexCache(tmp_path / "other_cache", max_size=None) as cache:
+            cache.parse(paths[0], compact=True)
+            compact_size: int = cache.size
+
+        with PexCache(tmp_path / "cache", max_size=compact_size) as cache:
+            cache.parse(paths[0], compact=True)
+
+            # when
+            pex_file: PexFile = cache.parse(paths[1])
+
+            # then
+            assert pex_file == PexFile.from_path(paths[1])
+            assert paths[0] in cache
+            assert paths[1] not in cache
+            assert cache.size == compact_size
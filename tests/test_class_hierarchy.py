@@ -0,0 +1,199 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from sse_pex_interface.class_hierarchy import ClassHierarchy
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import NamedFunction, ObjectData, State
+from sse_pex_interface.symbol_index import PropertySymbol, SymbolLocation
+
+
+class TestClassHierarchy:
+    """
+    Tests `sse_pex_interface.class_hierarchy.ClassHierarchy`.
+    """
+
+    @staticmethod
+    def create_scripts(path: Path, parent_class_name: str = "") -> None:
+        """
+        Creates the child script "_wetquestscript.pex" in a directory and its parent
+        script "Quest.pex" in a subdirectory "parent". The parent has a function
+        "ParentOnly" and a property "ParentProperty" and overrides "Maintenance" in the
+        state "Running".
+        """
+
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        shutil.copy(
+            test_data_path / "_wetquestscript.pex", path / "_wetquestscript.pex"
+        )
+
+        pex_file: PexFile = PexFile.from_path(test_data_path / "_wetquestscript.pex")
+        data: ObjectData = pex_file.objects[0].data
+        functions: list[NamedFunction] = data.states[0].functions
+        pex_file.objects[0].name_index = pex_file.string_table.index("Quest")
+        data.parent_class_name = pex_file.string_table.intern(parent_class_name)
+        data.properties = [
+            data.properties[0].model_copy(
+                update={"name": pex_file.string_table.intern("ParentProperty")}
+            )
+        ]
+        data.states = [
+            data.states[0].model_copy(
+                update={
+                    "functions": [
+                        functions[0].model_copy(
+                            update={
+                                "function_name": pex_file.string_table.intern(
+                                    "ParentOnly"
+                                )
+                            }
+                        )
+                    ]
+                }
+            ),
+            State(
+                name=pex_file.string_table.intern("Running"),
+                functions=[
+                    function
+                    for function in functions
+                    if pex_file.string_table[function.function_name] == "Maintenance"
+                ],
+            ),
+        ]
+
+        (path / "parent").mkdir()
+        (path / "parent" / "Quest.pex").write_bytes(pex_file.to_bytes())
+
+    def test_get_chain(self, tmp_path: Path) -> None:
+        """
+        Tests resolving the inheritance chain of a class through the search path.
+        """
+
+        # given
+        TestClassHierarchy.create_scripts(tmp_path)
+        hierarchy = ClassHierarchy([tmp_path, tmp_path / "parent"])
+
+        # when
+        chain: list[str] = hierarchy.get_chain("_WetQuestScript")
+
+        # then
+        assert chain == ["_wetquestscript", "Quest"]
+        assert hierarchy.get_chain("quest") == ["Quest"]
+        assert hierarchy.get_chain("Unknown") == []
+        assert hierarchy.find_file("QUEST") == tmp_path / "parent" / "Quest.pex"
+
+    def test_get_functions(self, tmp_path: Path) -> None:
+        """
+        Tests resolving the effective functions of a class in a state.
+        """
+
+        # given
+        TestClassHierarchy.create_scripts(tmp_path)
+        hierarchy = ClassHierarchy([tmp_path, tmp_path / "parent"])
+        parent_path: str = str(tmp_path / "parent" / "Quest.pex")
+        child_path: str = str(tmp_path / "_wetquestscript.pex")
+
+        # when
+        functions: dict[str, SymbolLocation] = hierarchy.get_functions(
+            "_wetquestscript"
+        )
+        running: dict[str, SymbolLocation] = hierarchy.get_functions(
+            "_wetquestscript", "running"
+        )
+
+        # then
+        assert len(functions) == 15
+        assert functions["parentonly"] == SymbolLocation(
+            parent_path, "Quest", "", "ParentOnly"
+        )
+        assert functions["maintenance"] == SymbolLocation(
+            child_path, "_wetquestscript", "", "Maintenance"
+        )
+        assert running["maintenance"] == SymbolLocation(
+            parent_path, "Quest", "Running", "Maintenance"
+        )
+        assert hierarchy.get_function("_wetquestscript", "OnInit", "Running") == (
+            SymbolLocation(child_path, "_wetquestscript", "", "OnInit")
+        )
+        assert hierarchy.get_function("_wetquestscript", "Unknown") is None
+
+    def test_get_properties(self, tmp_path: Path) -> None:
+        """
+        Tests resolving the effective properties of a class.
+        """
+
+        # given
+        TestClassHierarchy.create_scripts(tmp_path)
+        hierarchy = ClassHierarchy([tmp_path, tmp_path / "parent"])
+
+        # when
+        properties: dict[str, PropertySymbol] = hierarchy.get_properties(
+            "_wetquestscript"
+        )
+
+        # then
+        property: Optional[PropertySymbol] = hierarchy.get_property(
+            "_wetquestscript", "parentproperty"
+        )
+        assert property is not None
+        assert property.object_name == "Quest"
+        assert properties["parentproperty"] == property
+        assert properties["dgcoldworld"].object_name == "_wetquestscript"
+        assert len(hierarchy.get_properties("Quest")) == 1
+
+    def test_cyclic_inheritance(self, tmp_path: Path) -> None:
+        """
+        Tests that cyclic inheritance is detected.
+        """
+
+        # given
+        TestClassHierarchy.create_scripts(tmp_path, parent_class_name="_wetquestscript")
+        hierarchy = ClassHierarchy([tmp_path, tmp_path / "parent"])
+
+        # when/then
+        with pytest.raises(ValueError):
+            hierarchy.get_chain("_wetquestscript")
+
+    def test_mismatched_file(self, tmp_path: Path) -> None:
+        """
+        Tests that a class is not resolved from a file named like it that does not
+        contain an object of the class.
+        """
+
+        # given
+        TestClassHierarchy.create_scripts(tmp_path)
+        shutil.copy(tmp_path / "_wetquestscript.pex", tmp_path / "Other.pex")
+        hierarchy = ClassHierarchy([tmp_path, tmp_path / "parent"])
+
+        # when
+        chain: list[str] = hierarchy.get_chain("Other")
+
+        # then
+        assert chain == []
+        assert hierarchy.get_class("Other") is None
+        assert hierarchy.get_functions("Other") == {}
+        assert hierarchy.get_chain("_wetquestscript") == ["_wetquestscript", "Quest"]
+
+    def test_find_file_extension_case(self, tmp_path: Path) -> None:
+        """
+        Tests that files are found regardless of the case of their extension.
+        """
+
+        # given
+        TestClassHierarchy.create_scripts(tmp_path)
+        (tmp_path / "parent" / "Quest.pex").rename(tmp_path / "parent" / "Quest.PEX")
+        (tmp_path / "parent" / "Quest.psc").write_text("Scriptname Quest")
+        hierarchy = ClassHierarchy([tmp_path, tmp_path / "parent"])
+
+        # when
+        path: Optional[Path] = hierarchy.find_file("quest")
+
+        # then
+        assert path == tmp_path / "parent" / "Quest.PEX"
+        assert hierarchy.get_chain("_wetquestscript") == ["_wetquestscript", "Quest"]
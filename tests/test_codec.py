@@ -0,0 +1,132 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import pytest
+
+from sse_pex_interface import _codec
+from sse_pex_interface.buffer_writer import BufferWriter
+from sse_pex_interface.sections import Instruction, VariableData
+
+
+class TestCodec:
+    """
+    Tests the hot loops in `sse_pex_interface._codec`.
+    """
+
+    def test_instructions(self) -> None:
+        """
+        Tests decoding, skipping and encoding a run of instructions, including
+        varargs and negative integers.
+        """
+
+        # given
+        instructions: list[Instruction] = [
+            Instruction(
+                op=Instruction.OpCode.CALLSTATIC,
+                arguments=[
+                    VariableData(
+                        type=VariableData.Type.IDENTIFIER,
+                        data=1,
+                        integer_unsigned=False,
+                    ),
+                    VariableData(
+                        type=VariableData.Type.IDENTIFIER,
+                        data=2,
+                        integer_unsigned=False,
+                    ),
+                    VariableData(
+                        type=VariableData.Type.STRING, data=3, integer_unsigned=False
+                    ),
+                    VariableData(
+                        type=VariableData.Type.INTEGER, data=2, integer_unsigned=False
+                    ),
+                    VariableData(
+                        type=VariableData.Type.INTEGER, data=-5, integer_unsigned=False
+                    ),
+                    VariableData(
+                        type=VariableData.Type.FLOAT, data=1.5, integer_unsigned=False
+                    ),
+                ],
+            ),
+            Instruction(
+                op=Instruction.OpCode.JMPF,
+                arguments=[
+                    VariableData(
+                        type=VariableData.Type.BOOL, data=1, integer_unsigned=False
+                    ),
+                    VariableData(
+                        type=VariableData.Type.NULL, data=None, integer_unsigned=False
+                    ),
+                ],
+            ),
+        ]
+        writer = BufferWriter()
+        for instruction in instructions:
+            instruction.to_writer(writer)
+        data: bytes = writer.getvalue()
+
+        # when
+        ops, arg_starts, arg_types, arg_values, offset = _codec.decode_instructions(
+            memoryview(data),
+            0,
+            len(instructions),
+            Instruction.FIXED_ARG_COUNTS,
+            Instruction.HAS_VARARGS,
+        )
+        skip_offset: int = _codec.skip_instructions(
+            memoryview(data),
+            0,
+            len(instructions),
+            Instruction.FIXED_ARG_COUNTS,
+            Instruction.HAS_VARARGS,
+        )
+        output = bytearray()
+        _codec.encode_instructions(ops, arg_starts, arg_types, arg_values, output)
+
+        # then
+        assert ops == [Instruction.OpCode.CALLSTATIC, Instruction.OpCode.JMPF]
+        assert arg_starts == [0, 6, 8]
+        assert arg_types == [1, 1, 2, 3, 3, 4, 5, 0]
+        assert arg_values[3:5] == [2, 0xFFFFFFFB]
+        assert offset == skip_offset == len(data)
+        assert bytes(output) == data
+
+    def test_invalid_opcode(self) -> None:
+        """
+        Tests that an invalid opcode is rejected.
+        """
+
+        # given
+        data = memoryview(b"\xff")
+
+        # when/then
+        with pytest.raises(ValueError):
+            _codec.decode_instructions(
+                data, 0, 1, Instruction.FIXED_ARG_COUNTS, Instruction.HAS_VARARGS
+            )
+
+        with pytest.raises(ValueError):
+            _codec.skip_instructions(
+                data, 0, 1, Instruction.FIXED_ARG_COUNTS, Instruction.HAS_VARARGS
+            )
+
+    def test_read_wstrings(self) -> None:
+        """
+        Tests decoding a run of strings and that truncated strings are rejected.
+        """
+
+        # given
+        data = memoryview(b"\x00\x03abc\x00\x00\x00\x02\xe4b")
+
+        # when
+        strings: list[str]
+        offset: int
+        strings, offset = _codec.read_wstrings(data, 0, 3, "cp1252")
+
+        # then
+        assert strings == ["abc", "", "äb"]
+        assert offset == len(data)
+
+        with pytest.raises(EOFError):
+            _codec.read_wstrings(data[:-1], 0, 3, "cp1252")
@@ -0,0 +1,166 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from array import array
+from collections.abc import Buffer
+from io import BufferedReader, BytesIO, RawIOBase
+from typing import override
+
+import pytest
+
+from sse_pex_interface.datatypes import IntegerCodec, StringCodec, StructLayout
+
+
+class TestIntegerCodec:
+    """
+    Tests for the IntegerCodec class.
+    """
+
+    def test_parse_and_dump_array(self) -> None:
+        """
+        Tests that runs of integers are parsed and dumped in bulk as big-endian.
+        """
+
+        # given
+        output = BytesIO()
+
+        # when
+        IntegerCodec.dump_array(
+            [1, 0x1234, 0xFFFF], IntegerCodec.IntType.UInt16, output
+        )
+        output.seek(0)
+        values: array[int] = IntegerCodec.parse_array(
+            output, IntegerCodec.IntType.UInt16, 3
+        )
+
+        # then
+        assert output.getvalue() == b"\x00\x01\x12\x34\xff\xff"
+        assert values == array("H", [1, 0x1234, 0xFFFF])
+
+
+class TestStructLayout:
+    """
+    Tests for the StructLayout class.
+    """
+
+    def test_compiled_format(self) -> None:
+        """
+        Tests that the fields are compiled into a single big-endian struct.
+        """
+
+        # when
+        layout = StructLayout(
+            ("return_type", IntegerCodec.IntType.UInt16),
+            ("docstring", IntegerCodec.IntType.UInt16),
+            ("user_flags", IntegerCodec.IntType.UInt32),
+            ("flags", IntegerCodec.IntType.UInt8),
+            ("offset", IntegerCodec.IntType.Int32),
+        )
+
+        # then
+        assert layout.compiled.format == ">HHIBi"
+        assert layout.size == 13
+        assert layout.field_names == (
+            "return_type",
+            "docstring",
+            "user_flags",
+            "flags",
+            "offset",
+        )
+
+    def test_parse_and_dump(self) -> None:
+        """
+        Tests that a record is parsed and dumped symmetrically.
+        """
+
+        # given
+        layout = StructLayout(
+            ("name_index", IntegerCodec.IntType.UInt16),
+            ("flag_index", IntegerCodec.IntType.UInt8),
+        )
+        output = BytesIO()
+
+        # when
+        layout.dump((0x1234, 7), output)
+        output.seek(0)
+        values = layout.parse(output)
+
+        # then
+        assert output.getvalue() == b"\x12\x34\x07"
+        assert values == (0x1234, 7)
+
+
+class TestStringCodec:
+    """
+    Tests for the StringCodec class.
+    """
+
+    DATA: bytes = b"GetState\x00\x00GotoState\x00OnUpdate\x00rest"
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+    def test_parse_list(self, chunk_size: int, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that a list of strings is parsed across chunk boundaries and that the
+        stream is left right behind the list.
+        """
+
+        # given
+        monkeypatch.setattr(StringCodec, "LIST_CHUNK_SIZE", chunk_size)
+        stream = BytesIO(TestStringCodec.DATA)
+
+        # when
+        strings: list[str] = StringCodec.parse(stream, StringCodec.StrType.List, 3)
+
+        # then
+        assert strings == ["GetState", "GotoState", "OnUpdate"]
+        assert stream.read() == b"rest"
+
+    def test_parse_list_not_seekable(self) -> None:
+        """
+        Tests that a non-seekable stream is not read beyond the end of the list.
+        """
+
+        # given
+        stream = BufferedReader(RawNonSeekable(TestStringCodec.DATA))
+
+        # when
+        strings: list[str] = StringCodec.parse(stream, StringCodec.StrType.List, 2)
+
+        # then
+        assert strings == ["GetState", "GotoState"]
+        assert stream.read() == b"OnUpdate\x00rest"
+
+    def test_parse_list_eof(self) -> None:
+        """
+        Tests that parsing a list stops at the end of the stream.
+        """
+
+        # given
+        stream = BytesIO(b"GetState\x00Goto")
+
+        # when
+        strings: list[str] = StringCodec.parse(stream, StringCodec.StrType.List, 3)
+
+        # then
+        assert strings == ["GetState", "Goto"]
+
+
+class RawNonSeekable(RawIOBase):
+    """
+    Raw stream that cannot seek.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.__stream = BytesIO(data)
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def readinto(self, buffer: Buffer) -> int:
+        data: bytes = self.__stream.read(len(memoryview(buffer)))
+        memoryview(buffer)[: len(data)] = data
+
+        return len(data)
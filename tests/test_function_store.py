@@ -0,0 +1,163 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from sse_pex_interface.function_store import FunctionLocation, FunctionStore
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import Function, Object, Property
+from sse_pex_interface.string_table import StringTable
+
+
+class TestFunctionStore:
+    """
+    Tests `sse_pex_interface.function_store.FunctionStore`.
+    """
+
+    def test_add_file(self, tmp_path: Path) -> None:
+        """
+        Tests that identical functions of different files are stored only once.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        pex_file: PexFile = PexFile.from_path(test_data_path / "_wetquestscript.pex")
+        other_file: PexFile = PexFile.from_path(
+            test_data_path / "_wetquestscript_german.pex"
+        )
+        function: Function = pex_file.objects[0].data.states[0].functions[0].function
+
+        # when
+        with FunctionStore(tmp_path / "functions.sqlite") as store:
+            fingerprints: list[bytes] = store.add_file(pex_file, "a.pex")
+            store.add_file(other_file, "b.pex")
+            count: int = len(store)
+
+        with FunctionStore(tmp_path / "functions.sqlite") as store:
+            # then
+            # All functions but "Maintenance" are equal in both files
+            assert count == len(store) == len(fingerprints) + 1
+            assert fingerprints[0] in store
+            locations: list[FunctionLocation] = store.get_locations(fingerprints[0])
+            assert [location.path for location in locations] == ["a.pex", "b.pex"]
+            assert (
+                locations[0].function_name
+                == (
+                    pex_file.string_table[
+                        pex_file.objects[0].data.states[0].functions[0].function_name
+                    ]
+                )
+            )
+
+            stored: Optional[Function] = store.get(
+                fingerprints[0], pex_file.string_table
+            )
+            assert stored == function
+            assert store.get(bytes(16), StringTable()) is None
+
+    def test_remove(self) -> None:
+        """
+        Tests that functions are removed with the last file they are located in.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+
+        with FunctionStore() as store:
+            fingerprints: list[bytes] = store.add_file(pex_file, "a.pex")
+            store.add_file(pex_file, "b.pex")
+
+            # when
+            store.remove("a.pex")
+
+            # then
+            assert fingerprints[0] in store
+            assert store.get_locations(fingerprints[0])[0].path == "b.pex"
+
+            # when
+            store.remove("b.pex")
+
+            # then
+            assert len(store) == 0
+            assert store.get_locations(fingerprints[0]) == []
+
+    def test_add_file_property_handlers(self) -> None:
+        """
+        Tests that the handlers of properties are stored with their own locations.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+        string_table: StringTable = pex_file.string_table
+        object: Object = pex_file.objects[0]
+        property: Property = object.data.properties[0]
+        property.read_handler = (
+            object.data.states[0].functions[0].function.model_copy(deep=True)
+        )
+
+        with FunctionStore() as store:
+            # when
+            fingerprints: list[bytes] = store.add_file(pex_file, "a.pex")
+
+            # then
+            assert len(fingerprints) == 15
+            assert store.get_locations(fingerprints[0]) == [
+                FunctionLocation(
+                    "a.pex",
+                    string_table[object.name_index],
+                    string_table[object.data.states[0].name],
+                    string_table[object.data.states[0].functions[0].function_name],
+                ),
+                FunctionLocation(
+                    "a.pex",
+                    string_table[object.name_index],
+                    "",
+                    string_table[property.name],
+                    "read",
+                ),
+            ]
+
+            # when
+            property.read_handler = None
+            store.add_file(pex_file, "a.pex")
+
+            # then
+            assert len(store) == 14
+            assert len(store.get_locations(fingerprints[0])) == 1
+
+    def test_add_replace(self) -> None:
+        """
+        Tests that a function replaced at its location is removed if it has no
+        locations left.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+        functions: list[Function] = [
+            named_function.function
+            for named_function in pex_file.objects[0].data.states[0].functions[:2]
+        ]
+        location = FunctionLocation("a.pex", "Object", "", "Function")
+
+        with FunctionStore() as store:
+            first: bytes = store.add(functions[0], pex_file.string_table, location)
+
+            # when
+            second: bytes = store.add(functions[1], pex_file.string_table, location)
+
+            # then
+            assert len(store) == 1
+            assert first not in store
+            assert store.get_locations(second) == [location]
+
+            # when
+            store.add(functions[1], pex_file.string_table, location)
+
+            # then
+            assert len(store) == 1
+            assert second in store
@@ -0,0 +1,79 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from sse_pex_interface.patcher import PexPatcher
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import Function, Property
+
+
+class TestPexPatcher:
+    """
+    Tests patching single sections of a PEX file.
+    """
+
+    def test_unchanged(self) -> None:
+        """
+        Tests that a file without patches is written unchanged.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        patcher = PexPatcher(pex_file_path)
+
+        # when
+        patcher.set_string(0, patcher.string_table[0])
+        data: bytes = patcher.to_bytes()
+
+        # then
+        assert data == pex_file_path.read_bytes()
+
+    def test_commit(self, tmp_path: Path) -> None:
+        """
+        Tests that patched sections are written and the object size is fixed up.
+        """
+
+        # given
+        pex_file_path: Path = tmp_path / "_wetquestscript.pex"
+        shutil.copy(
+            Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex", pex_file_path
+        )
+        expected: PexFile = PexFile.from_path(pex_file_path)
+        expected.string_table[0] = "_wetquestscript_patched"
+        expected_function: Function = (
+            expected.objects[0].data.states[0].functions[0].function
+        )
+        expected_function.locals = expected_function.locals[:-1]
+        expected.objects[0].data.properties[0].user_flags = 1
+
+        # when
+        patcher = PexPatcher(pex_file_path)
+        function: Function = patcher.get_function(0, 0, 0)
+        function.locals = function.locals[:-1]
+        property: Property = patcher.get_property(0, 0)
+        property.user_flags = 1
+        patcher.set_string(0, "_wetquestscript_patched")
+        patcher.set_function(0, 0, 0, function).set_property(0, 0, property)
+        patcher.commit()
+
+        # then
+        assert pex_file_path.read_bytes() == expected.to_bytes()
+        assert patcher.get_function(0, 0, 0) == expected_function
+
+    def test_invalid_property_flags(self) -> None:
+        """
+        Tests that property flags requiring missing data are rejected.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        patcher = PexPatcher(pex_file_path)
+
+        # when/then
+        with pytest.raises(ValueError):
+            patcher.set_property_flags(0, 0, 0b01)
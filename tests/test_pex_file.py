@@ -2,11 +2,16 @@
 Copyright (c) Cutleast
 """
 
+import mmap
+import pickle
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.pex_index import FunctionEntry, ObjectEntry, PexIndex
+from sse_pex_interface.sections import Function, Header, ObjectData
+from sse_pex_interface.string_table import StringTable
 
 
 class TestPexFile:
@@ -70,3 +75,262 @@ class TestPexFile:
 
         # then
         assert dumped_data == original_data
+
+    def test_from_buffer(self) -> None:
+        """
+        Tests parsing a PEX file from different kinds of buffers.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        data: bytes = pex_file_path.read_bytes()
+        with pex_file_path.open("rb") as stream:
+            expected: PexFile = PexFile.parse(stream)
+
+        # when
+        from_bytes: PexFile = PexFile.from_buffer(data)
+        from_memoryview: PexFile = PexFile.from_buffer(memoryview(bytearray(data)))
+        with (
+            pex_file_path.open("rb") as stream,
+            mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            from_mmap: PexFile = PexFile.from_buffer(buffer)
+
+        # then
+        assert from_bytes == expected
+        assert from_memoryview == expected
+        assert from_mmap == expected
+
+    def test_from_path(self) -> None:
+        """
+        Tests parsing a PEX file directly from its path.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        with pex_file_path.open("rb") as stream:
+            expected: PexFile = PexFile.parse(stream)
+
+        # when
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+
+        # then
+        assert pex_file == expected
+
+    def test_parse_without_validation(self) -> None:
+        """
+        Tests parsing a PEX file in trusted mode without validation.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        with pex_file_path.open("rb") as stream:
+            expected: PexFile = PexFile.parse(stream)
+
+        # when
+        with pex_file_path.open("rb") as stream:
+            pex_file: PexFile = PexFile.parse(stream, validate=False)
+
+        # then
+        assert pex_file == expected
+        pex_file.revalidate()
+
+        # when (verify that the parser is still symmetrical)
+        output = BytesIO()
+        pex_file.dump(output)
+
+        # then
+        assert output.getvalue() == pex_file_path.read_bytes()
+
+    def test_parse_lazy(self) -> None:
+        """
+        Tests parsing a PEX file lazily.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        expected: PexFile = PexFile.from_path(pex_file_path)
+
+        # when
+        pex_file: PexFile = PexFile.from_path(pex_file_path, lazy=True)
+
+        # then
+        assert pex_file.header == expected.header
+        assert pex_file.string_table == expected.string_table
+        assert pex_file.debug_info.get_raw_data() is not None
+        assert pex_file.objects[0].data.get_raw_data() is not None
+
+        # when
+        properties = pex_file.objects[0].data.properties
+
+        # then
+        assert pex_file.objects[0].data.get_raw_data() is None
+        assert properties == expected.objects[0].data.properties
+        assert pex_file.objects[0].data.states[0].functions[0].function.get_raw_data()
+        assert pex_file == expected
+
+    def test_lazy_views(self) -> None:
+        """
+        Tests that the views of the fields of a lazily parsed model decode it.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        expected: ObjectData = PexFile.from_path(pex_file_path).objects[0].data
+        pex_file: PexFile = PexFile.from_path(pex_file_path, lazy=True)
+
+        # when
+        fields_set: set[str] = pex_file.objects[0].data.model_fields_set
+
+        # then
+        assert fields_set == expected.model_fields_set
+        assert pex_file.objects[0].data.get_raw_data() is not None
+
+        # when
+        fields: dict[str, Any] = dict(pex_file.objects[0].data)
+
+        # then
+        assert fields == dict(expected)
+        assert pex_file.objects[0].data.get_raw_data() is None
+
+    def test_dump_lazy(self) -> None:
+        """
+        Tests that lazily parsed data is dumped verbatim unless it was modified.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        original_data: bytes = pex_file_path.read_bytes()
+        pex_file: PexFile = PexFile.from_path(pex_file_path, lazy=True)
+        output = BytesIO()
+
+        # when
+        pex_file.dump(output)
+
+        # then
+        assert output.getvalue() == original_data
+
+        # when
+        pex_file.objects[0].data.user_flags = 1
+        output = BytesIO()
+        pex_file.dump(output)
+        dumped_pex_file: PexFile = PexFile.from_buffer(output.getvalue())
+
+        # then
+        assert dumped_pex_file.objects[0].data.user_flags == 1
+        assert dumped_pex_file.debug_info == pex_file.debug_info
+
+    def test_pickle_lazy(self) -> None:
+        """
+        Tests that lazily parsed data survives pickling before it is decoded.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        expected: PexFile = PexFile.from_path(pex_file_path)
+        pex_file: PexFile = PexFile.from_path(pex_file_path, lazy=True)
+
+        # when
+        unpickled_pex_file: PexFile = pickle.loads(pickle.dumps(pex_file))
+
+        # then
+        assert unpickled_pex_file.objects[0].data.get_raw_data() is not None
+        assert unpickled_pex_file == expected
+        assert unpickled_pex_file.model_dump() == expected.model_dump()
+
+    def test_read_header(self) -> None:
+        """
+        Tests reading only the header of a PEX file.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+
+        # when
+        header: Header = PexFile.read_header(pex_file_path)
+
+        # then
+        assert header == PexFile.from_path(pex_file_path).header
+
+    def test_read_strings(self) -> None:
+        """
+        Tests reading only the string table of a PEX file.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+
+        # when
+        string_table: StringTable = PexFile.read_strings(pex_file_path)
+
+        # then
+        assert string_table == PexFile.from_path(pex_file_path).string_table
+
+    def test_to_bytes(self) -> None:
+        """
+        Tests serializing an entire PEX file into a single buffer.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+
+        # when
+        data: bytes = pex_file.to_bytes()
+
+        # then
+        assert data == pex_file_path.read_bytes()
+        assert pex_file.header.to_bytes() == data[: len(pex_file.header.to_bytes())]
+
+    def test_dump_resized_object(self) -> None:
+        """
+        Tests that the size of an object is recomputed when its data changes.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path, lazy=True)
+        original_size: int = pex_file.objects[0].size
+        assert pex_file.objects[0].data.byte_size() == original_size - 4
+
+        # when
+        pex_file.objects[0].data.variables.pop()
+        dumped_pex_file: PexFile = PexFile.from_buffer(pex_file.to_bytes())
+
+        # then
+        assert dumped_pex_file.objects[0].size < original_size
+        assert (
+            dumped_pex_file.objects[0].size == pex_file.objects[0].data.byte_size() + 4
+        )
+        assert dumped_pex_file.objects[0].data == pex_file.objects[0].data
+
+    def test_read_index(self) -> None:
+        """
+        Tests reading the table of contents of a PEX file.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        data: bytes = pex_file_path.read_bytes()
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+
+        # when
+        index: PexIndex = PexFile.read_index(pex_file_path)
+
+        # then
+        assert index.header.view(data) == pex_file.header.to_bytes()
+        assert index.string_table.offset == index.header.end
+        assert index.debug_info.view(data) == pex_file.debug_info.to_bytes()
+        assert pex_file.debug_info.functions is not None
+        assert len(index.debug_functions) == len(pex_file.debug_info.functions)
+        assert index.objects[-1].span.end == len(data)
+
+        object_entry: ObjectEntry = index.objects[0]
+        assert object_entry.data.view(data) == pex_file.objects[0].data.to_bytes()
+        assert object_entry.states[0].name_index == (
+            pex_file.objects[0].data.states[0].name
+        )
+
+        function_entry: FunctionEntry = object_entry.states[0].functions[0]
+        function: Function = Function.from_buffer(function_entry.function.view(data))
+        assert function == pex_file.objects[0].data.states[0].functions[0].function
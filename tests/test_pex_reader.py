@@ -0,0 +1,159 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+from typing import Literal, override
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.pex_reader import PexReader
+from sse_pex_interface.pex_visitor import PexVisitor
+from sse_pex_interface.sections import (
+    Instruction,
+    Property,
+    VariableData,
+    VariableType,
+)
+
+
+class RecordingVisitor(PexVisitor):
+    """
+    Visitor that records the strings, functions and calls of a file.
+    """
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.functions: list[tuple[int, int]] = []
+        self.handlers: list[tuple[int, Literal["read", "write"], int]] = []
+        self.calls: list[tuple[Instruction.OpCode, int | float | None]] = []
+        self.instruction_count: int = 0
+        self.depth: int = 0
+
+    @override
+    def on_string(self, index: int, string: str) -> None:
+        assert index == len(self.strings)
+        self.strings.append(string)
+
+    @override
+    def on_object_begin(
+        self, name: int, parent_class_name: int, auto_state_name: int
+    ) -> None:
+        self.depth += 1
+
+    @override
+    def on_object_end(self) -> None:
+        self.depth -= 1
+
+    @override
+    def on_property_handler(self, name: int, handler: Literal["read", "write"]) -> None:
+        # The handler belongs to the next visited function
+        self.handlers.append((name, handler, len(self.functions)))
+
+    @override
+    def on_function_begin(
+        self,
+        name: int,
+        return_type: int,
+        flags: int,
+        params: list[VariableType],
+        locals: list[VariableType],
+    ) -> None:
+        self.functions.append((name, len(locals)))
+
+    @override
+    def on_instruction(
+        self, op: Instruction.OpCode, arguments: list[VariableData]
+    ) -> None:
+        self.instruction_count += 1
+
+        if op in (Instruction.OpCode.CALLMETHOD, Instruction.OpCode.CALLSTATIC):
+            self.calls.append((op, arguments[0].data))
+
+
+class TestPexReader:
+    """
+    Tests `sse_pex_interface.pex_reader.PexReader`.
+    """
+
+    def test_read_path(self) -> None:
+        """
+        Tests that the reader visits the same contents as a full parse.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+        visitor = RecordingVisitor()
+
+        expected_functions: list[tuple[int, int]] = []
+        expected_calls: list[tuple[Instruction.OpCode, int | float | None]] = []
+        expected_instruction_count: int = 0
+        for object in pex_file.objects:
+            for property in object.data.properties:
+                for handler in (property.read_handler, property.write_handler):
+                    if handler is not None:
+                        expected_functions.append((property.name, len(handler.locals)))
+                        expected_instruction_count += len(handler.instructions)
+            for state in object.data.states:
+                for named_function in state.functions:
+                    function = named_function.function
+                    expected_functions.append(
+                        (named_function.function_name, len(function.locals))
+                    )
+                    expected_instruction_count += len(function.instructions)
+                    expected_calls.extend(
+                        (instruction.op, instruction.arguments[0].data)
+                        for instruction in function.instructions
+                        if instruction.op
+                        in (
+                            Instruction.OpCode.CALLMETHOD,
+                            Instruction.OpCode.CALLSTATIC,
+                        )
+                    )
+
+        # when
+        PexReader(visitor).read_path(pex_file_path)
+
+        # then
+        assert visitor.strings == list(pex_file.string_table)
+        assert visitor.functions == expected_functions
+        assert visitor.instruction_count == expected_instruction_count
+        assert visitor.calls == expected_calls
+        assert visitor.depth == 0
+
+    def test_property_handlers(self) -> None:
+        """
+        Tests that the read and write handlers of properties are told apart.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+        functions = pex_file.objects[0].data.states[0].functions
+        property: Property = pex_file.objects[0].data.properties[0]
+        pex_file.objects[0].data.properties[0] = property.model_copy(
+            update={
+                "flags": 0b011,
+                "auto_var_name": None,
+                "read_handler": functions[0].function,
+                "write_handler": functions[1].function,
+            }
+        )
+        visitor = RecordingVisitor()
+
+        # when
+        PexReader(visitor).read_buffer(pex_file.to_bytes())
+
+        # then
+        assert visitor.handlers == [
+            (property.name, "read", 0),
+            (property.name, "write", 1),
+        ]
+        assert visitor.functions[0] == (
+            property.name,
+            len(functions[0].function.locals),
+        )
+        assert visitor.functions[1] == (
+            property.name,
+            len(functions[1].function.locals),
+        )
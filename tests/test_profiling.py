@@ -0,0 +1,64 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+import pytest
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.profiling import ProfileStats, SectionStats, pex_profile
+from sse_pex_interface.sections import Header, Instruction
+
+
+class TestProfiling:
+    """
+    Tests `sse_pex_interface.profiling.pex_profile()`.
+    """
+
+    def test_profile(self) -> None:
+        """
+        Tests that parsing and dumping are recorded per section class.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        data: bytes = pex_file_path.read_bytes()
+        header_size: int = PexFile.index_buffer(data).header.size
+        from_reader = Instruction.__dict__["from_reader"]
+        to_writer = Header.__dict__["to_writer"]
+
+        # when
+        stats: ProfileStats
+        with pex_profile() as stats:
+            pex_file: PexFile = PexFile.from_buffer(data)
+            dumped: bytes = pex_file.to_bytes()
+
+        # then
+        assert dumped == data
+        assert Instruction.__dict__["from_reader"] is from_reader
+        assert Header.__dict__["to_writer"] is to_writer
+
+        header: SectionStats = stats.get("Header", "parse")
+        assert header.calls == 1
+        assert header.bytes == header_size
+
+        pex_file_stats: SectionStats = stats.get("PexFile", "parse")
+        assert pex_file_stats.bytes == len(data)
+        assert pex_file_stats.own_time <= pex_file_stats.total_time
+
+        instructions: SectionStats = stats.get("Instruction", "parse")
+        assert instructions.calls == stats.get("Instruction", "dump").calls > 0
+        assert stats.get("Instruction", "build").calls == instructions.calls
+        assert stats.get("PexFile", "dump").bytes == len(data)
+        assert stats.get("Unknown", "parse").calls == 0
+        assert "Instruction" in stats.format()
+
+    def test_nested_profile(self) -> None:
+        """
+        Tests that only one profile can be active at a time.
+        """
+
+        # when/then
+        with pex_profile(), pytest.raises(RuntimeError), pex_profile():
+            pass
@@ -0,0 +1,120 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import pickle
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.string_table import StringTable
+
+
+class TestStringTable:
+    """
+    Tests the indexed string table.
+    """
+
+    def test_intern(self) -> None:
+        """
+        Tests that interning returns existing indices and appends new strings.
+        """
+
+        # given
+        string_table = StringTable(["GetState", "GotoState", "OnUpdate"])
+
+        # when
+        existing_index: int = string_table.intern("OnUpdate")
+        new_index: int = string_table.intern("OnInit")
+
+        # then
+        assert existing_index == 2
+        assert new_index == 3
+        assert string_table == ["GetState", "GotoState", "OnUpdate", "OnInit"]
+        assert string_table.index("OnInit") == 3
+        assert "OnInit" in string_table
+
+    def test_modify(self) -> None:
+        """
+        Tests that the index stays consistent when the table is modified.
+        """
+
+        # given
+        string_table = StringTable(["a", "b", "a", "c"])
+
+        # when
+        string_table[0] = "d"
+
+        # then
+        assert string_table.index("a") == 2
+        assert string_table.index("d") == 0
+
+        # when
+        string_table[2] = "e"
+
+        # then
+        assert "a" not in string_table
+        with pytest.raises(ValueError):
+            string_table.index("a")
+
+        # when
+        del string_table[0]
+        string_table.insert(0, "c")
+
+        # then
+        assert string_table == ["c", "b", "e", "c"]
+        assert string_table.index("c") == 0
+        assert string_table.index("c", 1) == 3
+        assert string_table.index("b") == 1
+
+    @pytest.mark.parametrize(
+        "start, stop",
+        [(0, 4), (-3, 4), (-2, 4), (-10, 4), (0, -1), (0, -2), (-3, -1), (-1, -10)],
+    )
+    def test_index_bounds(self, start: int, stop: int) -> None:
+        """
+        Tests that the bounds of a search are interpreted like by `list.index()`.
+        """
+
+        # given
+        strings: list[str] = ["a", "b", "a", "c"]
+        string_table = StringTable(strings)
+
+        for value in ["a", "b", "c"]:
+            # when
+            expected: Optional[int] = (
+                strings.index(value, start, stop)
+                if value in strings[start:stop]
+                else None
+            )
+
+            # then
+            if expected is None:
+                with pytest.raises(ValueError):
+                    string_table.index(value, start, stop)
+            else:
+                assert string_table.index(value, start, stop) == expected
+
+    def test_pex_file(self) -> None:
+        """
+        Tests that the string table of a parsed PEX file is dumped in the same order.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path)
+
+        # when
+        unpickled_string_table: StringTable = pickle.loads(
+            pickle.dumps(pex_file.string_table)
+        )
+        pex_file.string_table = list(pex_file.string_table)  # type: ignore[assignment]
+
+        # then
+        assert isinstance(pex_file.string_table, StringTable)
+        assert pex_file.string_table.index("GotoState") == 3
+        assert unpickled_string_table == pex_file.string_table
+        assert pex_file.model_dump()["string_table"][:2] == ["_wetquestscript", ""]
+        assert PexFile.model_validate(pex_file.model_dump()) == pex_file
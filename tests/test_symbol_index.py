@@ -0,0 +1,130 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.sections import Instruction
+from sse_pex_interface.symbol_index import (
+    CallSite,
+    ObjectSymbol,
+    PropertySymbol,
+    SymbolIndex,
+    SymbolLocation,
+)
+
+
+class TestSymbolIndex:
+    """
+    Tests `sse_pex_interface.symbol_index.SymbolIndex`.
+    """
+
+    def test_add_file(self) -> None:
+        """
+        Tests looking up the symbols of a file by their names.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        pex_file: PexFile = PexFile.from_path(pex_file_path, compact=True)
+        index = SymbolIndex()
+
+        # when
+        index.add_file(pex_file, "a.pex")
+
+        # then
+        object: Optional[ObjectSymbol] = index.get_object("_WetQuestScript")
+        assert object is not None
+        assert object.parent_class_name == "Quest"
+        assert index.get_parent("_wetquestscript") == "Quest"
+        assert index.get_children("QUEST") == [object]
+        assert "Maintenance" in object.states[""]
+
+        property: Optional[PropertySymbol] = index.get_property(
+            "_wetquestscript", "dgcoldworld"
+        )
+        assert property is not None
+        assert property.type_name == "form[]"
+        assert property.auto_var_name == "::DGColdWorld_var"
+
+        assert index.get_functions("maintenance") == [
+            SymbolLocation("a.pex", "_wetquestscript", "", "Maintenance")
+        ]
+
+        call_sites: list[CallSite] = index.get_call_sites("AddForm", "FormList")
+        assert call_sites == index.get_call_sites("addform")
+        assert call_sites[0].op == Instruction.OpCode.CALLMETHOD
+        assert call_sites[0].location.function_name == "SetCoSCloaks"
+        assert (
+            pex_file.objects[0]
+            .data.states[0]
+            .functions[0]
+            .function.instructions.get_op(call_sites[0].instruction_index)
+            == Instruction.OpCode.CALLMETHOD
+        )
+        assert index.get_call_sites("Trace", "Debug")[0].op == (
+            Instruction.OpCode.CALLSTATIC
+        )
+        assert index.get_call_sites("Unknown") == []
+
+    def test_remove_file(self) -> None:
+        """
+        Tests that the symbols of a file are retracted when it is removed or replaced.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        pex_file: PexFile = PexFile.from_path(test_data_path / "_wetquestscript.pex")
+        other_file: PexFile = PexFile.from_path(
+            test_data_path / "_wetquestscript_german.pex"
+        )
+        index = SymbolIndex()
+        index.add_file(pex_file, "a.pex")
+        index.add_file(other_file, "b.pex")
+        call_site_count: int = len(index.get_call_sites("AddForm"))
+
+        # when
+        index.add_file(other_file, "b.pex")
+        index.remove_file("a.pex")
+
+        # then
+        assert index.paths == ["b.pex"]
+        assert "a.pex" not in index
+        object: Optional[ObjectSymbol] = index.get_object("_wetquestscript")
+        assert object is not None
+        assert object.path == "b.pex"
+        assert len(index.get_children("Quest")) == 1
+        assert len(index.get_call_sites("AddForm")) == call_site_count // 2
+
+        # when
+        index.remove_file("b.pex")
+
+        # then
+        assert len(index) == 0
+        assert index.get_object("_wetquestscript") is None
+        assert index.get_call_sites("AddForm", "FormList") == []
+
+    def test_save(self, tmp_path: Path) -> None:
+        """
+        Tests that a saved index is loaded with the same symbols.
+        """
+
+        # given
+        pex_file_path: Path = Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex"
+        index = SymbolIndex()
+        index.add_file(PexFile.from_path(pex_file_path), "a.pex")
+
+        # when
+        index.save(tmp_path / "symbols.idx")
+        loaded: SymbolIndex = SymbolIndex.load(tmp_path / "symbols.idx")
+
+        # then
+        assert loaded.paths == ["a.pex"]
+        assert loaded.get_object("_wetquestscript") == index.get_object(
+            "_wetquestscript"
+        )
+        assert loaded.get_call_sites("AddForm", "FormList") == index.get_call_sites(
+            "AddForm", "FormList"
+        )
@@ -0,0 +1,146 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+from sse_pex_interface.pex_file import PexFile
+from sse_pex_interface.symbol_index import ObjectSymbol
+from sse_pex_interface.symbol_indexer import IndexUpdate, SymbolIndexer
+
+
+class TestSymbolIndexer:
+    """
+    Tests `sse_pex_interface.symbol_indexer.SymbolIndexer`.
+    """
+
+    def test_update(self, tmp_path: Path) -> None:
+        """
+        Tests that only added and changed files are parsed and that the entries of
+        deleted files are retracted.
+        """
+
+        # given
+        test_data_path: Path = Path.cwd() / "tests" / "test_data"
+        script_path: Path = tmp_path / "a.pex"
+        other_path: Path = tmp_path / "b.pex"
+        shutil.copy(test_data_path / "_wetquestscript.pex", script_path)
+        shutil.copy(test_data_path / "_wetquestscript.pex", other_path)
+        indexer = SymbolIndexer()
+        key: str = str(script_path.resolve())
+        other_key: str = str(other_path.resolve())
+
+        # when
+        first: IndexUpdate = indexer.update(tmp_path.glob("*.pex"))
+        unchanged: IndexUpdate = indexer.update(tmp_path.glob("*.pex"))
+
+        # then
+        assert sorted(first.added) == [key, other_key]
+        assert unchanged == IndexUpdate([], [], [], {})
+
+        # when
+        # Touched only
+        os.utime(script_path, ns=(0, 0))
+        touched: IndexUpdate = indexer.update(tmp_path.glob("*.pex"))
+
+        # then
+        assert touched == IndexUpdate([], [], [], {})
+        state = indexer.get_state(key)
+        assert state is not None and state.mtime == 0
+
+        # when
+        # Recompiled
+        pex_file: PexFile = PexFile.from_path(script_path)
+        pex_file.header.compilation_time += 1
+        script_path.write_bytes(pex_file.to_bytes())
+        other_path.unlink()
+        changed: IndexUpdate = indexer.update(tmp_path.glob("*.pex"))
+
+        # then
+        assert changed == IndexUpdate([], [key], [other_key], {})
+        state = indexer.get_state(key)
+        assert state is not None
+        assert state.compilation_time == pex_file.header.compilation_time
+        object: Optional[ObjectSymbol] = indexer.index.get_object("_wetquestscript")
+        assert object is not None and object.path == key
+        assert indexer.index.paths == [key]
+
+    def test_modified_without_recompilation(self, tmp_path: Path) -> None:
+        """
+        Tests that a file that was modified without changing its compilation time and
+        size is only detected with content hashing.
+        """
+
+        # given
+        script_path: Path = tmp_path / "a.pex"
+        shutil.copy(
+            Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex", script_path
+        )
+        indexer = SymbolIndexer()
+        header_only = SymbolIndexer(use_content_hash=False)
+        indexer.update([script_path])
+        header_only.update([script_path])
+
+        pex_file: PexFile = PexFile.from_path(script_path)
+        pex_file.objects[0].data.parent_class_name = pex_file.string_table.index(
+            "faction"
+        )
+        script_path.write_bytes(pex_file.to_bytes())
+
+        # when
+        update: IndexUpdate = indexer.update([script_path])
+        header_only_update: IndexUpdate = header_only.update([script_path])
+
+        # then
+        assert update.changed == [str(script_path.resolve())]
+        assert indexer.index.get_parent("_wetquestscript") == "faction"
+        assert header_only_update.changed == []
+        assert header_only.index.get_parent("_wetquestscript") == "Quest"
+
+    def test_errors(self, tmp_path: Path) -> None:
+        """
+        Tests that the entries of a file are retracted if it cannot be parsed anymore.
+        """
+
+        # given
+        script_path: Path = tmp_path / "a.pex"
+        shutil.copy(
+            Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex", script_path
+        )
+        indexer = SymbolIndexer()
+        indexer.update([script_path])
+
+        # when
+        script_path.write_bytes(script_path.read_bytes()[:1000])
+        update: IndexUpdate = indexer.update([script_path])
+
+        # then
+        assert list(update.errors) == [str(script_path.resolve())]
+        assert indexer.index.get_object("_wetquestscript") is None
+        assert indexer.get_state(str(script_path.resolve())) is None
+
+    def test_save(self, tmp_path: Path) -> None:
+        """
+        Tests that a saved indexer does not parse unchanged files again.
+        """
+
+        # given
+        script_path: Path = tmp_path / "a.pex"
+        shutil.copy(
+            Path.cwd() / "tests" / "test_data" / "_wetquestscript.pex", script_path
+        )
+        indexer: SymbolIndexer = SymbolIndexer.load(tmp_path / "symbols.idx")
+        indexer.update([script_path])
+
+        # when
+        indexer.save(tmp_path / "symbols.idx")
+        loaded: SymbolIndexer = SymbolIndexer.load(tmp_path / "symbols.idx")
+
+        # then
+        assert loaded.update([script_path]) == IndexUpdate([], [], [], {})
+        assert loaded.index.get_call_sites("AddForm") == indexer.index.get_call_sites(
+            "AddForm"
+        )